@@ -6,35 +6,55 @@ non-blocking: relies on repeated draw calls from the host.
 import time
 import random
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import safe_addlines, theme_attr
+
+BUBBLE_PERIOD = 23
+_BUBBLE_TILE = b'o' + b' ' * (BUBBLE_PERIOD - 1)
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.seed = random.randint(0, 1000000)
+        # Frames only change when the animation tick or size does; they are
+        # composed in one reusable h*w byte buffer.
+        self._scratch = bytearray()
+        self.rows = []
+        self.rows_key = None
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
         t = int(time.time() * 2) + (self.seed % 10)
-        # draw water background with simple gradient dots
+        if self.rows_key != (t, w, h):
+            self.rows = self._compose(t, w, h) if w > 0 and h > 0 else []
+            self.rows_key = (t, w, h)
+        safe_addlines(stdscr, y, x, self.rows, attr)
+
+    def _compose(self, t, w, h):
+        """Render bubbles and fish for tick t into the scratch buffer."""
+        if len(self._scratch) != w * h:
+            self._scratch = bytearray(w * h)
+        buf = self._scratch
+        # Bubbles sit where (col + row + t) % 23 == 0, so every row is a
+        # window into one repeating tile shifted by (row + t).
+        band = _BUBBLE_TILE * (w // BUBBLE_PERIOD + 2)
         for row in range(h):
-            line = ''
-            for col in range(w):
-                # occasional bubble
-                if (col + row + t) % 23 == 0:
-                    ch = 'o'
-                else:
-                    ch = ' '
-                line += ch
-            safe_addstr(stdscr, y + row, x, line[:w], attr)
-
-        # draw a few fish moving horizontally
+            s = (row + t) % BUBBLE_PERIOD
+            buf[row * w:(row + 1) * w] = band[s:s + w]
+
+        # a few fish moving horizontally, clipped at the right edge
         for i in range(3):
-            ry = y + (i * 2) + 1
-            cx = (t * (i + 1) * 3) % max(1, w)
-            fish = '<><' if (i + t) % 2 == 0 else '><>'
-            safe_addstr(stdscr, ry, x + (cx % max(1, w)), fish[:max(0, w - cx)], attr)
+            ry = (i * 2) + 1
+            if ry >= h:
+                break
+            cx = (t * (i + 1) * 3) % w
+            fish = b'<><' if (i + t) % 2 == 0 else b'><>'
+            n = min(len(fish), w - cx)
+            start = ry * w + cx
+            buf[start:start + n] = fish[:n]
+
+        text = buf.decode('latin-1')
+        return [text[row * w:(row + 1) * w] for row in range(h)]
 
     def handle_key(self, key):
         # 'r' reseed
@@ -1,42 +1,54 @@
 """Contacts plugin (example)."""
 import os
-import json
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import ThrottledJsonWriter, read_json, safe_addstr, theme_attr
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._path = os.path.expanduser('~/.config/retrotui/contacts.json')
         self.contacts = []
         self.selected = 0
+        self._lines = None  # formatted rows; reset whenever contacts change
+        self._writer = ThrottledJsonWriter(self._data_path(), lambda: self.contacts)
         self._load()
 
     def _data_path(self):
-        return os.path.expanduser('~/.config/retrotui/contacts.json')
+        return self._path
 
     def _load(self):
         path = self._data_path()
         if os.path.exists(path):
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    self.contacts = json.load(f)
+                self.contacts = read_json(path)
             except Exception:
                 self.contacts = []
+        self._lines = None
 
     def _save(self):
-        path = self._data_path()
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.contacts, f)
+        """Schedule a write; the writer coalesces bursts of edits."""
+        self._lines = None
+        self._writer.mark_dirty()
+        self._writer.flush()
+
+    def close(self):
+        """Write pending edits when the window closes."""
+        self._writer.flush(force=True)
+
+    def _rows(self):
+        if self._lines is None:
+            self._lines = [
+                f"{c.get('name','')} {c.get('phone','')} {c.get('email','')}" for c in self.contacts
+            ]
+        return self._lines
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
-        for i, c in enumerate(self.contacts[:h]):
-            line = f"{c.get('name','')} {c.get('phone','')} {c.get('email','')}"
-            a = attr
-            if i == self.selected:
-                a = theme_attr('menu_selected')
+        sel_attr = theme_attr('menu_selected')
+        self._writer.flush()
+        for i, line in enumerate(self._rows()[:h]):
+            a = sel_attr if i == self.selected else attr
             safe_addstr(stdscr, y + i, x, line[:w], a)
 
     def handle_key(self, key):
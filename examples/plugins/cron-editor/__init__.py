@@ -5,35 +5,41 @@ appending a sample line. On systems without `crontab`, it falls back to a
 local config file under ~/.config/retrotui/cron.txt for demo purposes.
 """
 import os
-import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import safe_addstr, theme_attr, which_cached
+
+_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix='retrotui-cron')
+CRONTAB_TIMEOUT = 2.0
+
+
+def _read_crontab():
+    try:
+        out = subprocess.check_output(['crontab', '-l'], stderr=subprocess.DEVNULL, timeout=CRONTAB_TIMEOUT)
+        return out.decode('utf-8', 'ignore').splitlines()
+    except Exception:
+        # no crontab, empty, or crontab failed
+        return []
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.lines = []
+        self._pending = None
+        self._base_len = 0
         self._load()
 
     def _data_path(self):
         return os.path.expanduser('~/.config/retrotui/cron.txt')
 
     def _load(self):
-        # prefer crontab -l
-        if shutil.which('crontab'):
-            try:
-                out = subprocess.check_output(['crontab', '-l'], stderr=subprocess.DEVNULL)
-                self.lines = out.decode('utf-8', 'ignore').splitlines()
-                return
-            except subprocess.CalledProcessError:
-                # no crontab or empty
-                self.lines = []
-                return
-            except Exception:
-                self.lines = []
-                return
+        # prefer crontab -l (read on a worker thread; see _poll)
+        if which_cached('crontab'):
+            self._base_len = len(self.lines)
+            self._pending = _EXEC.submit(_read_crontab)
+            return
 
         # fallback file
         p = self._data_path()
@@ -44,11 +50,19 @@ class Plugin(RetroApp):
         except Exception:
             self.lines = []
 
+    def _poll(self):
+        """Apply a finished `crontab -l` read, keeping lines appended meanwhile."""
+        if self._pending is None or not self._pending.done():
+            return
+        loaded = self._pending.result()
+        self._pending = None
+        self.lines = loaded + self.lines[self._base_len:]
+
     def _save(self):
-        if shutil.which('crontab'):
+        if which_cached('crontab'):
             try:
                 data = '\n'.join(self.lines) + '\n'
-                subprocess.run(['crontab', '-'], input=data.encode('utf-8'), check=True)
+                subprocess.run(['crontab', '-'], input=data.encode('utf-8'), check=True, timeout=CRONTAB_TIMEOUT)
                 return
             except Exception:
                 pass
@@ -62,14 +76,19 @@ class Plugin(RetroApp):
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
+        self._poll()
         header = 'Crontab (press a to append sample, s to save)'
         safe_addstr(stdscr, y, x, header[:w], attr)
         for i, line in enumerate(self.lines[: max(0, h-1) ]):
             safe_addstr(stdscr, y + 1 + i, x, line[:w], attr)
 
     def handle_key(self, key):
+        self._poll()
         if key == ord('a'):
             # append a harmless sample job (runs every day at midnight)
             self.lines.append('0 0 * * * /usr/bin/true')
         elif key == ord('s'):
+            if self._pending is not None:
+                # Do not overwrite the crontab before it has been read.
+                return
             self._save()
@@ -1,7 +1,9 @@
 """DB Browser plugin (example).
 
 Opens a SQLite file (default: ./example.db) and lists tables; shows first
-few rows of selected table. Uses stdlib `sqlite3`.
+few rows of selected table. Uses stdlib `sqlite3`. The connection is kept
+open for the lifetime of the window and table previews are cached until
+the next 'r' refresh.
 """
 import os
 import sqlite3
@@ -16,42 +18,62 @@ class Plugin(RetroApp):
         self.tables = []
         self.selected = 0
         self.rows = []
+        self._con = None
+        self._rows_cache = {}  # table name -> rendered preview lines
         self._load()
 
+    def _connection(self):
+        """Return the shared connection, opening it on first use."""
+        if self._con is None:
+            self._con = sqlite3.connect(self.path)
+            # Connection-local tuning only; the browsed file is not modified.
+            self._con.execute('PRAGMA cache_size=-8192')
+            self._con.execute('PRAGMA temp_store=MEMORY')
+        return self._con
+
+    def close(self):
+        """Release the SQLite connection when the window closes."""
+        if self._con is not None:
+            try:
+                self._con.close()
+            except Exception:
+                pass
+            self._con = None
+
     def _load(self):
+        self._rows_cache.clear()
         if not os.path.exists(self.path):
+            self.close()
             self.tables = []
             return
         try:
-            con = sqlite3.connect(self.path)
-            cur = con.cursor()
-            cur.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            cur = self._connection().execute("SELECT name FROM sqlite_master WHERE type='table'")
             self.tables = [r[0] for r in cur.fetchall()]
-            con.close()
         except Exception:
             self.tables = []
 
     def _load_rows(self, table):
+        cached = self._rows_cache.get(table)
+        if cached is not None:
+            self.rows = cached
+            return
         try:
-            con = sqlite3.connect(self.path)
-            cur = con.cursor()
-            cur.execute(f'SELECT * FROM "{table}" LIMIT 10')
+            cur = self._connection().execute(f'SELECT * FROM "{table}" LIMIT 10')
             cols = [d[0] for d in cur.description] if cur.description else []
             rows = cur.fetchall()
-            con.close()
             self.rows = [', '.join(map(str, cols))] + [', '.join(map(str, r)) for r in rows]
+            self._rows_cache[table] = self.rows
         except Exception:
             self.rows = ['(error reading table)']
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
+        sel_attr = theme_attr('menu_selected')
         mid = max(10, w // 3)
         # Left: tables
         safe_addstr(stdscr, y, x, f'DB: {self.path}'[:mid], attr)
         for i, t in enumerate(self.tables[:h-1]):
-            a = attr
-            if i == self.selected:
-                a = theme_attr('menu_selected')
+            a = sel_attr if i == self.selected else attr
             safe_addstr(stdscr, y + 1 + i, x, t[:mid], a)
 
         # Right: rows
@@ -1,60 +1,104 @@
-"""Disk Usage plugin (example, ncdu-style)."""
+"""Disk Usage plugin (example, ncdu-style).
+
+Scans run in a background thread so large trees never block drawing; the
+last completed listing is shown while a new scan is in progress.
+"""
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from retrotui.plugins.base import RetroApp
 from retrotui.utils import safe_addstr, theme_attr
 
+# Directory sizes are stat-bound; a small pool overlaps the syscalls.
+SCAN_WORKERS = 8
+_UNITS = 'BKMGTP'
+
 
 def _human(n):
-    for u in ('B','K','M','G','T'):
-        if abs(n) < 1024.0:
-            return f"{n:3.1f}{u}"
-        n /= 1024.0
-    return f"{n:.1f}P"
+    # Unit index straight from the bit length: each unit is 2**10 wider.
+    k = min(max(0, (int(n).bit_length() - 1) // 10), len(_UNITS) - 1)
+    return f"{n / (1 << (10 * k)):3.1f}{_UNITS[k]}"
+
+
+def _dir_size(path):
+    """Sum sizes of the files directly inside path (non-recursive)."""
+    size = 0
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                try:
+                    if e.is_file(follow_symlinks=False):
+                        size += e.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return size
+
+
+def _scan_entries(path):
+    """Return [(name, size, human_size), ...] for path, largest first."""
+    files = []
+    dirs = []
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                try:
+                    if e.is_file(follow_symlinks=False):
+                        files.append((e.name, e.stat(follow_symlinks=False).st_size))
+                    elif e.is_dir(follow_symlinks=False):
+                        dirs.append(e)
+                    else:
+                        files.append((e.name, 0))
+                except OSError:
+                    files.append((e.name, 0))
+    except OSError:
+        return []
+    items = files
+    if dirs:
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(dirs))) as pool:
+            sizes = pool.map(_dir_size, [e.path for e in dirs])
+            items.extend(zip([e.name for e in dirs], sizes))
+    items.sort(key=lambda x: x[1], reverse=True)
+    # Format sizes once per scan instead of on every frame.
+    return [(name, size, _human(size)) for name, size in items]
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, path='.', **kwargs):
         super().__init__(*args, **kwargs)
         self.path = path
-        self.entries = []  # list of (name, size)
+        self.entries = []  # list of (name, size, human_size)
+        self.lines = []  # formatted rows for self.entries
+        self.scanning = False
+        self.scan_thread = None
+        self._scan_gen = 0
         self._scan()
 
     def _scan(self):
-        try:
-            items = []
-            with os.scandir(self.path) as it:
-                for e in it:
-                    try:
-                        if e.is_file(follow_symlinks=False):
-                            size = e.stat(follow_symlinks=False).st_size
-                        elif e.is_dir(follow_symlinks=False):
-                            # approximate: sum file sizes in directory (non-recursive depth-limited)
-                            size = 0
-                            for root, dirs, files in os.walk(e.path):
-                                for f in files:
-                                    try:
-                                        p = os.path.join(root, f)
-                                        size += os.path.getsize(p)
-                                    except Exception:
-                                        pass
-                                # limit deep recursion to avoid long runs
-                                break
-                        else:
-                            size = 0
-                    except Exception:
-                        size = 0
-                    items.append((e.name, size))
-            items.sort(key=lambda x: x[1], reverse=True)
-            self.entries = items
-        except Exception:
-            self.entries = []
+        """Start a background scan of self.path."""
+        self._scan_gen += 1
+        self.scanning = True
+        self.scan_thread = threading.Thread(
+            target=self._scan_worker, args=(self.path, self._scan_gen), daemon=True
+        )
+        self.scan_thread.start()
+
+    def _scan_worker(self, path, gen):
+        entries = _scan_entries(path)
+        # Drop results from a scan superseded by a newer refresh/open.
+        if gen == self._scan_gen:
+            self.lines = [f"{human:>8}  {name}" for name, _, human in entries]
+            self.entries = entries
+            self.scanning = False
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
         header = f"Path: {self.path}"
+        if self.scanning:
+            header += ' (scanning...)'
         safe_addstr(stdscr, y, x, header[:w], attr)
-        for i, (name, size) in enumerate(self.entries[: max(0, h-1) ]):
-            line = f"{_human(size):>8}  {name}"
+        for i, line in enumerate(self.lines[: max(0, h-1) ]):
             safe_addstr(stdscr, y + 1 + i, x, line[:w], attr)
 
     def handle_key(self, key):
@@ -64,7 +108,7 @@ class Plugin(RetroApp):
         elif key == ord('o'):
             # open first directory entry as a simple demo
             if self.entries:
-                name, _ = self.entries[0]
+                name = self.entries[0][0]
                 p = os.path.join(self.path, name)
                 if os.path.isdir(p):
                     self.path = p
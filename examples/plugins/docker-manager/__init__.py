@@ -1,45 +1,86 @@
 """Docker Manager plugin (example).
 
 Uses the `docker` CLI if available to list containers and toggle start/stop.
-All subprocess calls are wrapped to avoid crashing the host.
+All subprocess calls are wrapped to avoid crashing the host and run on a
+worker thread; the last known container list is drawn until they finish.
 """
-import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import safe_addstr, theme_attr, which_cached
+
+_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix='retrotui-docker')
+LIST_TIMEOUT = 2.0
+# `docker stop` waits up to 10s for the container before killing it.
+TOGGLE_TIMEOUT = 30.0
+
+
+def _list_containers():
+    out = subprocess.check_output(
+        ['docker', 'ps', '-a', '--format', '{{.ID}}\t{{.Names}}\t{{.Status}}'],
+        stderr=subprocess.DEVNULL,
+        timeout=LIST_TIMEOUT,
+    )
+    lines = out.decode('utf-8', 'ignore').splitlines()
+    return [tuple(l.split('\t', 2)) for l in lines]
+
+
+def _toggle_and_list(cid, status):
+    try:
+        if status.lower().startswith('up'):
+            subprocess.check_call(['docker', 'stop', cid], timeout=TOGGLE_TIMEOUT)
+        else:
+            subprocess.check_call(['docker', 'start', cid], timeout=TOGGLE_TIMEOUT)
+    except Exception:
+        pass
+    return _list_containers()
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.containers = []  # list of (id, name, status)
+        self.lines = []  # formatted rows, rebuilt when containers change
         self.selected = 0
+        self._pending = None
         self._load()
 
-    def _load(self):
-        if not shutil.which('docker'):
-            self.containers = []
+    def _submit(self, fn, *args):
+        self._pending = _EXEC.submit(fn, *args)
+
+    def _poll(self):
+        """Apply the result of a finished background refresh, if any."""
+        if self._pending is None or not self._pending.done():
             return
         try:
-            out = subprocess.check_output(['docker', 'ps', '-a', '--format', '{{.ID}}\t{{.Names}}\t{{.Status}}'], stderr=subprocess.DEVNULL)
-            lines = out.decode('utf-8', 'ignore').splitlines()
-            self.containers = [tuple(l.split('\t', 2)) for l in lines]
+            self.containers = self._pending.result()
         except Exception:
             self.containers = []
+        self._pending = None
+        self.lines = [f"{cid[:12]} {status:20} {name}" for cid, name, status in self.containers]
+        self.selected = min(self.selected, max(0, len(self.containers) - 1))
+
+    def _load(self):
+        if not which_cached('docker'):
+            self.containers = []
+            self.lines = []
+            return
+        self._submit(_list_containers)
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
+        sel_attr = theme_attr('menu_selected')
+        self._poll()
         if not self.containers:
-            safe_addstr(stdscr, y, x, 'docker CLI not found or no containers'[:w], attr)
+            msg = 'loading containers...' if self._pending else 'docker CLI not found or no containers'
+            safe_addstr(stdscr, y, x, msg[:w], attr)
             return
-        for i, (cid, name, status) in enumerate(self.containers[:h]):
-            a = attr
-            if i == self.selected:
-                a = theme_attr('menu_selected')
-            line = f"{cid[:12]} {status:20} {name}"
+        for i, line in enumerate(self.lines[:h]):
+            a = sel_attr if i == self.selected else attr
             safe_addstr(stdscr, y + i, x, line[:w], a)
 
     def handle_key(self, key):
+        self._poll()
         if key == ord('j'):
             self.selected = min(self.selected + 1, len(self.containers) - 1)
         elif key == ord('k'):
@@ -48,15 +89,7 @@ class Plugin(RetroApp):
             self._load()
         elif key == ord('t'):
             # toggle start/stop
-            if not self.containers:
+            if not self.containers or self._pending is not None:
                 return
             cid, name, status = self.containers[self.selected]
-            try:
-                if status.lower().startswith('up'):
-                    subprocess.check_call(['docker', 'stop', cid])
-                else:
-                    subprocess.check_call(['docker', 'start', cid])
-            except Exception:
-                pass
-            finally:
-                self._load()
+            self._submit(_toggle_and_list, cid, status)
@@ -1,8 +1,13 @@
-"""Fortune Cookie plugin (example)."""
+"""Fortune Cookie plugin (example).
+
+System fortune files are indexed once (byte offsets of non-blank lines),
+so picking a fortune is a single pread. The index is cached under
+~/.cache/retrotui and rebuilt when any fortune file changes.
+"""
 import os
 import random
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import read_json, safe_addstr, theme_attr, write_json_atomic
 
 
 DEFAULT_FORTUNES = [
@@ -12,28 +17,88 @@ DEFAULT_FORTUNES = [
     "Happiness begins with facing life with a smile and a wink.",
 ]
 
+FORTUNE_DIRS = ('/usr/share/games/fortunes', '/usr/share/fortune')
+
+
+def _cache_path():
+    return os.path.expanduser('~/.cache/retrotui/fortunes.json')
+
+
+def _fortune_files():
+    """Return [[path, mtime_ns, size], ...] for files in FORTUNE_DIRS."""
+    files = []
+    for d in FORTUNE_DIRS:
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_file():
+                        st = e.stat()
+                        files.append([e.path, st.st_mtime_ns, st.st_size])
+        except OSError:
+            continue
+    return files
+
+
+def _line_spans(path):
+    """Return [[offset, length], ...] for each non-blank line of path."""
+    spans = []
+    offset = 0
+    with open(path, 'rb') as fh:
+        for raw in fh:
+            if raw.strip():
+                spans.append([offset, len(raw)])
+            offset += len(raw)
+    return spans
+
+
+def _build_index():
+    """Return [[path, spans], ...], reusing the on-disk cache when current."""
+    files = _fortune_files()
+    if not files:
+        return []
+    cache = _cache_path()
+    try:
+        cached = read_json(cache)
+        if cached.get('files') == files:
+            return cached['index']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    index = []
+    for path, _, _ in files:
+        try:
+            spans = _line_spans(path)
+        except OSError:
+            continue
+        if spans:
+            index.append([path, spans])
+    try:
+        write_json_atomic(cache, {'files': files, 'index': index})
+    except OSError:
+        pass
+    return index
+
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._index = _build_index()
         self.fortune = self._pick()
 
     def _pick(self):
-        # try system fortune files briefly
-        paths = ['/usr/share/games/fortunes', '/usr/share/fortune']
-        for p in paths:
-            if os.path.isdir(p):
+        if self._index:
+            path, spans = random.choice(self._index)
+            offset, length = random.choice(spans)
+            try:
+                fd = os.open(path, os.O_RDONLY)
                 try:
-                    # pick a random file inside
-                    files = [os.path.join(p, f) for f in os.listdir(p) if os.path.isfile(os.path.join(p,f))]
-                    if files:
-                        f = random.choice(files)
-                        with open(f, 'r', encoding='utf-8', errors='ignore') as fh:
-                            lines = [l.strip() for l in fh if l.strip()]
-                        if lines:
-                            return random.choice(lines)
-                except Exception:
-                    pass
+                    raw = os.pread(fd, length, offset)
+                finally:
+                    os.close(fd)
+                line = raw.decode('utf-8', 'ignore').strip()
+                if line:
+                    return line
+            except (OSError, AttributeError):
+                pass
         return random.choice(DEFAULT_FORTUNES)
 
     def draw_content(self, stdscr, x, y, w, h):
@@ -4,11 +4,23 @@ Controls:
 - 's' start/stop simulation
 - 'n' step once
 - 'c' clear
+
+Uses numpy (if installed) to compute generations on a toroidal uint8 grid;
+falls back to a flat row-major bytearray (one byte per cell) otherwise.
 """
 import time
 import random
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import safe_addlines, theme_attr
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+_NEIGHBORS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+# Maps raw cell bytes (0 dead, 1 alive) decoded as latin-1 to display glyphs.
+_GLYPHS = str.maketrans('\x00\x01', ' █')
 
 
 class Plugin(RetroApp):
@@ -16,31 +28,51 @@ class Plugin(RetroApp):
         super().__init__(*args, **kwargs)
         self.running = False
         self.last_tick = time.time()
-        self.grid = {}
+        self.grid = self._new_grid(0, 0)
+        self.grid_size = (0, 0)
+        # Rendered rows, rebuilt only after the grid or body size changes.
+        self.rows = None
+        self.rows_size = (0, 0)
+
+    @staticmethod
+    def _new_grid(w, h):
+        if np is not None:
+            return np.zeros((h, w), dtype=np.uint8)
+        return bytearray(w * h)
 
     def _ensure_grid(self, w, h):
-        for yy in range(h):
-            for xx in range(w):
-                self.grid.setdefault((xx, yy), False)
+        if self.grid_size == (w, h):
+            return
+        # Resize keeping the overlapping top-left region.
+        old, (old_w, old_h) = self.grid, self.grid_size
+        self.grid = self._new_grid(w, h)
+        self.grid_size = (w, h)
+        keep_w, keep_h = min(w, old_w), min(h, old_h)
+        if np is not None:
+            self.grid[:keep_h, :keep_w] = old[:keep_h, :keep_w]
+            return
+        for yy in range(keep_h):
+            self.grid[yy * w:yy * w + keep_w] = old[yy * old_w:yy * old_w + keep_w]
 
     def _step(self, w, h):
-        new = {}
+        self.rows = None
+        if np is not None:
+            g = self.grid
+            # Neighbor counts via 8 toroidal shifts (max 8, fits in uint8).
+            n = sum(np.roll(g, (dy, dx), axis=(0, 1)) for dy, dx in _NEIGHBORS)
+            self.grid = ((n == 3) | ((g == 1) & (n == 2))).astype(np.uint8)
+            return
+        g = self.grid
+        new = bytearray(w * h)
         for yy in range(h):
+            up, row, down = ((yy - 1) % h) * w, yy * w, ((yy + 1) % h) * w
             for xx in range(w):
-                alive = self.grid.get((xx, yy), False)
-                neighbors = 0
-                for dy in (-1, 0, 1):
-                    for dx in (-1, 0, 1):
-                        if dx == 0 and dy == 0:
-                            continue
-                        if self.grid.get(((xx + dx) % w, (yy + dy) % h), False):
-                            neighbors += 1
-                if alive and neighbors in (2, 3):
-                    new[(xx, yy)] = True
-                elif not alive and neighbors == 3:
-                    new[(xx, yy)] = True
-                else:
-                    new[(xx, yy)] = False
+                left, right = (xx - 1) % w, (xx + 1) % w
+                n = (g[up + left] + g[up + xx] + g[up + right]
+                     + g[row + left] + g[row + right]
+                     + g[down + left] + g[down + xx] + g[down + right])
+                if n == 3 or (n == 2 and g[row + xx]):
+                    new[row + xx] = 1
         self.grid = new
 
     def draw_content(self, stdscr, x, y, w, h):
@@ -51,12 +83,14 @@ class Plugin(RetroApp):
             self._step(w, h)
             self.last_tick = now
 
-        for yy in range(h):
-            line = ''
-            for xx in range(w):
-                ch = '█' if self.grid.get((xx, yy), False) else ' '
-                line += ch
-            safe_addstr(stdscr, y + yy, x, line[:w], attr)
+        if self.rows is None or self.rows_size != (w, h):
+            if np is not None:
+                raw_rows = [row.tobytes() for row in self.grid]
+            else:
+                raw_rows = [self.grid[yy * w:(yy + 1) * w] for yy in range(h)]
+            self.rows = [raw.decode('latin-1').translate(_GLYPHS) for raw in raw_rows]
+            self.rows_size = (w, h)
+        safe_addlines(stdscr, y, x, self.rows, attr)
 
     def handle_key(self, key):
         if key == ord('s'):
@@ -68,11 +102,16 @@ class Plugin(RetroApp):
             self._ensure_grid(w, h)
             self._step(w, h)
         elif key == ord('c'):
-            self.grid = {}
+            self.grid = self._new_grid(0, 0)
+            self.grid_size = (0, 0)
+            self.rows = None
         elif key == ord('r'):
             # randomize
             w, h = max(10, self.w - 2), max(6, self.h - 2)
-            self.grid = {}
-            for yy in range(h):
-                for xx in range(w):
-                    self.grid[(xx, yy)] = (random.random() < 0.2)
+            self.rows = None
+            self.grid_size = (w, h)
+            if np is not None:
+                self.grid = (np.random.random((h, w)) < 0.2).astype(np.uint8)
+            else:
+                rand = random.random
+                self.grid = bytearray(rand() < 0.2 for _ in range(w * h))
@@ -1,12 +1,28 @@
 """Git Status plugin (example).
 
 Shows current branch and recent commits for a repository. Uses `git` if
-available and falls back to a message otherwise.
+available and falls back to a message otherwise. `git` runs on a worker
+thread; the previous output stays on screen until it finishes.
 """
-import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import safe_addstr, theme_attr, which_cached
+
+_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix='retrotui-git')
+GIT_TIMEOUT = 2.0
+
+
+def _read_info(repo):
+    try:
+        # git rev-parse --abbrev-ref HEAD
+        branch = subprocess.check_output(['git', '-C', repo, 'rev-parse', '--abbrev-ref', 'HEAD'], stderr=subprocess.DEVNULL, timeout=GIT_TIMEOUT)
+        branch = branch.decode('utf-8', 'ignore').strip()
+        commits = subprocess.check_output(['git', '-C', repo, 'log', '--oneline', '-n', '10'], stderr=subprocess.DEVNULL, timeout=GIT_TIMEOUT)
+        commits = commits.decode('utf-8', 'ignore').splitlines()
+        return [f'Branch: {branch}'] + commits
+    except Exception:
+        return ['Not a git repository or git command failed']
 
 
 class Plugin(RetroApp):
@@ -14,24 +30,26 @@ class Plugin(RetroApp):
         super().__init__(*args, **kwargs)
         self.repo = repo_path
         self.info = []
+        self._pending = None
         self._load()
 
     def _load(self):
-        if not shutil.which('git'):
+        if not which_cached('git'):
             self.info = ['git not available on PATH']
             return
-        try:
-            # git rev-parse --abbrev-ref HEAD
-            branch = subprocess.check_output(['git', '-C', self.repo, 'rev-parse', '--abbrev-ref', 'HEAD'], stderr=subprocess.DEVNULL)
-            branch = branch.decode('utf-8', 'ignore').strip()
-            commits = subprocess.check_output(['git', '-C', self.repo, 'log', '--oneline', '-n', '10'], stderr=subprocess.DEVNULL)
-            commits = commits.decode('utf-8', 'ignore').splitlines()
-            self.info = [f'Branch: {branch}'] + commits
-        except Exception:
-            self.info = ['Not a git repository or git command failed']
+        if not self.info:
+            self.info = ['Loading...']
+        self._pending = _EXEC.submit(_read_info, self.repo)
+
+    def _poll(self):
+        """Apply the result of a finished background refresh, if any."""
+        if self._pending is not None and self._pending.done():
+            self.info = self._pending.result()
+            self._pending = None
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
+        self._poll()
         for i, line in enumerate(self.info[:h]):
             safe_addstr(stdscr, y + i, x, line[:w], attr)
 
@@ -19,34 +19,60 @@ SAMPLE = {
 }
 
 
-def _render(obj, prefix=''):
+def _render(obj):
+    """Flatten obj into indented display lines (iterative, depth-first)."""
+    if not isinstance(obj, (dict, list)):
+        return [f"{obj}"]
     lines = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if isinstance(v, (dict, list)):
-                lines.append(f"{prefix}{k}:")
-                lines.extend(_render(v, prefix + '  '))
-            else:
-                lines.append(f"{prefix}{k}: {v}")
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            lines.append(f"{prefix}- [{i}]")
-            lines.extend(_render(v, prefix + '  '))
-    else:
-        lines.append(f"{prefix}{obj}")
+    append = lines.append
+    # Frames are (is_dict, item iterator, indent); indent strings are built
+    # once per container instead of once per key.
+    stack = [(isinstance(obj, dict), _items(obj), '')]
+    while stack:
+        is_dict, items, prefix = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            continue
+        k, v = item
+        nested = isinstance(v, (dict, list))
+        if is_dict:
+            if not nested:
+                append(f"{prefix}{k}: {v}")
+                continue
+            append(f"{prefix}{k}:")
+        else:
+            append(f"{prefix}- [{k}]")
+            if not nested:
+                append(f"{prefix}  {v}")
+                continue
+        stack.append((isinstance(v, dict), _items(v), prefix + '  '))
     return lines
 
 
+def _items(obj):
+    return iter(obj.items()) if isinstance(obj, dict) else enumerate(obj)
+
+
 class Plugin(RetroApp):
     def __init__(self, *args, path=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.path = path
         self.lines = []
+        self._loaded_key = None
         self._load()
 
     def _load(self):
+        # Skip re-parsing when the file is unchanged since the last load.
+        try:
+            st = os.stat(self.path) if self.path else None
+            key = (self.path, st.st_mtime_ns, st.st_size) if st else None
+        except OSError:
+            key = None
+        if key is not None and key == self._loaded_key:
+            return
         data = None
-        if self.path and os.path.exists(self.path):
+        if key is not None:
             try:
                 with open(self.path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -54,7 +80,9 @@ class Plugin(RetroApp):
                 data = None
         if data is None:
             data = SAMPLE
+            key = None
         self.lines = _render(data)
+        self._loaded_key = key
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
@@ -1,11 +1,21 @@
 """Matrix Rain plugin (example).
 
 Simple column-based falling characters effect. Non-blocking and safe.
+Uses numpy (if installed) to update all columns of a row at once.
 """
 import time
 import random
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import safe_addlines, theme_attr
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+# Minimum seconds between simulated frames; faster host redraws reuse rows.
+FRAME_INTERVAL = 0.08
 
 
 class Plugin(RetroApp):
@@ -13,16 +23,30 @@ class Plugin(RetroApp):
         super().__init__(*args, **kwargs)
         self.cols = []
         self.last_w = 0
+        self.rows = None
+        self.rows_size = (0, 0)
+        self.last_frame = 0.0
+
+    @staticmethod
+    def _new_cols(w):
+        if np is not None:
+            return np.zeros(max(1, w), dtype=np.int32)
+        return [0] * max(1, w)
 
     def _ensure(self, w, h):
         if w != self.last_w:
-            self.cols = [0] * max(1, w)
+            self.cols = self._new_cols(w)
             self.last_w = w
 
-    def draw_content(self, stdscr, x, y, w, h):
-        attr = theme_attr('window_body')
-        self._ensure(w, h)
+    def _next_frame(self, w, h):
+        """Advance the drops one tick and return the rendered rows."""
         t = time.time()
+        # Glyph per column only depends on the frame time; build it once.
+        tick = int(t * 100)
+        if np is not None:
+            return self._next_frame_np(w, h, tick)
+        glyphs = ''.join([chr(33 + (tick + col) % 94) for col in range(w)])
+        rows = []
         for row in range(h):
             line = [' '] * w
             for col in range(w):
@@ -30,16 +54,43 @@ class Plugin(RetroApp):
                 if random.random() < 0.02:
                     self.cols[col] = 1
                 if self.cols[col] > 0:
-                    ch = chr(33 + (int(t * 100) + col) % 94)
-                    line[col] = ch
+                    line[col] = glyphs[col]
                     # advance with some probability
                     if random.random() < 0.25:
                         self.cols[col] += 1
                     # fade out
                     if self.cols[col] > h + 5:
                         self.cols[col] = 0
-            safe_addstr(stdscr, y + row, x, ''.join(line)[:w], attr)
+            rows.append(''.join(line))
+        return rows
+
+    def _next_frame_np(self, w, h, tick):
+        # Same per-row rules as the pure-Python loop, applied to every column
+        # of a row at once with random draws batched for the whole frame.
+        glyphs = (33 + (tick + np.arange(w)) % 94).astype(np.uint8)
+        blank = np.full(w, 32, dtype=np.uint8)
+        draws = np.random.random((h, 2, w))
+        cols = self.cols[:w]
+        rows = []
+        for row in range(h):
+            cols[draws[row, 0] < 0.02] = 1
+            active = cols > 0
+            rows.append(np.where(active, glyphs, blank).tobytes().decode('ascii'))
+            cols[active & (draws[row, 1] < 0.25)] += 1
+            cols[cols > h + 5] = 0
+        return rows
+
+    def draw_content(self, stdscr, x, y, w, h):
+        attr = theme_attr('window_body')
+        now = time.monotonic()
+        if self.rows is None or self.rows_size != (w, h) or now - self.last_frame >= FRAME_INTERVAL:
+            self._ensure(w, h)
+            self.rows = self._next_frame(w, h)
+            self.rows_size = (w, h)
+            self.last_frame = now
+        safe_addlines(stdscr, y, x, self.rows, attr)
 
     def handle_key(self, key):
         if key == ord('c'):
-            self.cols = [0] * max(1, self.last_w)
+            self.cols = self._new_cols(self.last_w)
+            self.rows = None
@@ -4,34 +4,57 @@ import os
 from retrotui.plugins.base import RetroApp
 from retrotui.utils import safe_addstr, theme_attr
 
+_NET_DEV = '/proc/net/dev'
+_READ_SIZE = 65536
 
-def _parse_proc_net_dev():
+
+def _parse_net_dev(raw):
+    """Parse /proc/net/dev bytes into {iface: (rx_bytes, tx_bytes)}."""
     data = {}
-    try:
-        with open('/proc/net/dev', 'r', encoding='utf-8') as f:
-            lines = f.readlines()[2:]
-        for line in lines:
-            if ':' not in line:
-                continue
-            iface, rest = line.split(':', 1)
-            parts = rest.split()
-            rx = int(parts[0])
-            tx = int(parts[8])
-            data[iface.strip()] = (rx, tx)
-    except Exception:
-        pass
+    for line in raw.split(b'\n')[2:]:
+        iface, sep, rest = line.partition(b':')
+        if not sep:
+            continue
+        parts = rest.split()
+        try:
+            data[iface.strip()] = (int(parts[0]), int(parts[8]))
+        except (IndexError, ValueError):
+            continue
     return data
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.last = _parse_proc_net_dev()
+        # Keep the procfs file open and re-read it from offset 0 each sample
+        # (one pread instead of open/read/close per frame).
+        try:
+            self._fd = os.open(_NET_DEV, os.O_RDONLY)
+        except (OSError, AttributeError):
+            self._fd = None
+        self.last = self._sample()
         self.last_ts = time.time()
 
+    def _sample(self):
+        if self._fd is None:
+            return {}
+        try:
+            return _parse_net_dev(os.pread(self._fd, _READ_SIZE, 0))
+        except (OSError, AttributeError):
+            return {}
+
+    def close(self):
+        """Release the /proc/net/dev descriptor when the window closes."""
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
-        cur = _parse_proc_net_dev()
+        cur = self._sample()
         now = time.time()
         dt = max(1e-6, now - self.last_ts)
         lines = []
@@ -42,7 +65,8 @@ class Plugin(RetroApp):
             lines.append((iface, rx_rate, tx_rate))
 
         for i, (iface, rxr, txr) in enumerate(lines[:h]):
-            line = f"{iface:10} RX: {int(rxr):8d} B/s TX: {int(txr):8d} B/s"
+            name = iface.decode('utf-8', 'replace')
+            line = f"{name:10} RX: {int(rxr):8d} B/s TX: {int(txr):8d} B/s"
             safe_addstr(stdscr, y + i, x, line[:w], attr)
 
         # store
@@ -51,5 +75,5 @@ class Plugin(RetroApp):
 
     def handle_key(self, key):
         if key == ord('r'):
-            self.last = _parse_proc_net_dev()
+            self.last = self._sample()
             self.last_ts = time.time()
@@ -2,20 +2,23 @@
 import time
 import os
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import ThrottledJsonWriter, read_json, safe_addstr, theme_attr
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._path = os.path.expanduser('~/.config/retrotui/pomodoro.json')
         self.state = 'idle'  # idle, running, break
         self.start_ts = None
         self.duration = 25 * 60
         self.completed = 0
+        self._writer = ThrottledJsonWriter(self._data_path(), lambda: {'completed': self.completed})
         self._load()
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
+        self._writer.flush()
         safe_addstr(stdscr, y, x, f"Pomodoro: {self.state}", attr)
         if self.start_ts:
             rem = max(0, int(self.duration - (time.time() - self.start_ts)))
@@ -35,28 +38,25 @@ class Plugin(RetroApp):
             self.start_ts = time.time() if self.state == 'running' else None
 
     def _data_path(self):
-        return os.path.expanduser('~/.config/retrotui/pomodoro.json')
+        return self._path
 
     def _load(self):
         path = self._data_path()
         try:
             if os.path.exists(path):
-                import json
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.completed = int(data.get('completed', 0))
+                data = read_json(path)
+                self.completed = int(data.get('completed', 0))
         except Exception:
             self.completed = 0
 
     def _save(self):
-        path = self._data_path()
-        try:
-            import json
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump({'completed': self.completed}, f)
-        except Exception:
-            pass
+        """Schedule a write; the writer coalesces bursts of edits."""
+        self._writer.mark_dirty()
+        self._writer.flush()
+
+    def close(self):
+        """Write pending state when the window closes."""
+        self._writer.flush(force=True)
 
     def _check_complete(self):
         if self.state == 'running' and self.start_ts:
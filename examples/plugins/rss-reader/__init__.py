@@ -1,6 +1,59 @@
-"""RSS Reader plugin (example)."""
+"""RSS Reader plugin (example).
+
+Feeds are parsed with lxml (libxml2) when it is installed and with the
+stdlib ElementTree otherwise.
+"""
+import io
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree.ElementTree import iterparse
+try:
+    from lxml import etree as lxml_etree
+except Exception:
+    lxml_etree = None
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import http_get, safe_addlines, safe_addstr, theme_attr
+
+_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix='retrotui-rss')
+FEED_URL = 'https://xkcd.com/atom.xml'
+_DOWN_KEYS = frozenset((ord('j'), 258))  # j / KEY_DOWN
+_UP_KEYS = frozenset((ord('k'), 259))  # k / KEY_UP
+_ITEM_TAGS = frozenset(('entry', 'item'))  # Atom <entry>, RSS <item>
+_TITLE_XPATH = (
+    '//*[local-name()="entry" or local-name()="item"]'
+    '/*[local-name()="title"][1]'
+)
+
+
+def _local(tag):
+    """Strip an XML namespace: '{ns}title' -> 'title'."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _parse_titles(data):
+    """Return [{'title': ...}, ...] for each entry/item of an Atom or RSS feed.
+
+    With lxml a single XPath query runs in C. The stdlib fallback streams the
+    document and clears every entry once its title is read, so the full tree
+    is never held in memory.
+    """
+    if lxml_etree is not None:
+        parser = lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+        root = lxml_etree.fromstring(data, parser)
+        return [{'title': t.text or ''} for t in root.xpath(_TITLE_XPATH)]
+    items = []
+    for _, elem in iterparse(io.BytesIO(data), events=('end',)):
+        if _local(elem.tag) not in _ITEM_TAGS:
+            continue
+        for child in elem:
+            if _local(child.tag) == 'title':
+                items.append({'title': child.text or ''})
+                break
+        elem.clear()
+    return items
+
+
+def _fetch_titles(url):
+    return _parse_titles(http_get(url, timeout=5))
 
 
 class Plugin(RetroApp):
@@ -11,40 +64,48 @@ class Plugin(RetroApp):
             {'title': 'Welcome to RSS Reader', 'summary': 'This is a demo item.'},
         ]
         self.selected = 0
+        self._last_idx = len(self.items) - 1
+        # Clipped title rows for the last (w, h); reset when items change.
+        self._rows = None
+        self._rows_key = None
+        self._pending = None
+
+    def _poll(self):
+        """Apply the result of a finished background fetch, if any."""
+        if self._pending is None or not self._pending.done():
+            return
+        try:
+            items = self._pending.result()
+        except Exception:
+            # ignore network or parse errors
+            items = []
+        self._pending = None
+        if items:
+            self.items = items
+            self._last_idx = len(items) - 1
+            self._rows = None
+            self.selected = 0
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
-        for i, it in enumerate(self.items[:h]):
-            a = attr if i != self.selected else theme_attr('menu_selected')
-            safe_addstr(stdscr, y + i, x, it.get('title','')[:w], a)
+        sel_attr = theme_attr('menu_selected')
+        self._poll()
+        if self._rows is None or self._rows_key != (w, h):
+            self._rows = [it.get('title','')[:w] for it in self.items[:h]]
+            self._rows_key = (w, h)
+        rows = self._rows
+        safe_addlines(stdscr, y, x, rows, attr)
+        if self.selected < len(rows):
+            safe_addstr(stdscr, y + self.selected, x, rows[self.selected], sel_attr)
 
     def handle_key(self, key):
-        if key == ord('j'):
-            self.selected = min(self.selected + 1, len(self.items) - 1)
-        elif key == ord('k'):
-            self.selected = max(self.selected - 1, 0)
+        if key in _DOWN_KEYS:
+            if self.selected < self._last_idx:
+                self.selected += 1
+        elif key in _UP_KEYS:
+            if self.selected > 0:
+                self.selected -= 1
         elif key == ord('r'):
-            # try to fetch a sample feed (best-effort)
-            try:
-                import urllib.request, xml.etree.ElementTree as ET
-                with urllib.request.urlopen('https://xkcd.com/atom.xml', timeout=5) as resp:
-                    data = resp.read()
-                root = ET.fromstring(data)
-                # Atom feed: entries -> entry/title
-                items = []
-                for entry in root.findall('.//{http://www.w3.org/2005/Atom}entry'):
-                    title = entry.find('{http://www.w3.org/2005/Atom}title')
-                    if title is not None:
-                        items.append({'title': title.text or ''})
-                # Fallback for RSS <item>
-                if not items:
-                    for item in root.findall('.//item'):
-                        t = item.find('title')
-                        if t is not None:
-                            items.append({'title': t.text or ''})
-                if items:
-                    self.items = items
-                    self.selected = 0
-            except Exception:
-                # ignore network or parse errors
-                pass
+            # fetch a sample feed in the background (best-effort)
+            if self._pending is None:
+                self._pending = _EXEC.submit(_fetch_titles, FEED_URL)
@@ -3,10 +3,51 @@
 This plugin is conservative: it will only call `systemctl` if present and
 wraps invocations in try/except to avoid crashing the host app.
 """
-import shutil
+import json
+import re
 import subprocess
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import safe_addlines, safe_addstr, theme_attr, which_cached
+
+_DOWN_KEYS = frozenset((ord('j'), 258))  # j / KEY_DOWN
+_UP_KEYS = frozenset((ord('k'), 259))  # k / KEY_UP
+
+# UNIT LOAD ACTIVE SUB, optionally after the '●' systemctl puts in front of
+# failed/not-found units.
+_UNIT_RE = re.compile(rb'^[ \t]*(?:\xe2\x97\x8f[ \t]+)?(\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)', re.M)
+
+
+def _parse_units(out):
+    """Parse `systemctl list-units --no-legend` bytes into (name, load, active, sub)."""
+    return [
+        tuple(field.decode('utf-8', 'ignore') for field in m.groups())
+        for m in _UNIT_RE.finditer(out)
+    ]
+
+
+_LIST_CMD = ['systemctl', 'list-units', '--type=service', '--all', '--no-legend']
+# None until the first refresh tells us whether systemctl can emit JSON.
+_json_supported = None
+
+
+def _parse_units_json(out):
+    """Parse `systemctl list-units --output=json` into (name, load, active, sub)."""
+    return [(u['unit'], u['load'], u['active'], u['sub']) for u in json.loads(out)]
+
+
+def _list_units():
+    """Return the service units, preferring systemctl's JSON output."""
+    global _json_supported
+    if _json_supported is not False:
+        try:
+            out = subprocess.check_output(_LIST_CMD + ['--output=json'], stderr=subprocess.DEVNULL)
+            units = _parse_units_json(out)
+            _json_supported = True
+            return units
+        except (subprocess.CalledProcessError, ValueError, KeyError, TypeError):
+            # Older systemd: no JSON tables, fall back to the text listing.
+            _json_supported = False
+    return _parse_units(subprocess.check_output(_LIST_CMD, stderr=subprocess.DEVNULL))
 
 
 class Plugin(RetroApp):
@@ -14,46 +55,45 @@ class Plugin(RetroApp):
         super().__init__(*args, **kwargs)
         self.services = []  # list of (name, load, active, sub)
         self.selected = 0
+        self._last_idx = -1
+        # Formatted rows for the current width; reset on every refresh.
+        self._rendered = None
+        self._rendered_w = None
         self._load()
 
     def _load(self):
-        if not shutil.which('systemctl'):
-            self.services = []
-            return
-        try:
-            out = subprocess.check_output(['systemctl', 'list-units', '--type=service', '--all', '--no-legend'], stderr=subprocess.DEVNULL)
-            lines = out.decode('utf-8', 'ignore').splitlines()
-            services = []
-            for L in lines:
-                parts = L.split(None, 4)
-                if len(parts) >= 4:
-                    name = parts[0]
-                    load = parts[1]
-                    active = parts[2]
-                    sub = parts[3]
-                    services.append((name, load, active, sub))
-            self.services = services
-        except Exception:
+        if not which_cached('systemctl'):
             self.services = []
+        else:
+            try:
+                self.services = _list_units()
+            except Exception:
+                self.services = []
+        self._last_idx = len(self.services) - 1
+        self.selected = max(0, min(self.selected, self._last_idx))
+        self._rendered = None
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
+        sel_attr = theme_attr('menu_selected')
         if not self.services:
             safe_addstr(stdscr, y, x, "systemctl not available or no services detected"[:w], attr)
             return
-        for i, s in enumerate(self.services[:h]):
-            name, load, active, sub = s
-            a = attr
-            if i == self.selected:
-                a = theme_attr('menu_selected')
-            line = f"{name:40} {active:8} {sub:10}"
-            safe_addstr(stdscr, y + i, x, line[:w], a)
+        if self._rendered is None or self._rendered_w != w:
+            self._rendered = [f"{name:40} {active:8} {sub:10}"[:w] for name, load, active, sub in self.services]
+            self._rendered_w = w
+        rows = self._rendered[:h]
+        safe_addlines(stdscr, y, x, rows, attr)
+        if self.selected < len(rows):
+            safe_addstr(stdscr, y + self.selected, x, rows[self.selected], sel_attr)
 
     def handle_key(self, key):
-        if key == ord('j'):
-            self.selected = min(self.selected + 1, len(self.services) - 1)
-        elif key == ord('k'):
-            self.selected = max(0, self.selected - 1)
+        if key in _DOWN_KEYS:
+            if self.selected < self._last_idx:
+                self.selected += 1
+        elif key in _UP_KEYS:
+            if self.selected > 0:
+                self.selected -= 1
         elif key == ord('r'):
             self._load()
         elif key == ord('s'):
@@ -61,7 +101,7 @@ class Plugin(RetroApp):
             if not self.services:
                 return
             name, load, active, sub = self.services[self.selected]
-            if not shutil.which('systemctl'):
+            if not which_cached('systemctl'):
                 return
             try:
                 if active == 'active':
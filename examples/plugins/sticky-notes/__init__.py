@@ -1,47 +1,54 @@
 """Sticky Notes plugin (example)."""
 import os
-import json
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import ThrottledJsonWriter, read_json, safe_addlines, theme_attr
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._path = os.path.expanduser('~/.config/retrotui/sticky-notes.json')
         self.lines = ['']
+        # Clipped rows for the last (w, h); reset whenever lines change.
+        self._rows = None
+        self._rows_key = None
+        self._writer = ThrottledJsonWriter(self._data_path(), lambda: {'lines': self.lines})
         self._load()
 
     def _data_path(self):
-        return os.path.expanduser('~/.config/retrotui/sticky-notes.json')
+        return self._path
 
     def _load(self):
         path = self._data_path()
         if os.path.exists(path):
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'lines' in data and isinstance(data['lines'], list):
-                        self.lines = data['lines']
-                    else:
-                        # backward compatibility with 'note' string
-                        note = data.get('note', '')
-                        self.lines = note.split('\n') if note else ['']
+                data = read_json(path)
+                if 'lines' in data and isinstance(data['lines'], list):
+                    self.lines = data['lines']
+                else:
+                    # backward compatibility with 'note' string
+                    note = data.get('note', '')
+                    self.lines = note.split('\n') if note else ['']
             except Exception:
                 self.lines = ['']
 
     def _save(self):
-        path = self._data_path()
-        try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump({'lines': self.lines}, f)
-        except Exception:
-            pass
+        """Schedule a write; the writer coalesces bursts of edits."""
+        self._rows = None
+        self._writer.mark_dirty()
+        self._writer.flush()
+
+    def close(self):
+        """Write pending edits when the window closes."""
+        self._writer.flush(force=True)
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
-        for i, line in enumerate(self.lines[:h]):
-            safe_addstr(stdscr, y + i, x, line[:w], attr)
+        self._writer.flush()
+        if self._rows is None or self._rows_key != (w, h):
+            self._rows = [line[:w] for line in self.lines[:h]]
+            self._rows_key = (w, h)
+        safe_addlines(stdscr, y, x, self._rows, attr)
 
     def handle_key(self, key):
         # Controls: 'a' add line, 'd' delete last line, 'e' edit-last (append marker)
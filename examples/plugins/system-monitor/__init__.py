@@ -1,64 +1,122 @@
-"""System Monitor plugin (example)."""
+"""System Monitor plugin (example).
+
+Stats are sampled at most once per SAMPLE_INTERVAL and the formatted lines
+reused for every redraw in between.
+"""
 import os
 import shutil
 import time
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import safe_addlines, theme_attr
+
+SAMPLE_INTERVAL = 1.0
+_MEMINFO = '/proc/meminfo'
+_UPTIME = '/proc/uptime'
+# MemTotal/MemFree/MemAvailable are the first three lines of /proc/meminfo.
+_MEMINFO_READ = 1024
+
+
+def _meminfo_field(raw, key):
+    """Return the kB value of `key` (e.g. b'MemTotal:') in raw, or None."""
+    p = raw.find(key)
+    if p < 0:
+        return None
+    end = raw.find(b'\n', p)
+    fields = raw[p + len(key):end if end >= 0 else None].split()
+    return int(fields[0]) if fields else None
+
+
+def _open_proc(path):
+    try:
+        return os.open(path, os.O_RDONLY)
+    except (OSError, AttributeError):
+        return None
+
+
+def _parse_meminfo(raw):
+    """Return (total, used, free) in bytes from the head of /proc/meminfo."""
+    total = _meminfo_field(raw, b'MemTotal:') or 0
+    free = _meminfo_field(raw, b'MemAvailable:')
+    if free is None:
+        free = _meminfo_field(raw, b'MemFree:') or 0
+    return total * 1024, (total - free) * 1024, free * 1024
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.last_ts = time.time()
+        self.lines = []
+        self._sample_ts = None
+        # Keep the procfs files open and re-read them from offset 0 (one
+        # pread per sample instead of open/read/close).
+        self._fd_meminfo = _open_proc(_MEMINFO)
+        self._fd_uptime = _open_proc(_UPTIME)
 
     def _read_mem(self):
+        if self._fd_meminfo is None:
+            return None
         try:
-            data = {}
-            with open('/proc/meminfo', 'r', encoding='utf-8') as f:
-                for line in f:
-                    k, v = line.split(':', 1)
-                    data[k.strip()] = int(v.strip().split()[0])
-            total = data.get('MemTotal', 0)
-            free = data.get('MemAvailable', data.get('MemFree', 0))
-            used = total - free
-            return total * 1024, used * 1024, free * 1024
+            return _parse_meminfo(os.pread(self._fd_meminfo, _MEMINFO_READ, 0))
         except Exception:
             return None
 
     def _read_uptime(self):
+        if self._fd_uptime is None:
+            return None
         try:
-            with open('/proc/uptime', 'r', encoding='utf-8') as f:
-                u = float(f.read().split()[0])
+            u = float(os.pread(self._fd_uptime, 64, 0).split()[0])
             return int(u)
         except Exception:
             return None
 
-    def draw_content(self, stdscr, x, y, w, h):
-        attr = theme_attr('window_body')
+    def close(self):
+        """Release the procfs descriptors when the window closes."""
+        for name in ('_fd_meminfo', '_fd_uptime'):
+            fd = getattr(self, name)
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+                setattr(self, name, None)
+
+    def _sample(self):
+        """Return the formatted stat lines."""
+        lines = []
         # Load average
         try:
             load = os.getloadavg()
-            safe_addstr(stdscr, y, x, f"Load avg: {load[0]:.2f} {load[1]:.2f} {load[2]:.2f}"[:w], attr)
+            lines.append(f"Load avg: {load[0]:.2f} {load[1]:.2f} {load[2]:.2f}")
         except Exception:
-            safe_addstr(stdscr, y, x, "Load avg: N/A"[:w], attr)
+            lines.append("Load avg: N/A")
 
         mem = self._read_mem()
         if mem:
             total, used, free = mem
-            safe_addstr(stdscr, y + 1, x, f"Memory: {used//1024//1024}MB / {total//1024//1024}MB"[:w], attr)
+            lines.append(f"Memory: {used//1024//1024}MB / {total//1024//1024}MB")
         else:
-            safe_addstr(stdscr, y + 1, x, "Memory: N/A"[:w], attr)
+            lines.append("Memory: N/A")
 
         du = shutil.disk_usage('/')
-        safe_addstr(stdscr, y + 2, x, f"Disk /: {du.used//1024//1024}MB / {du.total//1024//1024}MB"[:w], attr)
+        lines.append(f"Disk /: {du.used//1024//1024}MB / {du.total//1024//1024}MB")
 
         uptime = self._read_uptime()
         if uptime is not None:
-            safe_addstr(stdscr, y + 3, x, f"Uptime: {uptime}s"[:w], attr)
+            lines.append(f"Uptime: {uptime}s")
         else:
-            safe_addstr(stdscr, y + 3, x, "Uptime: N/A"[:w], attr)
+            lines.append("Uptime: N/A")
+        return lines
+
+    def draw_content(self, stdscr, x, y, w, h):
+        attr = theme_attr('window_body')
+        now = time.monotonic()
+        if self._sample_ts is None or now - self._sample_ts >= SAMPLE_INTERVAL:
+            self.lines = self._sample()
+            self._sample_ts = now
+        safe_addlines(stdscr, y, x, [line[:w] for line in self.lines[:h]], attr)
 
     def handle_key(self, key):
-        # 'r' refresh (no-op here since draw reads live)
+        # 'r' refresh: resample on the next draw
         if key == ord('r'):
-            pass
+            self._sample_ts = None
@@ -1,80 +1,124 @@
 """Todo List plugin for RetroTUI."""
-import json
 import os
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import ThrottledJsonWriter, read_json, safe_addlines, safe_addstr, theme_attr
+
+_NEXT_PRIORITY = {'H': 'M', 'M': 'L', 'L': 'H'}
+
+
+def _normalize(todo):
+    """Return a copy of a loaded row with a str text and a known priority."""
+    priority = todo.get('priority')
+    if not (isinstance(priority, str) and priority in _NEXT_PRIORITY):
+        priority = 'M'
+    return dict(todo, text=str(todo.get('text') or ''), priority=priority)
 
 
 class Plugin(RetroApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._path = os.path.expanduser('~/.config/retrotui/todo-list.json')
         self.todos = []
         self.selected = 0
+        self._last_idx = -1
+        # Formatted rows for the current width; reset whenever todos change.
+        self._rendered = None
+        self._rendered_w = None
+        self._writer = ThrottledJsonWriter(self._data_path(), lambda: self.todos)
         self._load()
 
     def _data_path(self):
-        return os.path.expanduser('~/.config/retrotui/todo-list.json')
+        return self._path
 
     def _load(self):
         path = self._data_path()
         if os.path.exists(path):
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    self.todos = json.load(f)
+                todos = read_json(path)
             except Exception:
-                self.todos = []
+                todos = []
+            # Key handlers use rows without guards: keep only dicts and make
+            # sure text is a str and priority is one of H/M/L.
+            self.todos = [_normalize(t) for t in todos if isinstance(t, dict)] if isinstance(todos, list) else []
+        self._last_idx = len(self.todos) - 1
+        self._rendered = None
 
     def _save(self):
-        path = self._data_path()
-        try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.todos, f)
-        except Exception:
-            pass
+        """Schedule a write; the writer coalesces bursts of edits."""
+        self._rendered = None
+        self._writer.mark_dirty()
+        self._writer.flush()
+
+    def close(self):
+        """Write pending edits when the window closes."""
+        self._writer.flush(force=True)
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
-        for i, todo in enumerate(self.todos[:h]):
-            check = '[x]' if todo.get('done') else '[ ]'
-            pr = todo.get('priority', ' ')[:1]
-            line = f"{pr} {check} {todo.get('text','') }"
-            a = attr
-            if i == self.selected:
-                a = theme_attr('menu_selected')
-            safe_addstr(stdscr, y + i, x, line[:w], a)
+        sel_attr = theme_attr('menu_selected')
+        self._writer.flush()
+        if self._rendered is None or self._rendered_w != w:
+            self._rendered = [
+                f"{todo.get('priority', ' ')[:1]} {'[x]' if todo.get('done') else '[ ]'} {todo.get('text','') }"[:w]
+                for todo in self.todos
+            ]
+            self._rendered_w = w
+        rows = self._rendered[:h]
+        safe_addlines(stdscr, y, x, rows, attr)
+        if self.selected < len(rows):
+            safe_addstr(stdscr, y + self.selected, x, rows[self.selected], sel_attr)
+
+    def _select_next(self):
+        if self.selected < self._last_idx:
+            self.selected += 1
+
+    def _select_prev(self):
+        if self.selected > 0:
+            self.selected -= 1
+
+    def _toggle_done(self):
+        if self.todos:
+            self.todos[self.selected]['done'] = not self.todos[self.selected].get('done')
+            self._save()
+
+    def _add(self):
+        # simplified: no text prompt
+        self.todos.append({'text': f'New task {len(self.todos)+1}', 'done': False, 'priority': 'M'})
+        self._last_idx += 1
+        self._save()
+
+    def _delete(self):
+        if self.todos:
+            self.todos.pop(self.selected)
+            self._last_idx -= 1
+            self.selected = min(self.selected, max(self._last_idx, 0))
+            self._save()
+
+    def _cycle_priority(self):
+        if self.todos:
+            cur = self.todos[self.selected].get('priority', 'M')
+            self.todos[self.selected]['priority'] = _NEXT_PRIORITY.get(cur, 'M')
+            self._save()
+
+    def _edit(self):
+        # simplified: append a marker
+        if self.todos:
+            self.todos[self.selected]['text'] = self.todos[self.selected].get('text','') + ' (edited)'
+            self._save()
+
+    _KEY_ACTIONS = {
+        ord('j'): '_select_next',
+        258: '_select_next',  # KEY_DOWN
+        ord('k'): '_select_prev',
+        259: '_select_prev',  # KEY_UP
+        ord(' '): '_toggle_done',
+        ord('a'): '_add',
+        ord('d'): '_delete',
+        ord('p'): '_cycle_priority',
+        ord('e'): '_edit',
+    }
 
     def handle_key(self, key):
-        try:
-            if key == ord('j') or key == 258:  # down
-                self.selected = min(self.selected + 1, len(self.todos) - 1)
-            elif key == ord('k') or key == 259:  # up
-                self.selected = max(self.selected - 1, 0)
-            elif key == ord(' '):  # toggle done
-                if self.todos:
-                    self.todos[self.selected]['done'] = not self.todos[self.selected].get('done')
-                    self._save()
-            elif key == ord('a'):  # add (simplified)
-                self.todos.append({'text': f'New task {len(self.todos)+1}', 'done': False, 'priority': 'M'})
-                self._save()
-            elif key == ord('d'):  # delete
-                if self.todos:
-                    self.todos.pop(self.selected)
-                    self.selected = min(self.selected, max(len(self.todos)-1, 0))
-                    self._save()
-            elif key == ord('p'):  # cycle priority
-                if self.todos:
-                    cur = self.todos[self.selected].get('priority', 'M')
-                    order = ['H', 'M', 'L']
-                    try:
-                        nxt = order[(order.index(cur) + 1) % len(order)]
-                    except ValueError:
-                        nxt = 'M'
-                    self.todos[self.selected]['priority'] = nxt
-                    self._save()
-            elif key == ord('e'):  # edit: append marker (simplified)
-                if self.todos:
-                    self.todos[self.selected]['text'] = self.todos[self.selected].get('text','') + ' (edited)'
-                    self._save()
-        except Exception:
-            pass
+        handler = self._KEY_ACTIONS.get(key)
+        if handler is not None:
+            getattr(self, handler)()
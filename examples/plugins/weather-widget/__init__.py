@@ -1,12 +1,23 @@
 """Weather Widget plugin (example).
 
-Fetches a one-line weather summary from wttr.in (best-effort, non-blocking
-on draw). Press 'r' to refresh.
+Fetches a one-line weather summary from wttr.in (best-effort). The request
+runs on a worker thread so drawing never waits on the network. Press 'r'
+to refresh.
 """
-import urllib.request
 import time
+from concurrent.futures import ThreadPoolExecutor
 from retrotui.plugins.base import RetroApp
-from retrotui.utils import safe_addstr, theme_attr
+from retrotui.utils import http_get, safe_addstr, theme_attr
+
+_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix='retrotui-weather')
+REFRESH_INTERVAL_NS = 600 * 1_000_000_000
+# Minimum delay between automatic retries after a failed fetch.
+RETRY_INTERVAL_NS = 60 * 1_000_000_000
+
+
+def _fetch_summary(location):
+    url = f'https://wttr.in/{location}?format=1'
+    return http_get(url, timeout=5).decode('utf-8', 'ignore').strip()
 
 
 class Plugin(RetroApp):
@@ -14,23 +25,34 @@ class Plugin(RetroApp):
         super().__init__(*args, **kwargs)
         self.location = location
         self.summary = 'Weather: N/A'
-        self.last = 0
+        # Monotonic deadline (ns) for the next automatic fetch.
+        self._next_fetch_ns = 0
+        self._pending = None
 
     def _fetch(self):
+        """Start a background fetch unless one is already running."""
+        if self._pending is None:
+            self._next_fetch_ns = time.monotonic_ns() + RETRY_INTERVAL_NS
+            self._pending = _EXEC.submit(_fetch_summary, self.location)
+
+    def _poll(self):
+        """Apply the result of a finished background fetch, if any."""
+        if self._pending is None or not self._pending.done():
+            return
         try:
-            url = f'https://wttr.in/{self.location}?format=1'
-            with urllib.request.urlopen(url, timeout=5) as resp:
-                data = resp.read().decode('utf-8', 'ignore').strip()
-                if data:
-                    self.summary = data
-                    self.last = time.time()
+            data = self._pending.result()
         except Exception:
-            pass
+            data = ''
+        self._pending = None
+        if data:
+            self.summary = data
+            self._next_fetch_ns = time.monotonic_ns() + REFRESH_INTERVAL_NS
 
     def draw_content(self, stdscr, x, y, w, h):
         attr = theme_attr('window_body')
+        self._poll()
         # auto-refresh every 10 minutes
-        if time.time() - self.last > 600:
+        if time.monotonic_ns() >= self._next_fetch_ns:
             self._fetch()
         safe_addstr(stdscr, y + (h // 2), x + 1, self.summary[: max(0, w-2) ], attr)
 
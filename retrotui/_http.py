@@ -0,0 +1,44 @@
+"""
+HTTP fetch backend for retrotui.utils.http_get().
+
+utils imports this module on the first request, and urllib3 (optional) is
+imported then as well, so starting RetroTUI never pays for either.
+"""
+import urllib.request
+
+# None until the first request; False when urllib3 is not installed.
+_http_pool = None
+
+
+def _pool():
+    """Return the shared urllib3 PoolManager, or False without urllib3."""
+    global _http_pool
+    if _http_pool is None:
+        try:
+            import urllib3
+        except ImportError:
+            _http_pool = False
+        else:
+            _http_pool = urllib3.PoolManager(num_pools=4, retries=urllib3.Retry(total=1))
+    return _http_pool
+
+
+def http_get(url, timeout=5):
+    """GET url and return the response body as bytes.
+
+    With urllib3 installed, requests share one keep-alive PoolManager so
+    repeated fetches to a host skip the TCP/TLS handshake; otherwise this
+    falls back to urllib.request. Raises OSError on HTTP or network errors.
+    """
+    pool = _pool()
+    if not pool:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.read()
+    import urllib3
+    try:
+        resp = pool.request('GET', url, timeout=timeout)
+    except urllib3.exceptions.HTTPError as exc:
+        raise OSError(str(exc)) from exc
+    if resp.status >= 400:
+        raise OSError(f'HTTP {resp.status} for {url}')
+    return resp.data
@@ -4,8 +4,9 @@ import curses
 
 from dataclasses import replace
 from ..core.actions import ActionResult, ActionType, AppAction
+from ..core.config import hidden_icon_labels
 from ..ui.window import Window
-from ..utils import draw_box, normalize_key_code, safe_addstr, theme_attr
+from ..utils import draw_box, normalize_key_code, safe_addlines, safe_addstr, theme_attr
 from ..constants import ICONS, ICONS_ASCII
 
 
@@ -17,7 +18,7 @@ class AppManagerWindow(Window):
         self.app = app
         
         base_icons = ICONS if self.app.use_unicode else ICONS_ASCII
-        current_hidden = {x.strip().lower() for x in self.app.config.hidden_icons.split(",")} if self.app.config.hidden_icons else set()
+        current_hidden = hidden_icon_labels(self.app.config.hidden_icons)
         
         # choices grouped by category: {category: [[label, value, is_checked]]}
         self.categories = ["Apps", "Games"]
@@ -30,6 +31,9 @@ class AppManagerWindow(Window):
                 self.choices[cat] = []
             self.choices[cat].append([label, label, label.lower() not in current_hidden])
             
+        # Last valid row per column; the lists are fixed for the window's life.
+        self._last_idx = {cat: len(items) - 1 for cat, items in self.choices.items()}
+
         self.active_cat_idx = 0  # Which column is focused
         self.sel_indices = {cat: 0 for cat in self.categories}
         self.offsets = {cat: 0 for cat in self.categories}
@@ -37,151 +41,211 @@ class AppManagerWindow(Window):
         self.in_list = True
         self.selected_button = 0
         self.buttons = ['Save', 'Cancel']
+        # (label, width) per button and the row's total width with 2-cell gaps.
+        self._rendered_buttons = [(f"[ {b} ]", len(b) + 4) for b in self.buttons]
+        self._btn_total = sum(w for _, w in self._rendered_buttons) + 2 * (len(self.buttons) - 1)
         
         # Window dimensions
         self.w = max(60, w)
         self.h = max(20, h)
         self.visible_rows = self.h - 8 # Extra space for column headers
+        # Scrollbar cells per category, keyed by (offset, item count).
+        self._sb_cache = {}
+        # Hit-test ranges recorded by draw(): list columns and buttons as
+        # (x0, x1) pairs in screen coordinates.
+        self._col_bounds = []
+        self._btn_bounds = []
+        self._btn_y = None
         
     def draw(self, stdscr):
         if not self.visible:
             return
             
-        super().draw(stdscr)
+        body_attr = self.draw_frame(stdscr)
         
         attr = theme_attr('window_body')
+        sb_attr = theme_attr('scrollbar')
+        btn_attrs = (theme_attr('button'), theme_attr('button_selected'))
+
+        # Buttons
+        self._btn_y = self.y + self.h - 2
+        curr_x = self.x + (self.w - self._btn_total) // 2
+        self._btn_bounds = []
+        for _, btn_w in self._rendered_buttons:
+            self._btn_bounds.append((curr_x, curr_x + btn_w))
+            curr_x += btn_w + 2
+
+        # Selection, scroll and checkbox changes call mark_dirty(); the key
+        # only covers what can change from outside the window.
+        key = (self.w, self.h, self.active, attr, btn_attrs)
+        ops = self._cached_ops(key, lambda: self._body_ops(attr, btn_attrs))
+        bx, by, bw, bh = self.body_rect()
+        if not self._blit_ops(stdscr, by, bx, bh, bw, ops, body_attr):
+            for dy, dx, text, op_attr in ops:
+                safe_addstr(stdscr, by + dy, bx + dx, text, op_attr)
+        
+        col_w = (self.w - 6) // 2
+        self._col_bounds = []
+        for c_idx, cat in enumerate(self.categories):
+            col_x = self.x + 2 + c_idx * (col_w + 2)
+            list_y = self.y + 4
+            self._col_bounds.append((col_x, col_x + col_w))
+            # List Border
+            draw_box(stdscr, list_y - 1, col_x - 1, self.visible_rows + 2, col_w + 2, attr, double=False)
+
+            # Scrollbar: one cached list of cells, drawn with one safe_addlines() call.
+            count = len(self.choices[cat])
+            if count > self.visible_rows:
+                column = self._scrollbar_column(cat, self.offsets[cat], count)
+                safe_addlines(stdscr, list_y, col_x + col_w, column, sb_attr)
+
+    def _body_ops(self, attr, btn_attrs):
+        """Build list and button ops relative to the body origin (x + 1, y + 1)."""
         sel_attr = attr | curses.A_REVERSE
         hdr_attr = attr | curses.A_BOLD
-        
+        ops = []
+
         # Instructions
-        safe_addstr(stdscr, self.y + 1, self.x + 2, "Select apps to show on desktop/start menu", attr)
+        ops.append((0, 1, "Select apps to show on desktop/start menu", attr))
         
         col_w = (self.w - 6) // 2
+        # Pad-and-truncate to col_w in one format() call.
+        row_fmt = f'<{col_w}.{col_w}'
+        blank_row = ' ' * col_w
         for c_idx, cat in enumerate(self.categories):
-            col_x = self.x + 2 + c_idx * (col_w + 2)
-            list_y = self.y + 4
+            col_x = 1 + c_idx * (col_w + 2)
+            list_y = 3
             
             # Category Header
             header = f" {cat} "
-            safe_addstr(stdscr, list_y - 2, col_x + (col_w - len(header)) // 2, header, hdr_attr)
-            
-            # List Border
-            draw_box(stdscr, list_y - 1, col_x - 1, self.visible_rows + 2, col_w + 2, attr, double=False)
+            ops.append((list_y - 2, col_x + (col_w - len(header)) // 2, header, hdr_attr))
             
             items = self.choices[cat]
             offset = self.offsets[cat]
             sel_idx = self.sel_indices[cat]
+            is_focused = self.in_list and self.active and self.active_cat_idx == c_idx
             
             for i in range(self.visible_rows):
                 idx = offset + i
                 if idx < len(items):
                     label, _, checked = items[idx]
                     mark = '[x]' if checked else '[ ]'
-                    text = f" {mark} {label}"
-                    
-                    is_focused = (self.in_list and self.active and self.active_cat_idx == c_idx and idx == sel_idx)
-                    row_attr = sel_attr if is_focused else attr
-                    safe_addstr(stdscr, list_y + i, col_x, text.ljust(col_w)[:col_w], row_attr)
+                    row = format(f" {mark} {label}", row_fmt)
                 else:
-                    safe_addstr(stdscr, list_y + i, col_x, ' ' * col_w, attr)
-
-            # Scrollbar
-            if len(items) > self.visible_rows:
-                sb_x = col_x + col_w
-                thumb_pos = int(offset / max(1, len(items) - self.visible_rows) * (self.visible_rows - 1))
-                for i in range(self.visible_rows):
-                    ch = '█' if i == thumb_pos else '░'
-                    safe_addstr(stdscr, list_y + i, sb_x, ch, theme_attr('scrollbar'))
+                    row = blank_row
+                ops.append((list_y + i, col_x, row, sel_attr if is_focused and idx == sel_idx else attr))
 
         # Buttons
-        btn_y = self.y + self.h - 2
-        btn_x_start = self.x + (self.w - sum(len(b) + 4 for b in self.buttons) - (len(self.buttons) - 1) * 2) // 2
-        self._btn_y = btn_y
-        self._btn_x_start = btn_x_start
-        
-        curr_x = btn_x_start
-        for i, btn_text in enumerate(self.buttons):
-            btn_w = len(btn_text) + 4
-            btn_attr = theme_attr('button_selected') if (self.active and not self.in_list and self.selected_button == i) else theme_attr('button')
-            safe_addstr(stdscr, btn_y, curr_x, f"[ {btn_text} ]", btn_attr)
-            curr_x += btn_w + 2
+        for i, ((label, _), (x0, _)) in enumerate(zip(self._rendered_buttons, self._btn_bounds)):
+            is_selected = self.active and not self.in_list and self.selected_button == i
+            ops.append((self.h - 3, x0 - self.x - 1, label, btn_attrs[is_selected]))
+        return ops
+
+    def _scrollbar_column(self, cat, offset, count):
+        """Return the scrollbar cells for cat, rebuilt only when it scrolls."""
+        key = (offset, count)
+        cached = self._sb_cache.get(cat)
+        if cached is None or cached[0] != key:
+            thumb_pos = int(offset / max(1, count - self.visible_rows) * (self.visible_rows - 1))
+            column = ['░'] * self.visible_rows
+            column[thumb_pos] = '█'
+            cached = self._sb_cache[cat] = (key, column)
+        return cached[1]
 
     def handle_click(self, mx, my):
-        col_w = (self.w - 6) // 2
         list_y = self.y + 4
         
-        for c_idx, cat in enumerate(self.categories):
-            col_x = self.x + 2 + c_idx * (col_w + 2)
-            if col_x <= mx <= col_x + col_w and list_y <= my < list_y + self.visible_rows:
+        if list_y <= my < list_y + self.visible_rows:
+            for c_idx, (x0, x1) in enumerate(self._col_bounds):
+                if not x0 <= mx <= x1:
+                    continue
+                cat = self.categories[c_idx]
                 click_idx = self.offsets[cat] + (my - list_y)
                 if click_idx < len(self.choices[cat]):
                     self.in_list = True
                     self.active_cat_idx = c_idx
                     self.sel_indices[cat] = click_idx
                     self.choices[cat][click_idx][2] = not self.choices[cat][click_idx][2]
+                    self.mark_dirty()
                     return True
                     
         if my == self._btn_y:
-            curr_x = self._btn_x_start
-            for i, btn_text in enumerate(self.buttons):
-                btn_w = len(btn_text) + 4
-                if curr_x <= mx < curr_x + btn_w:
+            for i, (x0, x1) in enumerate(self._btn_bounds):
+                if x0 <= mx < x1:
                     self.in_list = False
                     self.selected_button = i
+                    self.mark_dirty()
                     return self._activate_button()
-                curr_x += btn_w + 2
                 
         return False
 
-    def handle_key(self, key):
-        key_code = normalize_key_code(key)
-        if key_code == 27: return ActionResult(ActionType.EXECUTE, AppAction.CLOSE_WINDOW)
-            
-        cat = self.categories[self.active_cat_idx]
-        items = self.choices[cat]
-        
-        if key_code in (curses.KEY_UP, curses.KEY_DOWN):
-            if not self.in_list:
-                self.in_list = True
-                return None
-            if key_code == curses.KEY_UP:
-                self.sel_indices[cat] = max(0, self.sel_indices[cat] - 1)
-                if self.sel_indices[cat] < self.offsets[cat]:
-                    self.offsets[cat] = self.sel_indices[cat]
-            else:
-                self.sel_indices[cat] = min(len(items) - 1, self.sel_indices[cat] + 1)
-                if self.sel_indices[cat] >= self.offsets[cat] + self.visible_rows:
-                    self.offsets[cat] = self.sel_indices[cat] - self.visible_rows + 1
+    def _key_close(self, key_code):
+        return ActionResult(ActionType.EXECUTE, AppAction.CLOSE_WINDOW)
+
+    def _key_vertical(self, key_code):
+        if not self.in_list:
+            self.in_list = True
             return None
-            
-        if key_code in (curses.KEY_LEFT, curses.KEY_RIGHT):
-            if self.in_list:
-                if key_code == curses.KEY_LEFT:
-                    self.active_cat_idx = max(0, self.active_cat_idx - 1)
-                else:
-                    self.active_cat_idx = min(len(self.categories) - 1, self.active_cat_idx + 1)
+        cat = self.categories[self.active_cat_idx]
+        if key_code == curses.KEY_UP:
+            self.sel_indices[cat] = max(0, self.sel_indices[cat] - 1)
+            if self.sel_indices[cat] < self.offsets[cat]:
+                self.offsets[cat] = self.sel_indices[cat]
+        else:
+            if self.sel_indices[cat] < self._last_idx[cat]:
+                self.sel_indices[cat] += 1
+            if self.sel_indices[cat] >= self.offsets[cat] + self.visible_rows:
+                self.offsets[cat] = self.sel_indices[cat] - self.visible_rows + 1
+        return None
+
+    def _key_horizontal(self, key_code):
+        if self.in_list:
+            if key_code == curses.KEY_LEFT:
+                self.active_cat_idx = max(0, self.active_cat_idx - 1)
             else:
-                if key_code == curses.KEY_LEFT:
-                    self.selected_button = max(0, self.selected_button - 1)
-                else:
-                    self.selected_button = min(len(self.buttons) - 1, self.selected_button + 1)
-            return None
-            
-        if key_code == 9: # Tab
-            self.in_list = not self.in_list
-            return None
-            
-        if key_code in (32, 10, 13, curses.KEY_ENTER):
-            if self.in_list:
-                if items:
-                    idx = self.sel_indices[cat]
-                    items[idx][2] = not items[idx][2]
-                return None
+                self.active_cat_idx = min(len(self.categories) - 1, self.active_cat_idx + 1)
+        else:
+            if key_code == curses.KEY_LEFT:
+                self.selected_button = max(0, self.selected_button - 1)
             else:
-                return self._activate_button()
-                
+                self.selected_button = min(len(self.buttons) - 1, self.selected_button + 1)
         return None
 
+    def _key_tab(self, key_code):
+        self.in_list = not self.in_list
+        return None
+
+    def _key_activate(self, key_code):
+        if not self.in_list:
+            return self._activate_button()
+        cat = self.categories[self.active_cat_idx]
+        items = self.choices[cat]
+        if items:
+            idx = self.sel_indices[cat]
+            items[idx][2] = not items[idx][2]
+        return None
+
+    _KEY_ACTIONS = {
+        27: '_key_close',  # Esc
+        curses.KEY_UP: '_key_vertical',
+        curses.KEY_DOWN: '_key_vertical',
+        curses.KEY_LEFT: '_key_horizontal',
+        curses.KEY_RIGHT: '_key_horizontal',
+        9: '_key_tab',
+        32: '_key_activate',
+        10: '_key_activate',
+        13: '_key_activate',
+        curses.KEY_ENTER: '_key_activate',
+    }
+
+    def handle_key(self, key):
+        key_code = normalize_key_code(key)
+        handler = self._KEY_ACTIONS.get(key_code)
+        if handler is None:
+            return None
+        self.mark_dirty()
+        return getattr(self, handler)(key_code)
+
     def _activate_button(self):
         if self.selected_button == 0:  # Save
             # Collect all checked labels from all categories
@@ -200,14 +264,9 @@ class AppManagerWindow(Window):
                 self.app.refresh_icons()
                 
                 # Refresh Start Menu
-                from ..ui.menu import DEFAULT_GLOBAL_ITEMS, Menu
-                hidden_labels = {x.strip().lower() for x in self.app.config.hidden_icons.split(",")} if self.app.config.hidden_icons else set()
-                filtered_menu_items = {}
-                for category, items in DEFAULT_GLOBAL_ITEMS.items():
-                    filtered_items = [item for item in items if item[0].split("  ")[0].lower() not in hidden_labels]
-                    if filtered_items:
-                        filtered_menu_items[category] = filtered_items
-                self.app.menu = Menu(filtered_menu_items)
+                from ..ui.menu import Menu, filter_global_items
+                hidden_labels = hidden_icon_labels(self.app.config.hidden_icons)
+                self.app.menu = Menu(filter_global_items(hidden_labels))
             except OSError as exc:
                 return ActionResult(ActionType.SAVE_ERROR, str(exc))
             return ActionResult(ActionType.EXECUTE, AppAction.CLOSE_WINDOW)
@@ -2,7 +2,9 @@
 
 import ast
 import curses
-import operator
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 
 from ..core.actions import ActionResult, ActionType, AppAction
 from ..core.clipboard import copy_text, paste_text
@@ -10,50 +12,67 @@ from ..ui.window import Window
 from ..utils import normalize_key_code, safe_addstr, theme_attr
 
 
-_ALLOWED_BINARY_OPS = {
-    ast.Add: operator.add,
-    ast.Sub: operator.sub,
-    ast.Mult: operator.mul,
-    ast.Div: operator.truediv,
-    ast.Mod: operator.mod,
-    ast.Pow: operator.pow,
-    ast.FloorDiv: operator.floordiv,
-}
+_ALLOWED_BINARY_OPS = frozenset({
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Mod,
+    ast.Pow,
+    ast.FloorDiv,
+})
 
-_ALLOWED_UNARY_OPS = {
-    ast.UAdd: operator.pos,
-    ast.USub: operator.neg,
-}
+_ALLOWED_UNARY_OPS = frozenset({
+    ast.UAdd,
+    ast.USub,
+})
 
+_EVAL_GLOBALS = {"__builtins__": {}}
 
-def _eval_ast_node(node):
-    """Evaluate a parsed AST node with a restricted math-only grammar."""
+# Pasted tabs and other control characters would break the input row layout.
+_CONTROL_TO_SPACE = {i: " " for i in (*range(32), 127)}
+
+
+def _check_ast_node(node):
+    """Raise ValueError unless node is restricted math-only grammar."""
     if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
-        return node.value
+        return
 
     if isinstance(node, ast.BinOp):
-        op = _ALLOWED_BINARY_OPS.get(type(node.op))
-        if op is None:
+        if type(node.op) not in _ALLOWED_BINARY_OPS:
             raise ValueError("Operator not allowed.")
-        return op(_eval_ast_node(node.left), _eval_ast_node(node.right))
+        _check_ast_node(node.left)
+        _check_ast_node(node.right)
+        return
 
     if isinstance(node, ast.UnaryOp):
-        op = _ALLOWED_UNARY_OPS.get(type(node.op))
-        if op is None:
+        if type(node.op) not in _ALLOWED_UNARY_OPS:
             raise ValueError("Unary operator not allowed.")
-        return op(_eval_ast_node(node.operand))
+        _check_ast_node(node.operand)
+        return
 
     raise ValueError("Unsupported expression.")
 
 
+@lru_cache(maxsize=256)
+def _compile_expression(expr):
+    """Parse and validate expr once, then let CPython's compiler evaluate it.
+
+    Only numeric constants and the allowed operators pass the check, so the
+    code object cannot reach names, calls or attributes.
+    """
+    tree = ast.parse(expr, mode="eval")
+    _check_ast_node(tree.body)
+    return compile(tree, "<calc>", "eval")
+
+
 def evaluate_expression(expression):
     """Safely evaluate one arithmetic expression and return display text."""
     expr = (expression or "").strip()
     if not expr:
         raise ValueError("Expression is empty.")
 
-    parsed = ast.parse(expr, mode="eval")
-    value = _eval_ast_node(parsed.body)
+    value = eval(_compile_expression(expr), _EVAL_GLOBALS)
     if isinstance(value, float):
         # Compact float formatting and normalize negative zero.
         if value == 0.0:
@@ -86,9 +105,14 @@ class CalculatorWindow(Window):
         self.expression = ""
         self.cursor_pos = 0
         self.view_left = 0
-        self.history = []
+        self.history = deque(maxlen=self.MAX_HISTORY)
+        # _history_expr_only() result, keyed on the history length and newest line.
+        self._history_exprs = None
         self.history_index = None
         self.last_result = None
+        # Button rects, rebuilt when body_rect() changes.
+        self._btn_rects = None
+        self._btn_rect_sig = None
 
     def _set_expression(self, text):
         self.expression = text
@@ -97,16 +121,21 @@ class CalculatorWindow(Window):
 
     def _append_history(self, line):
         self.history.append(line)
-        if len(self.history) > self.MAX_HISTORY:
-            self.history = self.history[-self.MAX_HISTORY :]
+        self._history_exprs = None
 
     def _history_expr_only(self):
+        history = self.history
+        newest = history[-1] if history else None
+        cached = self._history_exprs
+        if cached is not None and cached[0] == len(history) and cached[1] is newest:
+            return cached[2]
         values = []
-        for line in self.history:
+        for line in history:
             if " = " in line:
                 values.append(line.split(" = ", 1)[0])
             elif " ! " in line:
                 values.append(line.split(" ! ", 1)[0])
+        self._history_exprs = (len(history), newest, values)
         return values
 
     def _insert_text(self, text):
@@ -127,6 +156,10 @@ class CalculatorWindow(Window):
             return
         self.expression = self.expression[: self.cursor_pos] + self.expression[self.cursor_pos + 1 :]
 
+    def _input_width(self):
+        """Columns available to the expression after the "Expr> " label."""
+        return max(1, self.body_rect()[2] - len("Expr> "))
+
     def _ensure_cursor_visible(self, input_width):
         if self.cursor_pos < self.view_left:
             self.view_left = self.cursor_pos
@@ -187,6 +220,17 @@ class CalculatorWindow(Window):
         x = start_x + col_idx * (btn_width + spacing_x)
         return x, y, btn_width, btn_height
 
+    def _button_rects(self):
+        """Return _button_rect() for every button as a grid shaped like BUTTONS."""
+        sig = self.body_rect()
+        if sig != self._btn_rect_sig:
+            self._btn_rects = [
+                [self._button_rect(r, c) for c in range(len(row_keys))]
+                for r, row_keys in enumerate(self.BUTTONS)
+            ]
+            self._btn_rect_sig = sig
+        return self._btn_rects
+
     def draw(self, stdscr):
         """Draw input row, history area, buttons and status line."""
         if not self.visible:
@@ -197,50 +241,65 @@ class CalculatorWindow(Window):
         if bh <= 0:
             return
 
-        for row in range(bh):
-            safe_addstr(stdscr, by + row, bx, " " * bw, body_attr)
+        label = "Expr> "
+        input_w = max(1, bw - len(label))
+        self._ensure_cursor_visible(input_w)
+        btn_area_height = len(self.BUTTONS) * 2 + 1
+        history_rows = max(0, bh - 3 - btn_area_height)
+        # Walk the deque from the right so only the visible tail is touched.
+        visible_history = tuple(islice(reversed(self.history), history_rows))[::-1]
+        btn_attr = theme_attr("button")
+        status_attr = theme_attr("status")
+        key = (
+            bw, bh, self.expression, self.cursor_pos, self.view_left, visible_history,
+            self.always_on_top, body_attr, btn_attr, status_attr,
+        )
+        ops = self._cached_ops(
+            key, lambda: self._body_ops(bw, bh, visible_history, body_attr, btn_attr, status_attr)
+        )
+        if not self._blit_ops(stdscr, by, bx, bh, bw, ops, body_attr):
+            for dy, dx, text, attr in ops:
+                safe_addstr(stdscr, by + dy, bx + dx, text, attr)
+
+    def _body_ops(self, bw, bh, visible_history, body_attr, btn_attr, status_attr):
+        """Build body draw ops relative to the body origin."""
+        bx, by, _, _ = self.body_rect()
+        ops = []
 
         # Draw Input
         label = "Expr> "
-        input_x = bx + len(label)
+        input_x = len(label)
         input_w = max(1, bw - len(label))
-        self._ensure_cursor_visible(input_w)
-        view = self.expression[self.view_left : self.view_left + input_w]
+        view = self.expression[self.view_left : self.view_left + input_w].translate(_CONTROL_TO_SPACE)
+        view = f"{view:<{input_w}}"
 
-        safe_addstr(stdscr, by, bx, label, body_attr | curses.A_BOLD)
-        safe_addstr(stdscr, by, input_x, view.ljust(input_w), body_attr)
+        ops.append((0, 0, label, body_attr | curses.A_BOLD))
+        ops.append((0, input_x, view, body_attr))
 
-        cursor_x = input_x + (self.cursor_pos - self.view_left)
-        if input_x <= cursor_x < bx + bw:
-            char = " "
-            if 0 <= self.cursor_pos < len(self.expression):
-                char = self.expression[self.cursor_pos]
-            safe_addstr(stdscr, by, cursor_x, char, body_attr | curses.A_REVERSE)
+        # The cursor cell is read from the padded view: past the end it is a space.
+        cursor_col = self.cursor_pos - self.view_left
+        if 0 <= cursor_col < min(input_w, bw - input_x):
+            ops.append((0, input_x + cursor_col, view[cursor_col], body_attr | curses.A_REVERSE))
 
         # Draw History (above buttons)
-        btn_area_height = len(self.BUTTONS) * 2 + 1
-        history_top = by + 2
-        history_rows = max(0, bh - 3 - btn_area_height) 
-        visible_history = self.history[-history_rows:] if history_rows else []
         for i, line in enumerate(visible_history):
-            safe_addstr(stdscr, history_top + i, bx, line[:bw].ljust(bw), body_attr)
+            ops.append((2 + i, 0, line[:bw].ljust(bw), body_attr))
 
         # Draw Buttons
-        btn_attr = theme_attr("button")
-        for r, row_keys in enumerate(self.BUTTONS):
-            for c, key in enumerate(row_keys):
-                x, y, w, h = self._button_rect(r, c)
+        for row_keys, row_rects in zip(self.BUTTONS, self._button_rects()):
+            for key, (x, y, w, h) in zip(row_keys, row_rects):
                 if y < by or y >= by + bh: continue
-                
+
                 # Draw button box
-                safe_addstr(stdscr, y, x, f"[{key:^3}]", btn_attr)
+                ops.append((y - by, x - bx, f"[{key:^3}]", btn_attr))
 
         # Status Bar
         topmost_state = "ON" if self.always_on_top else "OFF"
         status = (
             f"F9=Top:{topmost_state}  Ctrl+L=Clear"
         )
-        safe_addstr(stdscr, by + bh - 1, bx, status[:bw].ljust(bw), theme_attr("status"))
+        ops.append((bh - 1, 0, status[:bw].ljust(bw), status_attr))
+        return ops
 
     def handle_click(self, mx, my, bstate=None):
         _ = bstate
@@ -249,9 +308,8 @@ class CalculatorWindow(Window):
             return None
 
         # Check buttons
-        for r, row_keys in enumerate(self.BUTTONS):
-            for c, key in enumerate(row_keys):
-                x, y, w, h = self._button_rect(r, c)
+        for row_keys, row_rects in zip(self.BUTTONS, self._button_rects()):
+            for key, (x, y, w, h) in zip(row_keys, row_rects):
                 if y == my and x <= mx < x + w:
                     self._handle_button_press(key)
                     return ActionResult(ActionType.REFRESH, None) # Consumed
@@ -278,17 +336,20 @@ class CalculatorWindow(Window):
 
     def handle_key(self, key):
         key_code = normalize_key_code(key)
+        cursor_before = self.cursor_pos
+        expr_before = self.expression
+        ln = len(expr_before)
 
         if key_code == curses.KEY_LEFT:
             if self.cursor_pos > 0:
                 self.cursor_pos -= 1
         elif key_code == curses.KEY_RIGHT:
-            if self.cursor_pos < len(self.expression):
+            if self.cursor_pos < ln:
                 self.cursor_pos += 1
         elif key_code == curses.KEY_HOME:
             self.cursor_pos = 0
         elif key_code == curses.KEY_END:
-            self.cursor_pos = len(self.expression)
+            self.cursor_pos = ln
         elif key_code in (curses.KEY_BACKSPACE, 127, 8):
             self._delete_backward()
         elif key_code == curses.KEY_DC:
@@ -307,7 +368,7 @@ class CalculatorWindow(Window):
         elif key_code == self.KEY_F9:
             self.always_on_top = not self.always_on_top
         elif key_code == 12:  # Ctrl+L
-            self.history = []
+            self.history.clear()
             self.history_index = None
         elif key_code == 27:  # Escape
             self.history_index = None
@@ -324,9 +385,8 @@ class CalculatorWindow(Window):
         elif key_code == 17:  # Ctrl+Q closes calculator window
             return ActionResult(ActionType.EXECUTE, AppAction.CLOSE_WINDOW)
 
-        bx, by, bw, _ = self.body_rect()
-        _ = by
-        input_w = max(1, bw - len("Expr> "))
-        self._ensure_cursor_visible(input_w)
+        # Keys that leave the input untouched need no scroll adjustment.
+        if self.cursor_pos != cursor_before or self.expression is not expr_before:
+            self._ensure_cursor_visible(self._input_width())
         return None
 
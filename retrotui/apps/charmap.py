@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import curses
 import unicodedata
+from array import array
+from functools import lru_cache
+from itertools import accumulate
 
 from ..ui.window import Window
 from ..ui.menu import WindowMenu
-from ..utils import safe_addstr, theme_attr, normalize_key_code
+from ..utils import safe_addlines, safe_addstr, theme_attr, normalize_key_code
 from ..core.clipboard import copy_text
 from ..core.actions import ActionResult, ActionType, AppAction
 
@@ -15,7 +18,7 @@ try:
 except Exception:
     pyperclip = None
 
-UNICODE_BLOCKS = [
+UNICODE_BLOCKS = (
     ("Basic Latin", 0x0020, 0x007F),
     ("Latin-1 Supplement", 0x00A0, 0x00FF),
     ("Latin Extended-A", 0x0100, 0x017F),
@@ -30,7 +33,36 @@ UNICODE_BLOCKS = [
     ("Geometric Shapes", 0x25A0, 0x25FF),
     ("Dingbats", 0x2700, 0x27BF),
     ("Braille Patterns", 0x2800, 0x28FF),
-]
+)
+
+_VSEP = "\u2502"
+
+# Characters of each block, built once at import.
+_BLOCK_CHARS = tuple(tuple(map(chr, range(start, end + 1))) for _, start, end in UNICODE_BLOCKS)
+_BLOCK_NAMES = tuple(name for name, _, _ in UNICODE_BLOCKS)
+# Window menu "Range" entries; the menu only reads them.
+_RANGE_MENU_ITEMS = tuple((name, f"block_{i}") for i, name in enumerate(_BLOCK_NAMES))
+
+
+def _cell_text(ch):
+    """Return ch padded to exactly one three-column grid cell."""
+    category = unicodedata.category(ch)
+    if category in ("Cc", "Cf", "Cn"):
+        return "   "
+    if category in ("Mn", "Me"):
+        # Combining marks attach to the leading space.
+        return f" {ch}  "
+    if unicodedata.east_asian_width(ch) in ("W", "F"):
+        return f" {ch}"
+    return f" {ch} "
+
+
+@lru_cache(maxsize=4096)
+def _char_name_parts(ch):
+    """Return ch's Unicode name wrapped to at most three 18-column lines."""
+    name = unicodedata.name(ch, "UNKNOWN")
+    return tuple(name[i:i + 18] for i in range(0, min(len(name), 54), 18))
+
 
 class CharacterMapWindow(Window):
     def __init__(self, x, y, w, h):
@@ -40,19 +72,21 @@ class CharacterMapWindow(Window):
         super().__init__("Character Map", x, y, win_w, win_h, content=[], resizable=True)
         
         self.block_idx = 0
-        self.chars = []
+        self.chars = ()
+        # Per block: all cells joined into one string plus each cell's start
+        # offset, so a grid row of any width is a single slice.
+        self._cell_tables = {}
+        # (cols, rows) for key navigation, keyed on window size.
+        self._grid_dims_sig = None
+        self._grid_dims_cache = None
         self._load_block()
         
         self.sel_idx = 0
         self.selected_char = self.chars[0] if self.chars else None
         
         # Menu setup
-        range_items = []
-        for i, (name, _, _) in enumerate(UNICODE_BLOCKS):
-            range_items.append((name, f"block_{i}"))
-            
         self.window_menu = WindowMenu({
-            "Range": range_items,
+            "Range": _RANGE_MENU_ITEMS,
             "Edit": [
                 ("Copy Char    C", "copy_hex"),
                 ("Copy Hex     H", "copy_hex_val"),
@@ -63,10 +97,20 @@ class CharacterMapWindow(Window):
         })
 
     def _load_block(self):
-        name, start, end = UNICODE_BLOCKS[self.block_idx]
-        self.chars = [chr(i) for i in range(start, end + 1)]
+        self.chars = _BLOCK_CHARS[self.block_idx]
+        name = _BLOCK_NAMES[self.block_idx]
         self.status_message = f"Block: {name}"
 
+    def _cell_table(self):
+        """Return (text, offsets) for the current block; offsets has len(chars)+1 entries."""
+        table = self._cell_tables.get(self.block_idx)
+        if table is None:
+            cells = [_cell_text(ch) for ch in self.chars]
+            # Packed unsigned ints keep the table small for large blocks.
+            offsets = array("I", accumulate(map(len, cells), initial=0))
+            table = self._cell_tables[self.block_idx] = ("".join(cells), offsets)
+        return table
+
     def _get_grid_dims(self, bw, bh):
         # Grid on the left, details on the right
         grid_w = bw - 22 # Reserved for details
@@ -83,69 +127,77 @@ class CharacterMapWindow(Window):
             safe_addstr(stdscr, by, bx, "Window too small", body_attr)
             return
 
+        attrs = (
+            body_attr,
+            theme_attr("menu_selected"),
+            theme_attr("window_border"),
+            theme_attr("menubar"),
+            theme_attr("status"),
+        )
+        key = (bw, bh, self.block_idx, self.sel_idx, self.selected_char, attrs)
+        ops = self._cached_ops(key, lambda: self._body_ops(bw, bh, attrs))
+        if not self._blit_ops(stdscr, by, bx, bh, bw, ops, body_attr):
+            for dy, dx, text, attr in ops:
+                safe_addstr(stdscr, by + dy, bx + dx, text, attr)
+        # Detail pane separator, one cell per row; the footer owns the last row.
+        safe_addlines(stdscr, by, bx + bw - 21, (_VSEP,) * (bh - 1), attrs[2])
+
+        if self.window_menu:
+            self.window_menu.draw_dropdown(stdscr, self.x, self.y, self.w)
+
+    def _body_ops(self, bw, bh, attrs):
+        """Build grid, detail pane and footer ops relative to the body origin."""
+        body_attr, sel_attr, _, label_attr, status_attr = attrs
+        ops = []
+
         cols, rows = self._get_grid_dims(bw, bh)
         per_page = cols * rows
         
         page = self.sel_idx // per_page
         start_idx = page * per_page
         
-        # Draw Grid
+        # Draw Grid: one op per row plus the selected cell on top.
+        text, offsets = self._cell_table()
+        count = len(self.chars)
         for r in range(rows):
-            for c in range(cols):
-                idx = start_idx + r * cols + c
-                if idx >= len(self.chars):
-                    break
-                
-                ch = self.chars[idx]
-                cx = bx + c * 3
-                cy = by + r + 1
-                
-                attr = body_attr
-                if idx == self.sel_idx:
-                    attr = theme_attr("menu_selected")
-                
-                safe_addstr(stdscr, cy, cx, f" {ch} ", attr)
+            first = start_idx + r * cols
+            if first >= count:
+                break
+            row = text[offsets[first]:offsets[min(first + cols, count)]]
+            ops.append((r + 1, 0, row, body_attr))
+        if self.sel_idx < len(self.chars):
+            sel_r, sel_c = divmod(self.sel_idx - start_idx, cols)
+            ops.append((sel_r + 1, sel_c * 3, _cell_text(self.chars[self.sel_idx]), sel_attr))
+
+        # Draw Detail Pane (Right Side); draw() adds the separator column.
+        detail_x = bw - 20
 
-        # Draw Detail Pane (Right Side)
-        detail_x = bx + bw - 20
-        # Vertical separator
-        for r in range(bh):
-            safe_addstr(stdscr, by + r, detail_x - 1, "\u2502", theme_attr("window_border"))
-            
         if self.selected_char:
             ch = self.selected_char
             cp = ord(ch)
-            try:
-                name = unicodedata.name(ch, "UNKNOWN")
-            except ValueError:
-                name = "UNKNOWN"
-            
+
             # Zoom area
-            safe_addstr(stdscr, by + 1, detail_x + 5, "\u250c\u2500\u2500\u2500\u2510", body_attr)
-            safe_addstr(stdscr, by + 2, detail_x + 5, f"\u2502 {ch} \u2502", body_attr | curses.A_BOLD)
-            safe_addstr(stdscr, by + 3, detail_x + 5, "\u2514\u2500\u2500\u2500\u2518", body_attr)
+            ops.append((1, detail_x + 5, "\u250c\u2500\u2500\u2500\u2510", body_attr))
+            ops.append((2, detail_x + 5, f"\u2502 {ch} \u2502", body_attr | curses.A_BOLD))
+            ops.append((3, detail_x + 5, "\u2514\u2500\u2500\u2500\u2518", body_attr))
             
             # Info
-            safe_addstr(stdscr, by + 5, detail_x + 1, "Name:", theme_attr("menubar"))
-            # Wrap name
-            name_parts = [name[i:i+18] for i in range(0, len(name), 18)]
-            for i, part in enumerate(name_parts[:3]):
-                safe_addstr(stdscr, by + 6 + i, detail_x + 1, part, body_attr)
+            ops.append((5, detail_x + 1, "Name:", label_attr))
+            for i, part in enumerate(_char_name_parts(ch)):
+                ops.append((6 + i, detail_x + 1, part, body_attr))
                 
-            safe_addstr(stdscr, by + 10, detail_x + 1, "Hex:", theme_attr("menubar"))
-            safe_addstr(stdscr, by + 10, detail_x + 6, f"U+{cp:04X}", body_attr)
+            ops.append((10, detail_x + 1, "Hex:", label_attr))
+            ops.append((10, detail_x + 6, f"U+{cp:04X}", body_attr))
             
-            safe_addstr(stdscr, by + 11, detail_x + 1, "Dec:", theme_attr("menubar"))
-            safe_addstr(stdscr, by + 11, detail_x + 6, str(cp), body_attr)
+            ops.append((11, detail_x + 1, "Dec:", label_attr))
+            ops.append((11, detail_x + 6, str(cp), body_attr))
             
-            safe_addstr(stdscr, by + bh - 2, detail_x + 1, "Press 'C' to Copy", theme_attr("status"))
+            ops.append((bh - 2, detail_x + 1, "Press 'C' to Copy", status_attr))
 
         # Footer
-        footer = f" {UNICODE_BLOCKS[self.block_idx][0]} | Page {page+1} "
-        safe_addstr(stdscr, by + bh - 1, bx, footer[:bw].ljust(bw), theme_attr("status"))
-
-        if self.window_menu:
-            self.window_menu.draw_dropdown(stdscr, self.x, self.y, self.w)
+        footer = f" {_BLOCK_NAMES[self.block_idx]} | Page {page+1} "
+        ops.append((bh - 1, 0, footer[:bw].ljust(bw), status_attr))
+        return ops
 
     def handle_key(self, key):
         key_code = normalize_key_code(key)
@@ -156,47 +208,83 @@ class CharacterMapWindow(Window):
                 return self.execute_action(action)
             return None
 
-        bx, by, bw, bh = self.body_rect()
-        cols, rows = self._get_grid_dims(bw, bh)
-
-        if key_code == curses.KEY_RIGHT:
-            if self.sel_idx < len(self.chars) - 1:
-                self.sel_idx += 1
-        elif key_code == curses.KEY_LEFT:
-            if self.sel_idx > 0:
-                self.sel_idx -= 1
-        elif key_code == curses.KEY_DOWN:
-            if self.sel_idx + cols < len(self.chars):
-                self.sel_idx += cols
-        elif key_code == curses.KEY_UP:
-            if self.sel_idx - cols >= 0:
-                self.sel_idx -= cols
-        elif key_code == curses.KEY_NPAGE:
-            self.sel_idx = min(len(self.chars) - 1, self.sel_idx + cols * rows)
-        elif key_code == curses.KEY_PPAGE:
-            self.sel_idx = max(0, self.sel_idx - cols * rows)
-        elif key_code in (ord('c'), ord('C')):
-            if self.selected_char:
-                copy_text(self.selected_char)
-                if pyperclip: pyperclip.copy(self.selected_char)
-        elif key_code in (ord('h'), ord('H')):
-            if self.selected_char:
-                hex_val = f"U+{ord(self.selected_char):04X}"
-                copy_text(hex_val)
-                if pyperclip: pyperclip.copy(hex_val)
-
-        self.selected_char = self.chars[self.sel_idx]
+        handler = self._KEY_ACTIONS.get(key_code)
+        if handler is None:
+            return None
+        old_idx = self.sel_idx
+        getattr(self, handler)()
+        if self.sel_idx != old_idx:
+            self.selected_char = self.chars[self.sel_idx]
         return None
 
+    def _grid_dims(self):
+        """Return _get_grid_dims() for the current body, recomputed only on resize."""
+        sig = (self.w, self.h)
+        if sig != self._grid_dims_sig:
+            _, _, bw, bh = self.body_rect()
+            self._grid_dims_cache = self._get_grid_dims(bw, bh)
+            self._grid_dims_sig = sig
+        return self._grid_dims_cache
+
+    def _key_right(self):
+        if self.sel_idx < len(self.chars) - 1:
+            self.sel_idx += 1
+
+    def _key_left(self):
+        if self.sel_idx > 0:
+            self.sel_idx -= 1
+
+    def _key_down(self):
+        cols, _ = self._grid_dims()
+        if self.sel_idx + cols < len(self.chars):
+            self.sel_idx += cols
+
+    def _key_up(self):
+        cols, _ = self._grid_dims()
+        if self.sel_idx - cols >= 0:
+            self.sel_idx -= cols
+
+    def _key_page_down(self):
+        cols, rows = self._grid_dims()
+        self.sel_idx = min(len(self.chars) - 1, self.sel_idx + cols * rows)
+
+    def _key_page_up(self):
+        cols, rows = self._grid_dims()
+        self.sel_idx = max(0, self.sel_idx - cols * rows)
+
+    def _copy_char(self):
+        if self.selected_char:
+            copy_text(self.selected_char)
+            if pyperclip: pyperclip.copy(self.selected_char)
+
+    def _copy_hex(self):
+        if self.selected_char:
+            hex_val = f"U+{ord(self.selected_char):04X}"
+            copy_text(hex_val)
+            if pyperclip: pyperclip.copy(hex_val)
+
+    _KEY_ACTIONS = {
+        curses.KEY_RIGHT: '_key_right',
+        curses.KEY_LEFT: '_key_left',
+        curses.KEY_DOWN: '_key_down',
+        curses.KEY_UP: '_key_up',
+        curses.KEY_NPAGE: '_key_page_down',
+        curses.KEY_PPAGE: '_key_page_up',
+        ord('c'): '_copy_char',
+        ord('C'): '_copy_char',
+        ord('h'): '_copy_hex',
+        ord('H'): '_copy_hex',
+    }
+
     def handle_click(self, mx, my):
         if self.window_menu:
             action = self.window_menu.handle_click(mx, my, self.x, self.y, self.w)
             if action:
                 return self.execute_action(action)
         
-        bx, by, bw, bh = self.body_rect()
-        cols, rows = self._get_grid_dims(bw, bh)
-        
+        bx, by, _, _ = self.body_rect()
+        cols, rows = self._grid_dims()
+
         # Check if click in grid
         if bx <= mx < bx + cols * 3 and by + 1 <= my < by + 1 + rows:
             grid_x = (mx - bx) // 3
@@ -227,16 +315,11 @@ class CharacterMapWindow(Window):
             return ActionResult(ActionType.REFRESH)
         
         if action == "copy_hex":
-            if self.selected_char:
-                copy_text(self.selected_char)
-                if pyperclip: pyperclip.copy(self.selected_char)
+            self._copy_char()
             return None
         
         if action == "copy_hex_val":
-            if self.selected_char:
-                val = f"U+{ord(self.selected_char):04X}"
-                copy_text(val)
-                if pyperclip: pyperclip.copy(val)
+            self._copy_hex()
             return None
             
         return None
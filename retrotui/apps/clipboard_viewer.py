@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import curses
+import time
 from typing import List
 
 from ..ui.window import Window
-from ..utils import safe_addstr, theme_attr
+from ..utils import normalize_key_code, safe_addstr, theme_attr
 from ..core.clipboard import paste_text, copy_text, clear_clipboard
 try:
     import pyperclip
@@ -14,14 +15,22 @@ except Exception:
 
 
 class ClipboardViewerWindow(Window):
+    REFRESH_INTERVAL_SECONDS = 0.25
+
     def __init__(self, x, y, w, h, history_size=10):
         super().__init__("Clipboard", x, y, max(30, w), max(10, h), content=[], resizable=False)
         self.history_size = history_size
         self.history: List[str] = []
         self.selected_index = 0
-        self._refresh_from_clipboard()
+        self._last_refresh = 0.0
+        self._refresh_from_clipboard(force=True)
 
-    def _refresh_from_clipboard(self):
+    def _refresh_from_clipboard(self, force=False):
+        """Pull the current clipboard into history, at most once per interval."""
+        now = time.monotonic()
+        if not force and (now - self._last_refresh) < self.REFRESH_INTERVAL_SECONDS:
+            return
+        self._last_refresh = now
         text = paste_text(sync_system=False)
         if text and (not self.history or self.history[0] != text):
             self.history.insert(0, text)
@@ -33,7 +42,9 @@ class ClipboardViewerWindow(Window):
         self._refresh_from_clipboard()
         body_attr = self.draw_frame(stdscr)
         bx, by, bw, bh = self.body_rect()
-        for i, item in enumerate(self.history[: bh]):
+        # Truncate and pad to the body width in one format() call.
+        row_fmt = f"<{bw}.{bw}"
+        for i, item in zip(range(bh), self.history):
             attr = body_attr
             if i == self.selected_index:
                 try:
@@ -42,7 +53,7 @@ class ClipboardViewerWindow(Window):
                     attr = body_attr | (sel_attr or 0)
                 except Exception:
                     attr = body_attr
-            safe_addstr(stdscr, by + i, bx, item[:bw].ljust(bw), attr)
+            safe_addstr(stdscr, by + i, bx, format(item, row_fmt), attr)
         if not self.history:
             safe_addstr(stdscr, by, bx, "<clipboard empty>"[:bw], body_attr)
 
@@ -63,43 +74,50 @@ class ClipboardViewerWindow(Window):
         return None
 
     def handle_key(self, key):
-        # 'c' clears clipboard
-        if getattr(key, '__int__', None) and int(key) == ord('c'):
-            clear_clipboard()
-            self.history = []
-            self.selected_index = 0
-        # 'y' yank top history to system clipboard if available
-        if getattr(key, '__int__', None) and int(key) == ord('y') and self.history:
+        handler = self._KEY_ACTIONS.get(normalize_key_code(key))
+        if handler is not None:
+            getattr(self, handler)()
+        return None
+
+    def _clear(self):
+        """'c' clears the clipboard and the history."""
+        clear_clipboard()
+        self.history = []
+        self.selected_index = 0
+
+    def _yank(self):
+        """'y' yanks the newest entry to the system clipboard if available."""
+        if self.history and pyperclip:
+            try:
+                pyperclip.copy(self.history[0])
+            except Exception:
+                pass
+
+    def _select_up(self):
+        if self.history:
+            self.selected_index = max(0, self.selected_index - 1)
+
+    def _select_down(self):
+        if self.history:
+            self.selected_index = min(len(self.history) - 1, self.selected_index + 1)
+
+    def _copy_selected(self):
+        """Enter/Return copies the selected entry."""
+        if self.history and 0 <= self.selected_index < len(self.history):
+            copy_text(self.history[self.selected_index])
             if pyperclip:
                 try:
-                    pyperclip.copy(self.history[0])
+                    pyperclip.copy(self.history[self.selected_index])
                 except Exception:
                     pass
-        # navigation: up/down and enter to copy
-        if getattr(key, '__int__', None):
-            k = int(key)
-            try:
-                import curses as _c
-
-                KEY_UP = _c.KEY_UP
-                KEY_DOWN = _c.KEY_DOWN
-            except Exception:
-                KEY_UP = -1
-                KEY_DOWN = -2
 
-            if k in (KEY_UP, ord('k')):
-                if self.history:
-                    self.selected_index = max(0, self.selected_index - 1)
-            if k in (KEY_DOWN, ord('j')):
-                if self.history:
-                    self.selected_index = min(len(self.history) - 1, self.selected_index + 1)
-            # Enter/Return to copy selected
-            if k in (10, 13):
-                if self.history and 0 <= self.selected_index < len(self.history):
-                    copy_text(self.history[self.selected_index])
-                    if pyperclip:
-                        try:
-                            pyperclip.copy(self.history[self.selected_index])
-                        except Exception:
-                            pass
-        return None
+    _KEY_ACTIONS = {
+        ord('c'): '_clear',
+        ord('y'): '_yank',
+        curses.KEY_UP: '_select_up',
+        ord('k'): '_select_up',
+        curses.KEY_DOWN: '_select_down',
+        ord('j'): '_select_down',
+        10: '_copy_selected',
+        13: '_copy_selected',
+    }
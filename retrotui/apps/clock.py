@@ -3,6 +3,7 @@
 import calendar
 import curses
 from datetime import datetime
+from functools import lru_cache
 
 from ..core.actions import ActionResult, ActionType, AppAction
 from ..ui.menu import WindowMenu
@@ -10,6 +11,13 @@ from ..ui.window import Window
 from ..utils import normalize_key_code, safe_addstr, theme_attr
 
 
+@lru_cache(maxsize=8)
+def _formatted_month(year, month, first_weekday):
+    """Return the TextCalendar lines for one month as a tuple."""
+    text_calendar = calendar.TextCalendar(firstweekday=first_weekday)
+    return tuple(text_calendar.formatmonth(year, month).splitlines())
+
+
 class ClockCalendarWindow(Window):
     """Small widget with digital clock and ASCII month calendar."""
 
@@ -64,8 +72,7 @@ class ClockCalendarWindow(Window):
     def _month_lines(self, now):
         """Return ASCII calendar lines honoring first weekday preference."""
         first_weekday = calendar.SUNDAY if self.week_starts_sunday else calendar.MONDAY
-        text_calendar = calendar.TextCalendar(firstweekday=first_weekday)
-        return text_calendar.formatmonth(now.year, now.month).splitlines()
+        return _formatted_month(now.year, now.month, first_weekday)
 
     def draw(self, stdscr):
         """Draw digital clock and month calendar."""
@@ -80,27 +87,47 @@ class ClockCalendarWindow(Window):
         if bh <= 0 or bw <= 0:
             return
 
-        for row in range(bh):
-            safe_addstr(stdscr, by + row, bx, " " * bw, body_attr)
+        # Only the time row changes every tick; the rest is rebuilt when the
+        # day, a toggle or the theme changes.
+        status_attr = theme_attr("status")
+        key = (
+            bw,
+            bh,
+            now.date(),
+            self.always_on_top,
+            self.chime_enabled,
+            self.week_starts_sunday,
+            body_attr,
+            status_attr,
+        )
+        ops = self._cached_ops(key, lambda: self._body_ops(now, bw, bh, body_attr, status_attr))
+        if not self._blit_ops(stdscr, by, bx, bh, bw, ops, body_attr):
+            for dy, dx, text, attr in ops:
+                safe_addstr(stdscr, by + dy, bx + dx, text, attr)
 
+        # After the blit, which repaints the whole body including this row.
         time_label = now.strftime("%H:%M:%S")
-        date_label = now.strftime("%A, %Y-%m-%d")
         safe_addstr(stdscr, by, bx, time_label.center(bw)[:bw], theme_attr("menubar"))
-        safe_addstr(stdscr, by + 1, bx, date_label.center(bw)[:bw], body_attr | curses.A_BOLD)
+
+        if self.window_menu:
+            self.window_menu.draw_dropdown(stdscr, self.x, self.y, self.w)
+
+    def _body_ops(self, now, bw, bh, body_attr, status_attr):
+        """Build date, calendar and status ops relative to the body origin."""
+        date_label = now.strftime("%A, %Y-%m-%d")
+        ops = [(1, 0, date_label.center(bw)[:bw], body_attr | curses.A_BOLD)]
 
         month_lines = self._month_lines(now)
         max_cal_rows = max(0, bh - 4)
         for i, line in enumerate(month_lines[:max_cal_rows]):
-            safe_addstr(stdscr, by + 2 + i, bx, line.center(bw)[:bw], body_attr)
+            ops.append((2 + i, 0, line.center(bw)[:bw], body_attr))
 
         top_state = "ON" if self.always_on_top else "OFF"
         chime_state = "ON" if self.chime_enabled else "OFF"
         week_state = "SUN" if self.week_starts_sunday else "MON"
         status = f"T top:{top_state} | B chime:{chime_state} | S week:{week_state} | Q close"
-        safe_addstr(stdscr, by + bh - 1, bx, status[:bw].ljust(bw), theme_attr("status"))
-
-        if self.window_menu:
-            self.window_menu.draw_dropdown(stdscr, self.x, self.y, self.w)
+        ops.append((bh - 1, 0, status[:bw].ljust(bw), status_attr))
+        return ops
 
     def handle_click(self, mx, my, bstate=None):
         """Handle window-menu clicks."""
@@ -1,6 +1,8 @@
 """Unified Control Panel for RetroTUI."""
 import curses
+from .. import __version__ as APP_VERSION
 from ..core.actions import AppAction, ActionResult, ActionType
+from ..theme import list_themes
 from ..ui.window import Window
 from ..utils import safe_addstr, theme_attr, normalize_key_code
 from .settings import SettingsWindow
@@ -29,8 +31,8 @@ class ControlPanelWindow(Window):
         self.show_welcome = bool(app.config.show_welcome)
         
         # For Theme selection
-        from ..theme import list_themes
         self._themes = list_themes()
+        self._theme_index = {t.key: i for i, t in enumerate(self._themes)}
         self._theme_scroll = 0
 
     def draw(self, stdscr):
@@ -39,60 +41,92 @@ class ControlPanelWindow(Window):
 
         body_attr = self.draw_frame(stdscr)
         bx, by, bw, bh = self.body_rect()
-        
+
+        attrs = (
+            body_attr,
+            theme_attr('window_inactive'),
+            theme_attr('window_border'),
+            theme_attr('status'),
+            theme_attr('button'),
+            theme_attr('button_selected'),
+        )
+        # Options only change through handle_key/handle_click, so the body is
+        # rebuilt when a preference, the category or the theme changes.
+        key = (
+            bw,
+            bh,
+            self.selected_cat,
+            self.theme_name,
+            self.show_hidden,
+            self.word_wrap_default,
+            self.sunday_first,
+            self.show_welcome,
+            attrs,
+        )
+        ops = self._cached_ops(key, lambda: self._body_ops(bw, bh, attrs))
+        if not self._blit_ops(stdscr, by, bx, bh, bw, ops, body_attr):
+            for dy, dx, text, attr in ops:
+                safe_addstr(stdscr, by + dy, bx + dx, text, attr)
+
+    def _body_ops(self, bw, bh, attrs):
+        """Build panes, options and buttons relative to the body origin."""
+        body_attr, inactive_attr, border_attr, status_attr, btn_attr, sel_attr = attrs
+        ops = []
+
         # Draw background split
         # Left pane: Categories (w=18)
         # Right pane: Options
-        pane_divider_x = bx + 18
-        
+        pane_divider_x = 18
+        left_blank = ' ' * 18
+        right_blank = ' ' * (bw - 18)
         for i in range(bh):
-            safe_addstr(stdscr, by + i, bx, ' ' * 18, theme_attr('window_inactive'))
-            safe_addstr(stdscr, by + i, pane_divider_x, ' ' * (bw - 18), body_attr)
-            safe_addstr(stdscr, by + i, pane_divider_x, '│', theme_attr('window_border'))
+            ops.append((i, 0, left_blank, inactive_attr))
+            ops.append((i, pane_divider_x, right_blank, body_attr))
+            ops.append((i, pane_divider_x, '│', border_attr))
 
         # Draw Categories
         for i, (title, desc) in enumerate(self.CATEGORIES):
-            y = by + 1 + i * 3
-            attr = theme_attr('button_selected') if self.selected_cat == i else theme_attr('window_inactive')
-            safe_addstr(stdscr, y, bx + 1, f" {title.ljust(15)} ", attr)
-            safe_addstr(stdscr, y + 1, bx + 2, desc[:14], theme_attr('status') if self.selected_cat != i else attr)
+            y = 1 + i * 3
+            attr = sel_attr if self.selected_cat == i else inactive_attr
+            ops.append((y, 1, f" {title.ljust(15)} ", attr))
+            ops.append((y + 1, 2, desc[:14], status_attr if self.selected_cat != i else attr))
 
         # Draw Right Content based on selection
         rx = pane_divider_x + 2
         rw = bw - 22
-        ry = by + 1
-        
+        ry = 1
+
         if self.selected_cat == 0: # Appearance
-            safe_addstr(stdscr, ry, rx, "Select Color Theme:", body_attr | curses.A_BOLD)
+            ops.append((ry, rx, "Select Color Theme:", body_attr | curses.A_BOLD))
             for i, theme in enumerate(self._themes):
                 ty = ry + 2 + i
                 checked = "●" if theme.key == self.theme_name else "○"
                 line = f"{checked} {theme.label}"
-                safe_addstr(stdscr, ty, rx, line.ljust(rw), body_attr)
-        
+                ops.append((ty, rx, line.ljust(rw), body_attr))
+
         elif self.selected_cat == 1: # Desktop
-            safe_addstr(stdscr, ry, rx, "Desktop Options:", body_attr | curses.A_BOLD)
+            ops.append((ry, rx, "Desktop Options:", body_attr | curses.A_BOLD))
             h_mark = "[x]" if self.show_hidden else "[ ]"
             w_mark = "[x]" if self.word_wrap_default else "[ ]"
-            safe_addstr(stdscr, ry + 2, rx, f"{h_mark} Show hidden files", body_attr)
-            safe_addstr(stdscr, ry + 4, rx, f"{w_mark} Word wrap in Notepad", body_attr)
+            ops.append((ry + 2, rx, f"{h_mark} Show hidden files", body_attr))
+            ops.append((ry + 4, rx, f"{w_mark} Word wrap in Notepad", body_attr))
 
         elif self.selected_cat == 2: # Regional
-            safe_addstr(stdscr, ry, rx, "Regional Settings:", body_attr | curses.A_BOLD)
+            ops.append((ry, rx, "Regional Settings:", body_attr | curses.A_BOLD))
             s_mark = "[x]" if self.sunday_first else "[ ]"
-            safe_addstr(stdscr, ry + 2, rx, f"{s_mark} Calendar: Sunday first", body_attr)
+            ops.append((ry + 2, rx, f"{s_mark} Calendar: Sunday first", body_attr))
 
         elif self.selected_cat == 3: # System
-            safe_addstr(stdscr, ry, rx, "System Configuration:", body_attr | curses.A_BOLD)
+            ops.append((ry, rx, "System Configuration:", body_attr | curses.A_BOLD))
             w_mark = "[x]" if self.show_welcome else "[ ]"
-            safe_addstr(stdscr, ry + 2, rx, f"{w_mark} Show Welcome Screen", body_attr)
-            from ..core.app import APP_VERSION
-            safe_addstr(stdscr, ry + 6, rx, f"RetroTUI Version: {APP_VERSION}", theme_attr('status'))
+            ops.append((ry + 2, rx, f"{w_mark} Show Welcome Screen", body_attr))
+            ops.append((ry + 6, rx, f"RetroTUI Version: {APP_VERSION}", status_attr))
 
         # Buttons at bottom right
-        btn_y = by + bh - 2
-        safe_addstr(stdscr, btn_y, bx + bw - 18, " [ Apply ] ", theme_attr('button'))
-        safe_addstr(stdscr, btn_y, bx + bw - 8, " [ OK ] ", theme_attr('button_selected'))
+        btn_y = bh - 2
+        ops.append((btn_y, bw - 18, " [ Apply ] ", btn_attr))
+        ops.append((btn_y, bw - 8, " [ OK ] ", sel_attr))
+        return ops
 
     def handle_key(self, key):
         code = normalize_key_code(key)
@@ -104,7 +138,7 @@ class ControlPanelWindow(Window):
             # Toggle logic or save logic based on selection
             if self.selected_cat == 0:
                 # Cycle themes for now as a simple way
-                idx = next((i for i, t in enumerate(self._themes) if t.key == self.theme_name), 0)
+                idx = self._theme_index.get(self.theme_name, 0)
                 self.theme_name = self._themes[(idx + 1) % len(self._themes)].key
                 self.app.apply_theme(self.theme_name)
             elif self.selected_cat == 1:
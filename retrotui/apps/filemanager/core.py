@@ -2,6 +2,7 @@
 Core data structures and helpers for File Manager.
 """
 import unicodedata
+from functools import lru_cache
 
 def _cell_width(ch):
     """Return terminal cell width for a single character."""
@@ -31,6 +32,17 @@ def _fit_text_to_cells(text, max_cells):
     return ''.join(out)
 
 
+@lru_cache(maxsize=8)
+def _header_separator(width):
+    """Return the rule drawn under the path header, `width` dashes wide."""
+    return ' ' + '-' * width
+
+
+_DIR_ICON = '[D]'
+_FILE_ICON = '[F]'
+_PARENT_TEXT = f'  {_DIR_ICON} ..'
+
+
 class FileEntry:
     """Represents a file or directory entry in the file manager."""
     __slots__ = ('name', 'is_dir', 'full_path', 'size', 'display_text', 'use_unicode')
@@ -42,19 +54,17 @@ class FileEntry:
         self.size = size
         self.use_unicode = use_unicode
 
-        dir_icon = '[D]'
-        file_icon = '[F]'
         if name == '..':
-            self.display_text = f'  {dir_icon} ..'
+            self.display_text = _PARENT_TEXT
         elif is_dir:
-            self.display_text = f'  {dir_icon} {name}/'
+            self.display_text = f'  {_DIR_ICON} {name}/'
         else:
-            self.display_text = f'  {file_icon} {name:<30} {self._format_size():>8}'
+            self.display_text = f'  {_FILE_ICON} {name:<30} {self._format_size():>8}'
 
     def _format_size(self):
-        if self.size > 1048576:
-            return f'{self.size / 1048576:.1f}M'
-        elif self.size > 1024:
-            return f'{self.size / 1024:.1f}K'
-        else:
-            return f'{self.size}B'
+        size = self.size
+        if size > 1048576:
+            return f'{size / 1048576:.1f}M'
+        if size > 1024:
+            return f'{size / 1024:.1f}K'
+        return f'{size}B'
@@ -5,12 +5,13 @@ import os
 import curses
 import shutil
 import time
+from collections import OrderedDict
 from ...ui.window import Window
 from ...ui.menu import WindowMenu
 from ...core.actions import ActionResult, ActionType, AppAction
 from ...utils import safe_addstr, check_unicode_support, theme_attr, normalize_key_code
 from ...constants import WIN_MIN_WIDTH, WIN_MIN_HEIGHT
-from .core import FileEntry, _fit_text_to_cells, _cell_width
+from .core import FileEntry, _fit_text_to_cells, _cell_width, _header_separator
 from .operations import (
     _trash_base_dir, perform_copy, perform_move, perform_delete, perform_undo,
     create_directory, create_file, _is_long_file_operation, next_trash_path
@@ -36,6 +37,10 @@ class FileManagerWindow(Window):
     PREVIEW_PANEL_MIN_WIDTH = 24
     PANE_MIN_RENDER_WIDTH = 4
     HEADER_SEP_MARGIN = 4
+    LISTING_CACHE_SIZE = 32
+    # Directories modified this recently are rescanned every time: a change
+    # within the filesystem's timestamp granularity may not move the mtime.
+    LISTING_RACY_NS = 2_000_000_000
 
     _MENU_ACTION_MAP = {
         AppAction.FM_OPEN: 'activate_selected',
@@ -66,6 +71,7 @@ class FileManagerWindow(Window):
         self.current_path = os.path.realpath(start_path or os.path.expanduser('~'))
         self.use_unicode = check_unicode_support()
         self.entries = []           # List[FileEntry]
+        self._name_index = {}       # entry name -> index in self.entries
         self.selected_index = 0
         self.show_hidden = bool(show_hidden_default)
         self.error_message = None
@@ -116,6 +122,8 @@ class FileManagerWindow(Window):
         self.secondary_error_message = None
         self.last_click_time = 0
         self.last_click_index = -1
+        # (path, show_hidden) -> (dir mtime_ns, [FileEntry]), least recent first.
+        self._listing_cache = OrderedDict()
         self._rebuild_content()
         if self.dual_pane_enabled:
             self._rebuild_secondary_content()
@@ -248,7 +256,7 @@ class FileManagerWindow(Window):
         path_icon = '[P]'
         error_icon = '[!]'
         content.append(f' {path_icon} {path}')
-        content.append(' ' + '-' * (self.w - self.HEADER_SEP_MARGIN))
+        content.append(_header_separator(self.w - self.HEADER_SEP_MARGIN))
 
         if path != os.path.sep and os.path.dirname(path) != path:
             entry = FileEntry('..', True, os.path.dirname(path), use_unicode=self.use_unicode)
@@ -256,7 +264,7 @@ class FileManagerWindow(Window):
             content.append(entry.display_text)
 
         try:
-            raw_entries = sorted(os.listdir(path), key=str.lower)
+            listed = self._listing(path)
         except PermissionError:
             error_message = 'Permission denied'
             content.append(f'  {error_icon} Permission denied')
@@ -266,25 +274,7 @@ class FileManagerWindow(Window):
             content.append(f'  {error_icon} {exc}')
             return entries, content, error_message
 
-        dirs = []
-        files = []
-        for name in raw_entries:
-            if not self.show_hidden and name.startswith('.'):
-                continue
-            full_path = os.path.join(path, name)
-            try:
-                if os.path.isdir(full_path):
-                    dirs.append(FileEntry(name, True, full_path, use_unicode=self.use_unicode))
-                elif os.path.isfile(full_path):
-                    size = os.path.getsize(full_path)
-                    files.append(FileEntry(name, False, full_path, size, use_unicode=self.use_unicode))
-            except OSError:
-                continue
-
-        for entry in dirs:
-            entries.append(entry)
-            content.append(entry.display_text)
-        for entry in files:
+        for entry in listed:
             entries.append(entry)
             content.append(entry.display_text)
 
@@ -293,6 +283,50 @@ class FileManagerWindow(Window):
 
         return entries, content, error_message
 
+    def _listing(self, path):
+        """Return path's entries, reusing the last scan while the directory mtime is unchanged."""
+        key = (path, self.show_hidden)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cache = self._listing_cache
+        cached = cache.get(key)
+        if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+            cache.move_to_end(key)
+            return cached[1]
+
+        listed = self._scan_listing(path)
+        if mtime_ns is not None and time.time_ns() - mtime_ns > self.LISTING_RACY_NS:
+            cache[key] = (mtime_ns, listed)
+            cache.move_to_end(key)
+            while len(cache) > self.LISTING_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.pop(key, None)
+        return listed
+
+    def _scan_listing(self, path):
+        """Scan path into FileEntry objects, directories first, each sorted by name."""
+        # DirEntry type checks come from the readdir record; only symlinks
+        # and file sizes cost a stat call.
+        entries = []
+        with os.scandir(path) as it:
+            for dir_entry in it:
+                name = dir_entry.name
+                if not self.show_hidden and name.startswith('.'):
+                    continue
+                try:
+                    if dir_entry.is_dir():
+                        entries.append(FileEntry(name, True, dir_entry.path, use_unicode=self.use_unicode))
+                    elif dir_entry.is_file():
+                        size = dir_entry.stat().st_size
+                        entries.append(FileEntry(name, False, dir_entry.path, size, use_unicode=self.use_unicode))
+                except OSError:
+                    continue
+        entries.sort(key=lambda e: (not e.is_dir, e.name.casefold()))
+        return entries
+
     def _rebuild_secondary_content(self):
         entries, content, error = self._build_listing(self.secondary_path)
         self.secondary_entries = entries
@@ -310,17 +344,13 @@ class FileManagerWindow(Window):
         
         self._invalidate_preview_cache()
         self.entries, self.content, self.error_message = self._build_listing(self.current_path)
+        self._name_index = {e.name: i for i, e in enumerate(self.entries)}
         basename = os.path.basename(self.current_path) or '/'
         count = len([e for e in self.entries if e.name != '..'])
         self.title = f'File Manager - {basename} ({count} items)'
         
-        self.selected_index = 0
-        if old_name:
-            for i, e in enumerate(self.entries):
-                if e.name == old_name:
-                    self.selected_index = i
-                    break
-                    
+        self.selected_index = self._name_index.get(old_name, 0)
+
         self.scroll_offset = 0
         if self.selected_index >= (self.h - self._header_lines()):
              self.scroll_offset = max(0, self.selected_index - (self.h - self._header_lines()) + 1)
@@ -328,16 +358,16 @@ class FileManagerWindow(Window):
             self._rebuild_secondary_content()
 
     def _select_entry_by_name(self, name):
-        for i, entry in enumerate(self.entries):
-             if entry.name == name:
-                 self.selected_index = i
-                 display_h = self.h - self._header_lines()
-                 if self.selected_index >= display_h:
-                      self.scroll_offset = max(0, self.selected_index - display_h + 1)
-                 else:
-                      self.scroll_offset = 0
-                 return True
-        return False
+        i = self._name_index.get(name)
+        if i is None:
+            return False
+        self.selected_index = i
+        display_h = self.h - self._header_lines()
+        if self.selected_index >= display_h:
+            self.scroll_offset = max(0, self.selected_index - display_h + 1)
+        else:
+            self.scroll_offset = 0
+        return True
 
     def _ensure_visible(self):
         """Ensure the selected index is within the visible scroll area."""
@@ -360,16 +390,9 @@ class FileManagerWindow(Window):
         if parent == self.current_path:
             return None
         self.navigate_to(parent)
-        
+
         # Restore selection
-        basename = os.path.basename(old_path)
-        for i, entry in enumerate(self.entries):
-             if entry.name == basename:
-                 self.selected_index = i
-                 display_h = self.h - self._header_lines()
-                 if self.selected_index >= display_h:
-                      self.scroll_offset = max(0, self.selected_index - display_h + 1)
-                 break
+        self._select_entry_by_name(os.path.basename(old_path))
 
     def _selected_entry(self):
         if self.active_pane == 1:
@@ -744,24 +767,25 @@ class FileManagerWindow(Window):
              safe_addstr(stdscr, y + 2, x + 2, f'Error: {error_msg}'[:w-2], theme_attr('window_body'))
              return
 
-        items = content[self._header_lines():]
-        display_h = h - self._header_lines()
-        
-        for k in range(display_h):
-             line_y = y + self._header_lines() + k
+        # Index into content directly: slicing off the header every frame
+        # would copy the whole listing just to show one screenful.
+        header = self._header_lines()
+        item_count = len(content) - header
+        entries_src = self.entries if pane_id == 0 else self.secondary_entries
+        entry_count = len(entries_src)
+        body_attr = theme_attr('window_body')
+        blank = ' ' * w
+
+        for k in range(h - header):
+             line_y = y + header + k
              idx = scroll + k
-             if idx >= len(items):
-                 safe_addstr(stdscr, line_y, x, ' ' * w, theme_attr('window_body'))
+             if idx >= item_count:
+                 safe_addstr(stdscr, line_y, x, blank, body_attr)
                  continue
-             
-             line_str = _fit_text_to_cells(items[idx], w)
-             
-             is_sel = (idx == selected)
-
-             entries_src = self.entries if pane_id == 0 else self.secondary_entries
-             entry_obj = entries_src[idx] if 0 <= idx < len(entries_src) else None
 
-             attr = self._entry_display_attr(entry_obj, is_sel, is_active)
+             line_str = _fit_text_to_cells(content[header + idx], w)
+             entry_obj = entries_src[idx] if 0 <= idx < entry_count else None
+             attr = self._entry_display_attr(entry_obj, idx == selected, is_active)
 
              safe_addstr(stdscr, line_y, x, line_str, attr)
 
@@ -773,8 +797,16 @@ class FileManagerWindow(Window):
                 max_scroll = max(0, len(self.secondary_entries) - 1)
                 self.secondary_scroll_offset = min(max_scroll, self.secondary_scroll_offset + amount)
             return True
-        else:
-            return super().handle_scroll(direction, amount)
+        # Same bounds as Window.scroll_up/scroll_down, applied in one step.
+        count = max(1, amount)
+        if direction == 'up':
+            self.scroll_offset = max(0, self.scroll_offset - count)
+        elif direction == 'down':
+            _, _, _, bh = self.body_rect()
+            max_scroll = len(self.content) - bh
+            if self.scroll_offset < max_scroll:
+                self.scroll_offset = min(max_scroll, self.scroll_offset + count)
+        return None
 
     def handle_click(self, mx, my, bstate=None):
         self._pending_drag_payload = None  # Clear any previous pending drag
@@ -1027,6 +1059,8 @@ class FileManagerWindow(Window):
         return super().handle_key(key)
 
     def _action_refresh(self):
+        # Refresh always rescans, e.g. to pick up files whose size changed.
+        self._listing_cache.clear()
         self._rebuild_content()
         return ActionResult(ActionType.REFRESH)
 
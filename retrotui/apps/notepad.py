@@ -424,9 +424,10 @@ class NotepadWindow(Window):
         if total_lines > body_h and body_h > 1:
             sb_x = bx + bw - 1
             thumb_pos = int(self.view_top / max(1, total_lines - body_h) * (body_h - 1))
+            sb_attr = theme_attr('scrollbar')
             for i in range(body_h):
                 ch = '█' if i == thumb_pos else '░'
-                safe_addstr(stdscr, by + i, sb_x, ch, theme_attr('scrollbar'))
+                safe_addstr(stdscr, by + i, sb_x, ch, sb_attr)
 
         # Status bar (inside window, last body row)
         status_y = by + bh - 1
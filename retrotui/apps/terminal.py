@@ -372,9 +372,10 @@ class TerminalWindow(Window):
         if total_lines <= rows or rows <= 1:
             return
         thumb_pos = int(start_idx / max(1, total_lines - rows) * (rows - 1))
+        sb_attr = theme_attr('scrollbar')
         for i in range(rows):
             ch = '█' if i == thumb_pos else '░'
-            safe_addstr(stdscr, y + i, x, ch, theme_attr('scrollbar'))
+            safe_addstr(stdscr, y + i, x, ch, sb_attr)
 
     def _draw_live_cursor(self, stdscr, x, y, text_cols, text_rows, start_idx, total_lines, body_attr):
         if not self.active or self.scrollback_offset != 0:
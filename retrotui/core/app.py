@@ -23,7 +23,7 @@ from ..apps.logviewer import LogViewerWindow
 from ..apps.image_viewer import ImageViewerWindow
 from ..apps.hexviewer import HexViewerWindow
 from ..apps.markdown_viewer import MarkdownViewerWindow
-from .config import AppConfig, load_config, save_config
+from .config import AppConfig, hidden_icon_labels, load_config, save_config
 from .actions import ActionResult, ActionType, AppAction
 from .action_runner import execute_app_action
 from .drag_drop import DragDropManager
@@ -157,20 +157,10 @@ class RetroTUI:
         self.refresh_icons()
         
         # Build Start Menu with hidden apps filtered out
-        hidden_labels = {x.strip().lower() for x in self.config.hidden_icons.split(",")} if getattr(self.config, 'hidden_icons', "") else set()
-        from ..ui.menu import DEFAULT_GLOBAL_ITEMS, Menu
-        
-        filtered_menu_items = {}
-        for category, items in DEFAULT_GLOBAL_ITEMS.items():
-            filtered_items = []
-            for item in items:
-                label = item[0].split("  ")[0] # Strip shortcuts like "Exit  Ctrl+Q"
-                if label.lower() not in hidden_labels:
-                    filtered_items.append(item)
-            if filtered_items: # Only add category if it's not empty
-                filtered_menu_items[category] = filtered_items
-                
-        self.menu = Menu(filtered_menu_items)
+        hidden_labels = hidden_icon_labels(getattr(self.config, 'hidden_icons', ""))
+        from ..ui.menu import Menu, filter_global_items
+
+        self.menu = Menu(filter_global_items(hidden_labels))
         self.context_menu = None
         self.dialog = None
         self.selected_icon = -1
@@ -247,11 +237,14 @@ class RetroTUI:
         self.theme = get_theme(theme_name)
         self.theme_name = self.theme.key
         init_colors(self.theme)
+        for win in self.windows:
+            if hasattr(win, 'mark_dirty'):
+                win.mark_dirty()
 
     def refresh_icons(self):
         """Rebuild desktop icons list based on config and unicode support."""
         base_icons = ICONS if self.use_unicode else ICONS_ASCII
-        hidden_labels = {x.strip().lower() for x in self.config.hidden_icons.split(",")} if getattr(self.config, 'hidden_icons', "") else set()
+        hidden_labels = hidden_icon_labels(getattr(self.config, 'hidden_icons', ""))
         self.icons = [icon for icon in base_icons if icon["label"].lower() not in hidden_labels]
 
     def apply_preferences(self, *, show_hidden=None, word_wrap_default=None, sunday_first=None, apply_to_open_windows=False):
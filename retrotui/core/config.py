@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from ..theme import DEFAULT_THEME, THEMES
@@ -25,6 +26,14 @@ class AppConfig:
     hidden_icons: str = ""
 
 
+@lru_cache(maxsize=8)
+def hidden_icon_labels(hidden_icons: str) -> frozenset[str]:
+    """Return the lowercased labels listed in a hidden_icons config value."""
+    if not hidden_icons:
+        return frozenset()
+    return frozenset(x.strip().lower() for x in hidden_icons.split(","))
+
+
 def default_config_path() -> Path:
     """Return default config path (~/.config/retrotui/config.toml)."""
     return Path.home() / ".config" / "retrotui" / "config.toml"
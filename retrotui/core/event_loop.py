@@ -9,6 +9,8 @@ def clamp_windows_to_terminal(app):
     for win in app.windows:
         win.x = max(0, min(win.x, new_w - min(win.w, new_w)))
         win.y = max(1, min(win.y, new_h - min(win.h, new_h) - 1))
+        if hasattr(win, 'mark_dirty'):
+            win.mark_dirty()
 
 
 def draw_frame(app):
@@ -250,9 +250,10 @@ class MultiSelectDialog(Dialog):
         if len(self.choices) > self.visible_rows:
             sb_x = list_x + list_w
             thumb_pos = int(self.list_offset / max(1, len(self.choices) - self.visible_rows) * (self.visible_rows - 1))
+            sb_attr = theme_attr('scrollbar')
             for i in range(self.visible_rows):
                 ch = '█' if i == thumb_pos else '░'
-                safe_addstr(stdscr, list_y + i, sb_x, ch, theme_attr('scrollbar'))
+                safe_addstr(stdscr, list_y + i, sb_x, ch, sb_attr)
 
     def handle_click(self, mx, my):
         # Delegate down to buttons
@@ -50,6 +50,27 @@ DEFAULT_GLOBAL_ITEMS = {
     ],
 }
 
+# (lowercased label without shortcut hint, item) per category, computed once
+# so hiding apps is a set lookup per item.
+_GLOBAL_ITEM_KEYS = {
+    category: [(item[0].split("  ", 1)[0].lower(), item) for item in items]
+    for category, items in DEFAULT_GLOBAL_ITEMS.items()
+}
+
+
+def filter_global_items(hidden_labels):
+    """Return DEFAULT_GLOBAL_ITEMS without items whose label is in hidden_labels.
+
+    Labels are compared lowercased with shortcut hints ("Exit  Ctrl+Q") stripped;
+    categories left empty are dropped.
+    """
+    filtered = {}
+    for category, keyed_items in _GLOBAL_ITEM_KEYS.items():
+        items = [item for key, item in keyed_items if key not in hidden_labels]
+        if items:
+            filtered[category] = items
+    return filtered
+
 
 class MenuBar:
     """Unified menu bar used for both global and window menus."""
@@ -55,6 +55,75 @@ class Window:
         self.visible = True
         self.window_menu = None  # Instance of WindowMenu if menu enabled
 
+        # Body draw ops reused while their state key is unchanged
+        self._ops_key = None
+        self._ops = ()
+        # Offscreen pad holding the last ops drawn by _blit_ops()
+        self._pad = None
+        self._pad_sig = None
+        self._pad_ops = None
+
+    def _cached_ops(self, key, build):
+        """Return build()'s draw ops, rebuilding them only when key changes.
+
+        Ops are (dy, dx, text, attr) tuples relative to the caller's origin.
+        The desktop is erased every frame, so callers still replay them; what
+        is saved is the formatting work, and curses.doupdate() already sends
+        only the cells that differ from the terminal.
+        """
+        if key != self._ops_key:
+            self._ops = build()
+            self._ops_key = key
+        return self._ops
+
+    def _blit_ops(self, stdscr, top, left, height, width, ops, fill_attr):
+        """Draw ops in the height x width area at (top, left) through a pad.
+
+        The pad is repainted only when ops is a new list (see _cached_ops) or
+        the area changes; otherwise each frame is a single overwrite() onto
+        stdscr. Returns False without drawing when no pad can be made (no
+        curses.newpad, or before initscr()); callers then write the ops
+        themselves.
+        """
+        sig = (height, width, fill_attr)
+        if sig != self._pad_sig:
+            self._pad_sig = sig
+            self._pad_ops = None
+            self._pad = None
+            newpad = getattr(curses, 'newpad', None)
+            if newpad is not None and height > 0 and width > 0:
+                try:
+                    # One spare column: safe_addstr never writes a window's last one.
+                    self._pad = newpad(height, width + 1)
+                    self._pad.bkgd(' ', fill_attr)
+                except curses.error:
+                    self._pad = None
+        pad = self._pad
+        if pad is None:
+            return False
+
+        if ops is not self._pad_ops:
+            pad.erase()
+            for dy, dx, text, attr in ops:
+                safe_addstr(pad, dy, dx, text, attr)
+            self._pad_ops = ops
+
+        # Clip to the screen, leaving its last column alone like safe_addstr.
+        max_y, max_x = stdscr.getmaxyx()
+        bottom = min(top + height, max_y) - 1
+        right = min(left + width, max_x - 1) - 1
+        if top < 0 or left < 0 or bottom < top or right < left:
+            return True
+        try:
+            pad.overwrite(stdscr, 0, 0, top, left, bottom, right)
+        except curses.error:
+            pass
+        return True
+
+    def mark_dirty(self):
+        """Force the next draw to rebuild its cached body ops."""
+        self._ops_key = None
+
     def close_button_pos(self):
         """Return (x, y) of the close button."""
         return (self.x + self.w - self.CLOSE_BTN_OFFSET, self.y)
@@ -218,8 +287,9 @@ class Window:
 
         # Fill body background
         bx, by, bw, bh = self.body_rect()
+        blank = ' ' * bw
         for i in range(bh):
-            safe_addstr(stdscr, by + i, bx, ' ' * bw, body_attr)
+            safe_addstr(stdscr, by + i, bx, blank, body_attr)
 
         return body_attr
 
@@ -239,9 +309,10 @@ class Window:
             sb_x = bx + bw - 1
             # Thumb position
             thumb_pos = int(self.scroll_offset / max(1, len(self.content) - bh) * (bh - 1))
+            sb_attr = theme_attr('scrollbar')
             for i in range(bh):
                 ch = '█' if i == thumb_pos else '░'
-                safe_addstr(stdscr, by + i, sb_x, ch, theme_attr('scrollbar'))
+                safe_addstr(stdscr, by + i, sb_x, ch, sb_attr)
 
     def draw(self, stdscr):
         """Draw the window."""
@@ -2,12 +2,15 @@
 Utility functions for RetroTUI.
 """
 import curses
+import json
 import os
 import sys
 import shutil
 import subprocess
 import time
 import locale
+import mmap
+from functools import lru_cache
 from .constants import (
     C_DESKTOP, C_WIN_TITLE, C_WIN_INACTIVE, C_ICON, C_MENUBAR, C_MENU_ITEM,
     C_MENU_SEL, C_WIN_BORDER, C_WIN_TITLE_INV, C_WIN_BODY, C_BUTTON,
@@ -17,6 +20,11 @@ from .constants import (
 )
 from .theme import ROLE_TO_PAIR_ID, get_theme
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 # Cache for theme_attr() lookups — invalidated by init_colors().
 _theme_attr_cache: dict[str, int] = {}
 
@@ -88,6 +96,26 @@ def safe_addstr(win, y, x, text, attr=0):
     except curses.error:
         pass
 
+def safe_addlines(win, y, x, lines, attr=0):
+    """Write consecutive rows starting at (y, x), clipping to window bounds.
+
+    Equivalent to calling safe_addstr() once per row, but the bounds check is
+    done once for the whole block. Python's curses has no addchstr binding, so
+    this is the bulk path for full-body redraws (animations, grids).
+    """
+    if x < 0 or y < 0:
+        return
+    h, w = win.getmaxyx()
+    max_len = w - x - 1
+    if y >= h or max_len <= 0:
+        return
+    addnstr = win.addnstr
+    for row, text in enumerate(lines[: h - y]):
+        try:
+            addnstr(y + row, x, text, max_len, attr)
+        except curses.error:
+            pass
+
 def normalize_key_code(key):
     """Normalize keys from get_wch()/getch() into comparable integer codes."""
     if isinstance(key, int):
@@ -119,8 +147,9 @@ def draw_box(win, y, x, h, w, attr=0, double=True):
         safe_addstr(win, y + i, x + w - 1, vt, attr)
     safe_addstr(win, y + h - 1, x, bl + hz * (w - 2) + br, attr)
 
+@lru_cache(maxsize=None)
 def check_unicode_support():
-    """Check if terminal supports Unicode."""
+    """Check if terminal supports Unicode (memoized; cache_clear() re-probes)."""
     try:
         '╔'.encode(locale.getpreferredencoding())
         return True
@@ -153,6 +182,84 @@ def get_system_info():
     info.append(f'Python: {sys.version.split()[0]}')
     return info
 
+def _json_dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode('utf-8')
+
+# orjson parses straight from a read-only mapping of files at least this big.
+_JSON_MMAP_MIN = 4096
+
+def read_json(path):
+    """Load a JSON file, using orjson when installed (raises OSError/ValueError)."""
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        if os.fstat(f.fileno()).st_size < _JSON_MMAP_MIN:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def write_json_atomic(path, data):
+    """Write data as JSON via a sibling temp file + os.replace (no torn files)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_json_dumps(data))
+    os.replace(tmp, path)
+
+class ThrottledJsonWriter:
+    """Coalesce saves of a JSON file to at most one write per `delay` seconds.
+
+    Call mark_dirty() after each edit and flush() whenever convenient (e.g.
+    on draw); flush(force=True) writes a pending edit immediately, as on
+    close. `snapshot` returns the data to write.
+    """
+
+    def __init__(self, path, snapshot, delay=1.0):
+        self.path = path
+        self.snapshot = snapshot
+        self.delay = delay
+        self.dirty = False
+        self._last_write = None
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def flush(self, force=False):
+        """Write if dirty and due (or forced); return True when a write happened."""
+        if not self.dirty:
+            return False
+        now = time.monotonic()
+        if not force and self._last_write is not None and now - self._last_write < self.delay:
+            return False
+        try:
+            write_json_atomic(self.path, self.snapshot())
+        except OSError:
+            return False
+        self.dirty = False
+        self._last_write = now
+        return True
+
+@lru_cache(maxsize=64)
+def _which_on_path(cmd, path):
+    return shutil.which(cmd, path=path)
+
+def which_cached(cmd):
+    """Memoized shutil.which(); the cache is keyed on $PATH so edits to it apply."""
+    return _which_on_path(cmd, os.environ.get('PATH', os.defpath))
+
+which_cached.cache_clear = _which_on_path.cache_clear
+
+def http_get(url, timeout=5):
+    """GET url and return the response body as bytes (raises OSError).
+
+    The implementation lives in retrotui._http and is imported on the first
+    call, so importing utils never loads urllib3 or urllib.request.
+    """
+    from ._http import http_get as _http_get
+    return _http_get(url, timeout)
+
 def is_video_file(filepath):
     """Return True if filepath extension looks like video."""
     _, ext = os.path.splitext(filepath.lower())
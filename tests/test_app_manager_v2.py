@@ -109,6 +109,19 @@ class AppManagerV2Tests(unittest.TestCase):
         win.handle_key(32) # Space
         self.assertNotEqual(win.choices["Apps"][0][2], initial_state)
 
+    def test_key_table_routes_tab_escape_and_buttons(self):
+        win = self.AppManagerWindow(0, 0, 80, 24, self.app)
+        self.assertIsNone(win.handle_key(ord('x')))
+        win.handle_key(9)  # Tab
+        self.assertFalse(win.in_list)
+        win.handle_key(self.curses_mock.KEY_RIGHT)
+        self.assertEqual(win.selected_button, 1)
+        result = win.handle_key(27)
+        self.assertEqual(result.type, ActionType.EXECUTE)
+        self.assertEqual(result.payload, AppAction.CLOSE_WINDOW)
+        win.handle_key(self.curses_mock.KEY_DOWN)
+        self.assertTrue(win.in_list)
+
     def test_save_persists_config(self):
         win = self.AppManagerWindow(0, 0, 80, 24, self.app)
         win.in_list = False
@@ -121,5 +134,101 @@ class AppManagerV2Tests(unittest.TestCase):
         self.app.refresh_icons.assert_called_once()
 
 
+    def test_scrollbar_column_follows_offset_and_is_cached(self):
+        win = self.AppManagerWindow(0, 0, 80, 24, self.app)
+        rows = win.visible_rows
+        top = win._scrollbar_column("Apps", 0, rows * 2)
+        self.assertEqual(len(top), rows)
+        self.assertEqual(top[0], '█')
+        self.assertIs(win._scrollbar_column("Apps", 0, rows * 2), top)
+
+        bottom = win._scrollbar_column("Apps", rows, rows * 2)
+        self.assertEqual(bottom.index('█'), rows - 1)
+        self.assertEqual(bottom.count('█'), 1)
+
+    def test_draw_reuses_rows_until_a_checkbox_toggles(self):
+        win = self.AppManagerWindow(0, 0, 80, 24, self.app)
+        mod = sys.modules["retrotui.apps.app_manager"]
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(mod, "draw_box"),
+            mock.patch.object(mod, "safe_addstr") as safe_addstr,
+            mock.patch.object(win, "_body_ops", wraps=win._body_ops) as body_ops,
+        ):
+            win.draw(None)
+            win.draw(None)
+            self.assertEqual(body_ops.call_count, 1)
+            win.handle_key(32)  # Space toggles App1
+            safe_addstr.reset_mock()
+            win.draw(None)
+            self.assertEqual(body_ops.call_count, 2)
+
+        rendered = [call.args[3] for call in safe_addstr.call_args_list]
+        self.assertTrue(any(text.startswith(" [ ] App1") for text in rendered))
+
+    def test_draw_writes_scrollbar_as_one_column(self):
+        win = self.AppManagerWindow(0, 0, 80, 24, self.app)
+        win.choices["Apps"] = [[f"A{i}", f"A{i}", True] for i in range(win.visible_rows * 2)]
+        mod = sys.modules["retrotui.apps.app_manager"]
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(mod, "draw_box"),
+            mock.patch.object(mod, "safe_addstr"),
+            mock.patch.object(mod, "safe_addlines") as safe_addlines,
+        ):
+            win.draw(None)
+
+        safe_addlines.assert_called_once()
+        column = safe_addlines.call_args.args[3]
+        self.assertEqual(column, ['█'] + ['░'] * (win.visible_rows - 1))
+
+    def test_click_uses_bounds_recorded_by_draw(self):
+        win = self.AppManagerWindow(0, 0, 80, 24, self.app)
+        self.assertFalse(win.handle_click(5, 4))  # nothing drawn yet
+        mod = sys.modules["retrotui.apps.app_manager"]
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(mod, "draw_box"),
+            mock.patch.object(mod, "safe_addstr"),
+        ):
+            win.draw(None)
+
+        x0, _ = win._col_bounds[1]
+        self.assertTrue(win.handle_click(x0 + 1, win.y + 4))
+        self.assertEqual(win.active_cat_idx, 1)
+        self.assertFalse(win.choices["Games"][0][2])  # toggled off
+
+        cancel_x, _ = win._btn_bounds[1]
+        with mock.patch.object(win, "_activate_button", return_value="closed") as activate:
+            self.assertEqual(win.handle_click(cancel_x, win._btn_y), "closed")
+        activate.assert_called_once_with()
+        self.assertEqual(win.selected_button, 1)
+
+    def test_body_rows_are_padded_and_truncated_to_column_width(self):
+        win = self.AppManagerWindow(0, 0, 60, 24, self.app)
+        win.choices["Apps"][0][0] = "X" * 80
+        col_w = (win.w - 6) // 2
+        ops = win._body_ops(0, (0, 0))
+        rows = [text for dy, dx, text, _ in ops if dy == 3]
+        self.assertEqual([len(row) for row in rows], [col_w, col_w])
+        self.assertTrue(rows[0].startswith(" [x] XXX"))
+        self.assertEqual(rows[1].rstrip(), " [x] Game1")
+
+    def test_buttons_are_rendered_once_and_centred(self):
+        win = self.AppManagerWindow(10, 0, 60, 24, self.app)
+        self.assertEqual(win._rendered_buttons, [("[ Save ]", 8), ("[ Cancel ]", 10)])
+        self.assertEqual(win._btn_total, 20)
+        mod = sys.modules["retrotui.apps.app_manager"]
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(mod, "draw_box"),
+            mock.patch.object(mod, "safe_addstr"),
+        ):
+            win.draw(None)
+        self.assertEqual(win._btn_bounds, [(30, 38), (40, 50)])
+        labels = [text for dy, dx, text, _ in win._ops if dy == win.h - 3]
+        self.assertEqual(labels, ["[ Save ]", "[ Cancel ]"])
+
+
 if __name__ == "__main__":
     unittest.main()
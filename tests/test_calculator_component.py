@@ -89,6 +89,23 @@ class CalculatorComponentTests(unittest.TestCase):
         self.assertEqual(evaluate("1/2"), "0.5")
         self.assertEqual(evaluate("-0.0"), "0")
 
+    def test_evaluate_expression_parses_repeated_input_once(self):
+        self.calc_mod._compile_expression.cache_clear()
+        self.assertEqual(self.calc_mod.evaluate_expression("6*7"), "42")
+        self.assertEqual(self.calc_mod.evaluate_expression(" 6*7 "), "42")
+        info = self.calc_mod._compile_expression.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_evaluate_expression_rejects_before_running_code(self):
+        evaluate = self.calc_mod.evaluate_expression
+        with self.assertRaisesRegex(ValueError, "Unsupported"):
+            evaluate("(1).__class__")
+        with self.assertRaisesRegex(ValueError, "Unsupported"):
+            evaluate("1 + 'a'")
+        with self.assertRaises(ZeroDivisionError):
+            evaluate("1/0")
+        self.assertEqual(evaluate("2 ** 10 % 7 - -1"), "3")
+
     def test_set_expression_and_insert_delete_helpers(self):
         win = self._make_window()
         win._set_expression("12345")
@@ -123,7 +140,7 @@ class CalculatorComponentTests(unittest.TestCase):
         win._delete_forward()
         self.assertEqual(win.expression, "abc")
 
-        win.history = [str(i) for i in range(win.MAX_HISTORY)]
+        win.history.extend(str(i) for i in range(win.MAX_HISTORY))
         win._append_history("overflow")
         self.assertEqual(len(win.history), win.MAX_HISTORY)
         self.assertEqual(win.history[-1], "overflow")
@@ -161,11 +178,11 @@ class CalculatorComponentTests(unittest.TestCase):
         win.expression = "   "
         win.cursor_pos = 3
         win._evaluate_current()
-        self.assertEqual(win.history, [])
+        self.assertEqual(list(win.history), [])
 
     def test_history_navigation_moves_expression(self):
         win = self._make_window()
-        win.history = ["1+1 = 2", "2+2 = 4", "9/0 ! division by zero"]
+        win.history.extend(["1+1 = 2", "2+2 = 4", "9/0 ! division by zero"])
 
         win._history_move(-1)
         self.assertEqual(win.expression, "9/0")
@@ -181,7 +198,7 @@ class CalculatorComponentTests(unittest.TestCase):
         win._history_move(-1)
         self.assertIsNone(win.history_index)
 
-        win.history = ["1+1 = 2"]
+        win._append_history("1+1 = 2")
         win.history_index = 0
         win._history_move(-1)
         self.assertEqual(win.history_index, 0)
@@ -207,6 +224,16 @@ class CalculatorComponentTests(unittest.TestCase):
         win.handle_key(self.curses.KEY_END)
         self.assertEqual(win.cursor_pos, len(win.expression))
 
+    def test_handle_key_scrolls_view_only_when_input_changes(self):
+        win = self._make_window()
+        win._set_expression("1" * 80)
+        with mock.patch.object(win, "_ensure_cursor_visible") as ensure:
+            win.handle_key(self.curses.KEY_F9)
+            win.handle_key(self.curses.KEY_RIGHT)  # already at the end
+            ensure.assert_not_called()
+            win.handle_key(self.curses.KEY_HOME)
+        ensure.assert_called_once_with(win._input_width())
+
     def test_handle_key_right_delete_and_history_keys(self):
         win = self._make_window()
         win._set_expression("ab")
@@ -219,7 +246,7 @@ class CalculatorComponentTests(unittest.TestCase):
         win.handle_key(self.curses.KEY_DC)
         self.assertEqual(win.expression, "a")
 
-        win.history = ["2+2 = 4", "3+3 = 6"]
+        win.history.extend(["2+2 = 4", "3+3 = 6"])
         win._set_expression("")
         win.handle_key(self.curses.KEY_UP)
         self.assertTrue(win.expression)
@@ -240,7 +267,7 @@ class CalculatorComponentTests(unittest.TestCase):
         self.assertEqual(copy_text.call_count, 2)
 
         win.handle_key(12)  # Ctrl+L
-        self.assertEqual(win.history, [])
+        self.assertEqual(list(win.history), [])
         win.handle_key(27)  # Esc
         self.assertEqual(win.expression, "")
 
@@ -314,7 +341,7 @@ class CalculatorComponentTests(unittest.TestCase):
 
     def test_draw_renders_input_history_and_status(self):
         win = self._make_window()
-        win.history = ["1+1 = 2", "2+2 = 4"]
+        win.history.extend(["1+1 = 2", "2+2 = 4"])
         win._set_expression("12+30")
 
         with (
@@ -329,6 +356,75 @@ class CalculatorComponentTests(unittest.TestCase):
         self.assertTrue(any("1+1 = 2" in text for text in rendered))
         self.assertTrue(any("Ctrl+L=Clear" in text for text in rendered))
 
+    def test_draw_rebuilds_body_only_when_expression_changes(self):
+        win = self._make_window()
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(self.calc_mod, "safe_addstr"),
+            mock.patch.object(self.calc_mod, "theme_attr", return_value=0),
+            mock.patch.object(win, "_body_ops", wraps=win._body_ops) as body_ops,
+        ):
+            win.draw(None)
+            win.draw(None)
+            self.assertEqual(body_ops.call_count, 1)
+            win.handle_key("7")
+            win.draw(None)
+            self.assertEqual(body_ops.call_count, 2)
+
+    def test_button_rects_are_reused_until_the_window_moves(self):
+        win = self._make_window()
+        rects = win._button_rects()
+        self.assertEqual(rects[1][2], win._button_rect(1, 2))
+        self.assertIs(win._button_rects(), rects)
+        win.x += 3
+        moved = win._button_rects()
+        self.assertIsNot(moved, rects)
+        self.assertEqual(moved[0][0][0], rects[0][0][0] + 3)
+
+    def test_history_exprs_are_cached_until_history_changes(self):
+        win = self._make_window()
+        win._append_history("1+1 = 2")
+        entries = win._history_expr_only()
+        self.assertEqual(entries, ["1+1"])
+        self.assertIs(win._history_expr_only(), entries)
+
+        win._append_history("9/0 ! division by zero")
+        self.assertEqual(win._history_expr_only(), ["1+1", "9/0"])
+        win.handle_key(12)  # Ctrl+L
+        self.assertEqual(win._history_expr_only(), [])
+
+    def test_history_exprs_follow_direct_history_changes(self):
+        win = self._make_window()
+        win._append_history("1+1 = 2")
+        self.assertEqual(win._history_expr_only(), ["1+1"])
+        win.history.append("2*3 = 6")
+        self.assertEqual(win._history_expr_only(), ["1+1", "2*3"])
+        win.history.clear()
+        self.assertEqual(win._history_expr_only(), [])
+
+    def test_draw_leaves_body_clearing_to_draw_frame(self):
+        win = self._make_window()
+        _, _, bw, _ = win.body_rect()
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(self.calc_mod, "safe_addstr") as safe_addstr,
+            mock.patch.object(self.calc_mod, "theme_attr", return_value=0),
+        ):
+            win.draw(None)
+
+        self.assertNotIn(" " * bw, [call.args[3] for call in safe_addstr.call_args_list])
+
+    def test_draw_input_row_blanks_control_characters_and_marks_cursor(self):
+        win = self._make_window()
+        win._set_expression("1\t+2")
+        ops = win._body_ops(*win.body_rect()[2:], (), 0, 0, 0)
+        input_row = [text for dy, dx, text, _ in ops if dy == 0]
+        self.assertTrue(input_row[1].startswith("1 +2 "))
+        self.assertEqual(input_row[2], " ")  # cursor past the end
+        win.cursor_pos = 1
+        ops = win._body_ops(*win.body_rect()[2:], (), 0, 0, 0)
+        self.assertEqual([text for dy, dx, text, _ in ops if dy == 0][2], " ")
+
 
 if __name__ == "__main__":
     unittest.main()
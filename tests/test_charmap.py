@@ -39,10 +39,94 @@ class CharMapTests(unittest.TestCase):
         win = self.mod.CharacterMapWindow(0, 0, 40, 12)
         with mock.patch.object(win, "draw_frame", return_value=0), mock.patch.object(
             self.mod, "safe_addstr"
-        ) as safe_addstr, mock.patch.object(self.mod, "theme_attr", return_value=0):
+        ), mock.patch.object(self.mod, "safe_addlines"), mock.patch.object(
+            self.mod, "theme_attr", return_value=0
+        ):
             win.draw(None)
 
         bx, by, bw, bh = win.body_rect()
         info = win.handle_click(bx, by + 1)
         self.assertIsNotNone(info)
         self.assertIn('char', info)
+
+    def test_draw_writes_grid_rows_with_selected_cell_overlay(self):
+        win = self.mod.CharacterMapWindow(0, 0, 60, 20)
+        win.sel_idx = 1
+        win.selected_char = win.chars[1]
+        with mock.patch.object(win, "draw_frame", return_value=0), mock.patch.object(
+            self.mod, "safe_addstr"
+        ) as safe_addstr, mock.patch.object(self.mod, "safe_addlines") as safe_addlines, mock.patch.object(
+            self.mod, "theme_attr", return_value=7
+        ):
+            win.draw(None)
+
+        bx, by, bw, bh = win.body_rect()
+        texts = [(c.args[1], c.args[2], c.args[3]) for c in safe_addstr.call_args_list]
+        self.assertIn((by + 1, bx, "    !  \"  #  $  %  &  '  (  )  *  + "), texts)
+        self.assertIn((by + 1, bx + 3, " ! "), texts)
+        self.assertFalse(any(text == "\u2502" for _, _, text in texts))
+        safe_addlines.assert_called_once_with(None, by, bx + bw - 21, ("\u2502",) * (bh - 1), 7)
+        self.assertIs(win._cell_table(), win._cell_table())
+
+    def test_block_switch_reuses_prebuilt_char_tuples(self):
+        win = self.mod.CharacterMapWindow(0, 0, 60, 20)
+        win.execute_action("block_9")
+        self.assertIs(win.chars, self.mod._BLOCK_CHARS[9])
+        self.assertEqual(win.chars[0], "\u2500")
+        self.assertEqual(len(win.chars), 0x80)
+
+    def test_char_name_parts_wrap_and_cap_at_three_lines(self):
+        parts = self.mod._char_name_parts("\u2551")
+        self.assertEqual("".join(parts), "BOX DRAWINGS DOUBLE VERTICAL")
+        self.assertTrue(all(len(p) <= 18 for p in parts))
+        self.assertEqual(self.mod._char_name_parts("\x00"), ("UNKNOWN",))
+        long_name = self.mod._char_name_parts("\u22F3")  # 56-char name
+        self.assertEqual(len(long_name), 3)
+        self.assertEqual(long_name[-1], "OF HORIZONTAL STRO")
+
+    def test_cell_table_offsets_follow_variable_length_cells(self):
+        win = self.mod.CharacterMapWindow(0, 0, 60, 20)
+        win.execute_action("block_12")  # Dingbats has wide cells
+        text, offsets = win._cell_table()
+        self.assertEqual(len(offsets), len(win.chars) + 1)
+        self.assertEqual(offsets[-1], len(text))
+        idx = win.chars.index("\u2705")
+        self.assertEqual(text[offsets[idx]:offsets[idx + 1]], " \u2705")
+        self.assertEqual(text[offsets[idx + 1]:offsets[idx + 2]], self.mod._cell_text(win.chars[idx + 1]))
+
+    def test_click_reuses_cached_grid_dims_after_move(self):
+        win = self.mod.CharacterMapWindow(0, 0, 60, 20)
+        cols, _ = win._grid_dims()
+        win.x, win.y = 5, 3
+        bx, by, _, _ = win.body_rect()
+        with mock.patch.object(win, "_get_grid_dims", wraps=win._get_grid_dims) as get_dims:
+            info = win.handle_click(bx + 3 * 2, by + 2)
+        get_dims.assert_not_called()
+        self.assertEqual(info["index"], cols + 2)
+
+    def test_key_table_routes_navigation_and_copy(self):
+        win = self.mod.CharacterMapWindow(0, 0, 60, 20)
+        curses = sys.modules["curses"]
+        self.assertIsNone(win.handle_key(ord("x")))
+        win.handle_key(curses.KEY_RIGHT)
+        self.assertEqual((win.sel_idx, win.selected_char), (1, "!"))
+        win.handle_key(curses.KEY_NPAGE)
+        self.assertGreater(win.sel_idx, 1)
+        win.handle_key(curses.KEY_PPAGE)
+        self.assertEqual(win.sel_idx, 0)
+        dims = win._grid_dims()
+        self.assertIs(win._grid_dims(), dims)
+        win.w += 9
+        self.assertEqual(win._grid_dims(), (dims[0] + 3, dims[1]))
+        with mock.patch.object(self.mod, "copy_text") as copy_text, mock.patch.object(self.mod, "pyperclip", None):
+            win.handle_key(ord("H"))
+            win.handle_key(ord("c"))
+        self.assertEqual([c.args[0] for c in copy_text.call_args_list], ["U+0020", " "])
+        win.handle_key(curses.KEY_LEFT)  # already at the first cell
+        self.assertEqual(win.selected_char, " ")
+
+    def test_cell_text_keeps_three_columns(self):
+        self.assertEqual(self.mod._cell_text("A"), " A ")
+        self.assertEqual(self.mod._cell_text("\u0301"), " \u0301  ")
+        self.assertEqual(self.mod._cell_text("\u2705"), " \u2705")
+        self.assertEqual(self.mod._cell_text("\x7f"), "   ")
@@ -54,3 +54,53 @@ class ClipboardViewerTests(unittest.TestCase):
         # Clear via key
         win.handle_key(ord('c'))
         self.assertFalse(self.clip.has_clipboard_text())
+
+    def test_draw_pads_rows_and_stops_at_body_height(self):
+        win = self.mod.ClipboardViewerWindow(0, 0, 40, 12)
+        bx, by, bw, bh = win.body_rect()
+        win.history = ["x" * (bw + 5)] + [f"item{i}" for i in range(bh + 3)]
+        with mock.patch.object(win, "_refresh_from_clipboard"), mock.patch.object(
+            win, "draw_frame", return_value=0
+        ), mock.patch.object(self.mod, "safe_addstr") as safe_addstr, mock.patch.object(
+            self.mod, "theme_attr", return_value=0
+        ):
+            win.draw(None)
+
+        rows = [c.args[3] for c in safe_addstr.call_args_list]
+        self.assertEqual(len(rows), bh)
+        self.assertEqual(rows[0], "x" * bw)
+        self.assertEqual(rows[1], "item0".ljust(bw))
+
+    def test_refresh_is_throttled_unless_forced(self):
+        win = self.mod.ClipboardViewerWindow(0, 0, 40, 12)
+        with mock.patch.object(self.mod, "paste_text", return_value="new") as paste, mock.patch.object(
+            self.mod.time, "monotonic", side_effect=[100.0, 100.1, 100.2, 100.5]
+        ):
+            win._last_refresh = 99.9
+            win._refresh_from_clipboard()
+            paste.assert_not_called()
+            win._refresh_from_clipboard(force=True)
+            self.assertEqual(paste.call_count, 1)
+            win._refresh_from_clipboard()
+            self.assertEqual(paste.call_count, 1)
+            win._refresh_from_clipboard()
+            self.assertEqual(paste.call_count, 2)
+        self.assertEqual(win.history[0], "new")
+
+    def test_key_table_accepts_int_and_str_keys(self):
+        win = self.mod.ClipboardViewerWindow(0, 0, 40, 12)
+        win.history = ["one", "two", "three"]
+        curses = sys.modules["curses"]
+        win.handle_key("j")
+        win.handle_key(curses.KEY_DOWN)
+        self.assertEqual(win.selected_index, 2)
+        win.handle_key(ord("k"))
+        self.assertEqual(win.selected_index, 1)
+        with mock.patch.object(self.mod, "copy_text") as copy_text, mock.patch.object(self.mod, "pyperclip", None):
+            win.handle_key("\n")
+        copy_text.assert_called_once_with("two")
+        self.assertIsNone(win.handle_key("x"))
+        with mock.patch.object(self.mod, "clear_clipboard") as clear:
+            win.handle_key("c")
+        clear.assert_called_once_with()
+        self.assertEqual((win.history, win.selected_index), ([], 0))
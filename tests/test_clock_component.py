@@ -160,6 +160,56 @@ class ClockComponentTests(unittest.TestCase):
         self.assertTrue(any("top:" in text for text in rendered))
         self.assertTrue(any("week:" in text for text in rendered))
 
+    def test_draw_rebuilds_static_rows_only_when_day_or_toggle_changes(self):
+        win = self._make_window()
+        times = [
+            datetime(2026, 2, 16, 10, 15, 30),
+            datetime(2026, 2, 16, 10, 15, 31),
+            datetime(2026, 2, 17, 0, 0, 0),
+        ]
+
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(self.clock_mod, "safe_addstr") as safe_addstr,
+            mock.patch.object(self.clock_mod, "theme_attr", return_value=0),
+            mock.patch.object(self.clock_mod, "datetime") as fake_datetime,
+            mock.patch.object(win, "_month_lines", wraps=win._month_lines) as month_lines,
+        ):
+            for now in times[:2]:
+                fake_datetime.now.return_value = now
+                win.draw(None)
+            self.assertEqual(month_lines.call_count, 1)
+            rendered = [str(call.args[3]) for call in safe_addstr.call_args_list]
+            self.assertTrue(any("10:15:31" in text for text in rendered))
+            self.assertEqual(sum("February 2026" in text for text in rendered), 2)
+
+            win.handle_key(ord("s"))
+            win.draw(None)
+            self.assertEqual(month_lines.call_count, 2)
+
+            fake_datetime.now.return_value = times[2]
+            win.draw(None)
+            self.assertEqual(month_lines.call_count, 3)
+
+    def test_draw_blits_cached_body_then_writes_time_row(self):
+        win = self._make_window()
+        calls = []
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(win, "_blit_ops", side_effect=lambda *a: calls.append("blit") or True),
+            mock.patch.object(
+                self.clock_mod, "safe_addstr", side_effect=lambda *a: calls.append(a[3])
+            ),
+            mock.patch.object(self.clock_mod, "theme_attr", return_value=0),
+            mock.patch.object(self.clock_mod, "datetime") as fake_datetime,
+        ):
+            fake_datetime.now.return_value = datetime(2026, 2, 16, 10, 15, 30)
+            win.draw(None)
+
+        self.assertEqual(calls[0], "blit")
+        self.assertEqual(len(calls), 2)
+        self.assertIn("10:15:30", calls[1])
+
     def test_month_lines_respect_first_weekday_toggle(self):
         win = self._make_window()
         now = datetime(2026, 2, 16, 10, 15, 30)
@@ -170,6 +220,7 @@ class ClockComponentTests(unittest.TestCase):
         win.week_starts_sunday = True
         sunday_lines = win._month_lines(now)
         self.assertTrue(any(line.strip().startswith("Su Mo") for line in sunday_lines))
+        self.assertIs(win._month_lines(now), sunday_lines)
 
     def test_execute_action_and_menu_delegation(self):
         win = self._make_window()
@@ -0,0 +1,86 @@
+import importlib
+import sys
+import unittest
+from unittest import mock
+
+from _support import make_fake_curses
+
+
+class ControlPanelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._prev_curses = sys.modules.get("curses")
+        sys.modules["curses"] = make_fake_curses()
+
+        for mod_name in (
+            "retrotui.apps.control_panel",
+            "retrotui.ui.window",
+            "retrotui.utils",
+        ):
+            sys.modules.pop(mod_name, None)
+
+        cls.mod = importlib.import_module("retrotui.apps.control_panel")
+        cls.curses = sys.modules["curses"]
+
+    @classmethod
+    def tearDownClass(cls):
+        for mod_name in (
+            "retrotui.apps.control_panel",
+            "retrotui.ui.window",
+            "retrotui.utils",
+        ):
+            sys.modules.pop(mod_name, None)
+        if cls._prev_curses is not None:
+            sys.modules["curses"] = cls._prev_curses
+        else:
+            sys.modules.pop("curses", None)
+
+    def _make_window(self):
+        app = mock.Mock()
+        app.theme_name = "win31"
+        app.default_show_hidden = False
+        app.default_word_wrap = False
+        app.config.sunday_first = False
+        app.config.show_welcome = True
+        return self.mod.ControlPanelWindow(0, 0, 60, 18, app)
+
+    def _draw(self, win):
+        with (
+            mock.patch.object(win, "draw_frame", return_value=0),
+            mock.patch.object(self.mod, "safe_addstr") as safe_addstr,
+            mock.patch.object(self.mod, "theme_attr", return_value=0),
+        ):
+            win.draw(None)
+        return [call.args[3] for call in safe_addstr.call_args_list]
+
+    def test_enter_cycles_theme_through_index_map(self):
+        win = self._make_window()
+        self.assertEqual(win._theme_index[win._themes[1].key], 1)
+        win.handle_key(10)
+        self.assertEqual(win.theme_name, win._themes[1].key)
+        win.app.apply_theme.assert_called_once_with(win._themes[1].key)
+        win.app.persist_config.assert_called_once_with()
+
+    def test_draw_rebuilds_body_only_when_an_option_changes(self):
+        win = self._make_window()
+        win.selected_cat = 1
+        with mock.patch.object(win, "_body_ops", wraps=win._body_ops) as body_ops:
+            first = self._draw(win)
+            self.assertEqual(self._draw(win), first)
+            self.assertEqual(body_ops.call_count, 1)
+            self.assertIn("[ ] Show hidden files", first)
+
+            win.handle_key(ord(" "))
+            rendered = self._draw(win)
+            self.assertEqual(body_ops.call_count, 2)
+            self.assertIn("[x] Show hidden files", rendered)
+
+    def test_system_pane_shows_package_version(self):
+        win = self._make_window()
+        win.selected_cat = 3
+        version = sys.modules["retrotui"].__version__
+        self.assertIn(f"RetroTUI Version: {version}", self._draw(win))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -793,6 +793,19 @@ class CoreAppTests(unittest.TestCase):
         init_colors.assert_called_once_with(app.theme)
         self.assertEqual(app.theme_name, "hacker")
 
+    def test_apply_theme_marks_open_windows_dirty(self):
+        app = self._make_app()
+        win = mock.Mock()
+        app.windows = [win, types.SimpleNamespace()]
+
+        with (
+            mock.patch.object(self.app_mod, "get_theme", return_value=types.SimpleNamespace(key="hacker")),
+            mock.patch.object(self.app_mod, "init_colors"),
+        ):
+            app.apply_theme("hacker")
+
+        win.mark_dirty.assert_called_once_with()
+
     def test_apply_preferences_updates_defaults_and_open_windows(self):
         app = self._make_app()
         app.default_show_hidden = False
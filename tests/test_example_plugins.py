@@ -0,0 +1,696 @@
+import importlib.util
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from _support import make_fake_curses
+
+sys.modules['curses'] = make_fake_curses()
+
+
+class _Screen:
+    def __init__(self, h=40, w=120):
+        self.h = h
+        self.w = w
+        self.calls = []
+
+    def getmaxyx(self):
+        return (self.h, self.w)
+
+    def addnstr(self, y, x, text, n, attr=0):
+        self.calls.append((y, x, text[:n], attr))
+
+
+def _load(plugin_id):
+    """Import an example plugin, returning (Plugin class, plugin module)."""
+    init_path = Path(__file__).resolve().parents[1] / 'examples' / 'plugins' / plugin_id / '__init__.py'
+    spec = importlib.util.spec_from_file_location(f"retrotui_plugin_{plugin_id}", init_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Plugin, module
+
+
+def _utils_of(mod):
+    """Return the retrotui.utils module the plugin's ThrottledJsonWriter writes through."""
+    return sys.modules[mod.ThrottledJsonWriter.__module__]
+
+
+def _texts(scr):
+    return [text for (_, _, text, _) in scr.calls]
+
+
+def _life_rows(inst, w, h):
+    scr = _Screen()
+    inst.draw_content(scr, 0, 0, w, h)
+    return _texts(scr)
+
+
+class _TempHomeMixin:
+    """Run each test with a fresh temporary directory as $HOME."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        patcher = mock.patch.dict(os.environ, {'HOME': tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class GameOfLifeTests(unittest.TestCase):
+    def _load_backend(self, use_numpy):
+        app_cls, mod = _load('game-of-life')
+        if use_numpy and mod.np is None:
+            self.skipTest('numpy not installed')
+        if not use_numpy:
+            mod.np = None
+        return app_cls, mod
+
+    def test_blinker_oscillates(self):
+        for use_numpy in (True, False):
+            with self.subTest(use_numpy=use_numpy):
+                app_cls, mod = self._load_backend(use_numpy)
+                inst = app_cls('Life', 0, 0, 7, 7)
+                inst._ensure_grid(5, 5)
+                for xx in (1, 2, 3):
+                    if mod.np is not None:
+                        inst.grid[2, xx] = 1
+                    else:
+                        inst.grid[2 * 5 + xx] = 1
+
+                inst._step(5, 5)
+                self.assertEqual(_life_rows(inst, 5, 5), ['     ', '  █  ', '  █  ', '  █  ', '     '])
+
+                inst._step(5, 5)
+                self.assertEqual(_life_rows(inst, 5, 5), ['     ', '     ', ' ███ ', '     ', '     '])
+
+    def test_randomize_fills_body(self):
+        for use_numpy in (True, False):
+            with self.subTest(use_numpy=use_numpy):
+                app_cls, _ = self._load_backend(use_numpy)
+                inst = app_cls('Life', 0, 0, 22, 12)
+                inst.handle_key(ord('r'))
+                rows = _life_rows(inst, 20, 10)
+                self.assertEqual(len(rows), 10)
+                self.assertTrue(all(len(r) == 20 and set(r) <= {' ', '█'} for r in rows))
+
+    def test_resize_keeps_overlap(self):
+        for use_numpy in (True, False):
+            with self.subTest(use_numpy=use_numpy):
+                app_cls, mod = self._load_backend(use_numpy)
+                inst = app_cls('Life', 0, 0, 7, 7)
+                inst._ensure_grid(4, 3)
+                if mod.np is not None:
+                    inst.grid[1, 2] = 1
+                else:
+                    inst.grid[1 * 4 + 2] = 1
+                self.assertEqual(_life_rows(inst, 6, 4), ['      ', '  █   ', '      ', '      '])
+
+
+class MatrixRainTests(unittest.TestCase):
+    def test_reuses_rows_within_frame_interval(self):
+        app_cls, mod = _load('matrix-rain')
+        inst = app_cls('Rain', 0, 0, 22, 12)
+        clock = [100.0]
+        calls = []
+        real_next = inst._next_frame
+        inst._next_frame = lambda w, h: calls.append((w, h)) or real_next(w, h)
+
+        with mock.patch.object(mod.time, 'monotonic', lambda: clock[0]):
+            inst.draw_content(_Screen(), 0, 0, 20, 10)
+            clock[0] += mod.FRAME_INTERVAL / 2
+            scr = _Screen()
+            inst.draw_content(scr, 0, 0, 20, 10)
+            self.assertEqual(calls, [(20, 10)])
+            # Cached rows are still written: the host erases the screen every frame.
+            self.assertEqual(len(scr.calls), 10)
+
+            clock[0] += mod.FRAME_INTERVAL
+            inst.draw_content(_Screen(), 0, 0, 20, 10)
+        self.assertEqual(len(calls), 2)
+
+    def test_frame_shape(self):
+        for use_numpy in (True, False):
+            with self.subTest(use_numpy=use_numpy):
+                app_cls, mod = _load('matrix-rain')
+                if use_numpy and mod.np is None:
+                    self.skipTest('numpy not installed')
+                if not use_numpy:
+                    mod.np = None
+                inst = app_cls('Rain', 0, 0, 22, 12)
+                inst._ensure(20, 10)
+                rows = inst._next_frame(20, 10)
+                self.assertEqual(len(rows), 10)
+                self.assertTrue(all(len(r) == 20 for r in rows))
+                self.assertTrue(all(33 <= ord(ch) < 127 for r in rows for ch in r if ch != ' '))
+                self.assertTrue(all(c >= 0 for c in inst.cols))
+
+
+class DiskUsageTests(_TempHomeMixin, unittest.TestCase):
+    def test_scans_in_background(self):
+        app_cls, _ = _load('disk-usage')
+        (self.tmp / 'small.txt').write_bytes(b'x' * 10)
+        sub = self.tmp / 'sub'
+        sub.mkdir()
+        (sub / 'a.bin').write_bytes(b'x' * 100)
+        (sub / 'b.bin').write_bytes(b'x' * 50)
+        (sub / 'nested').mkdir()
+
+        inst = app_cls('Disk', 0, 0, 40, 10, path=str(self.tmp))
+        inst.scan_thread.join(timeout=5)
+
+        self.assertFalse(inst.scanning)
+        self.assertEqual(inst.entries, [('sub', 150, '150.0B'), ('small.txt', 10, '10.0B')])
+
+    def test_human_sizes(self):
+        _, mod = _load('disk-usage')
+        self.assertEqual(mod._human(0), '0.0B')
+        self.assertEqual(mod._human(1023), '1023.0B')
+        self.assertEqual(mod._human(1024), '1.0K')
+        self.assertEqual(mod._human(1536 * 1024), '1.5M')
+        self.assertEqual(mod._human(3 << 50), '3.0P')
+        self.assertEqual(mod._human(5 << 60), '5120.0P')
+
+
+class DbBrowserTests(_TempHomeMixin, unittest.TestCase):
+    def test_reuses_connection_and_caches_rows(self):
+        db = self.tmp / 'demo.db'
+        con = sqlite3.connect(db)
+        con.execute('CREATE TABLE people (id INTEGER, name TEXT)')
+        con.execute("INSERT INTO people VALUES (1, 'ada')")
+        con.commit()
+        con.close()
+
+        app_cls, _ = _load('db-browser')
+        inst = app_cls('DB', 0, 0, 60, 12, path=str(db))
+        self.addCleanup(inst.close)
+        self.assertEqual(inst.tables, ['people'])
+        first_con = inst._con
+
+        inst.handle_key(ord('o'))
+        self.assertEqual(inst.rows, ['id, name', '1, ada'])
+        self.assertIs(inst._con, first_con)
+        self.assertIn('people', inst._rows_cache)
+
+        inst.handle_key(ord('r'))
+        self.assertEqual(inst._rows_cache, {})
+        self.assertIs(inst._con, first_con)
+
+        inst.close()
+        self.assertIsNone(inst._con)
+
+
+class NetworkMonitorTests(unittest.TestCase):
+    def test_parses_net_dev_bytes(self):
+        _, mod = _load('network-monitor')
+        raw = (
+            b'Inter-|   Receive                            |  Transmit\n'
+            b' face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets\n'
+            b'    lo:    1200      10    0    0    0     0          0         0     3400      10    0    0    0     0       0          0\n'
+            b'  eth0: 5000 1 0 0 0 0 0 0 6000 2 0 0 0 0 0 0\n'
+            b'garbage line\n'
+        )
+        self.assertEqual(mod._parse_net_dev(raw), {b'lo': (1200, 3400), b'eth0': (5000, 6000)})
+
+
+class CronEditorTests(unittest.TestCase):
+    def test_loads_in_background_and_keeps_appends(self):
+        app_cls, mod = _load('cron-editor')
+        mod.which_cached = lambda cmd: '/usr/bin/' + cmd
+        mod._read_crontab = lambda: ['@daily backup']
+        inst = app_cls('Cron', 0, 0, 60, 10)
+        inst._pending.result(timeout=5)
+        inst.lines.append('0 0 * * * /usr/bin/true')
+
+        inst._poll()
+
+        self.assertIsNone(inst._pending)
+        self.assertEqual(inst.lines, ['@daily backup', '0 0 * * * /usr/bin/true'])
+
+
+class GitStatusTests(unittest.TestCase):
+    def test_applies_result_on_draw(self):
+        app_cls, mod = _load('git-status')
+        mod.which_cached = lambda cmd: '/usr/bin/git'
+        mod._read_info = lambda repo: ['Branch: main', 'abc123 init']
+        inst = app_cls('Git', 0, 0, 60, 10)
+        self.assertEqual(inst.info, ['Loading...'])
+        inst._pending.result(timeout=5)
+
+        scr = _Screen()
+        inst.draw_content(scr, 0, 0, 40, 5)
+
+        self.assertEqual(_texts(scr), ['Branch: main', 'abc123 init'])
+
+
+class JsonViewerTests(_TempHomeMixin, unittest.TestCase):
+    def test_render_layout(self):
+        _, mod = _load('json-viewer')
+        data = {'name': 'x', 'items': [{'id': 1}, 2, [3]], 'meta': {'deep': {'k': None}}, 'empty': {}}
+        self.assertEqual(mod._render(data), [
+            'name: x',
+            'items:',
+            '  - [0]',
+            '    id: 1',
+            '  - [1]',
+            '    2',
+            '  - [2]',
+            '    - [0]',
+            '      3',
+            'meta:',
+            '  deep:',
+            '    k: None',
+            'empty:',
+        ])
+        self.assertEqual(mod._render(5), ['5'])
+
+    def test_reload_skips_unchanged_file(self):
+        app_cls, mod = _load('json-viewer')
+        path = self.tmp / 'data.json'
+        path.write_text('{"a": 1}', encoding='utf-8')
+        inst = app_cls('JSON', 0, 0, 40, 10, path=str(path))
+        self.assertEqual(inst.lines, ['a: 1'])
+
+        calls = []
+        mod._render = lambda data: calls.append(data) or ['x']
+        inst.handle_key(ord('r'))
+        self.assertEqual(calls, [])
+
+
+class ContactsTests(_TempHomeMixin, unittest.TestCase):
+    def test_coalesces_saves_and_flushes_on_close(self):
+        app_cls, mod = _load('contacts')
+        writes = []
+        utils = _utils_of(mod)
+        real_write = utils.write_json_atomic
+        with mock.patch.object(utils, 'write_json_atomic', lambda p, d: writes.append(len(d)) or real_write(p, d)):
+            inst = app_cls('Contacts', 0, 0, 40, 10)
+
+            for _ in range(3):
+                inst.handle_key(ord('a'))
+            self.assertEqual(writes, [1])
+
+            inst.close()
+        self.assertEqual(writes, [1, 3])
+        path = self.tmp / '.config' / 'retrotui' / 'contacts.json'
+        self.assertEqual(len(json.loads(path.read_text(encoding='utf-8'))), 3)
+
+    def test_rows_rebuilt_only_after_changes(self):
+        app_cls, _ = _load('contacts')
+        inst = app_cls('Contacts', 0, 0, 40, 10)
+        inst.handle_key(ord('a'))
+        rows = inst._rows()
+        inst.handle_key(ord('j'))
+        self.assertIs(inst._rows(), rows)
+        inst.handle_key(ord('e'))
+        self.assertEqual(inst._rows(), ['New [edited]  '])
+
+
+class FortuneCookieTests(_TempHomeMixin, unittest.TestCase):
+    def test_index_is_cached(self):
+        app_cls, mod = _load('fortune-cookie')
+        fortunes = self.tmp / 'fortunes'
+        fortunes.mkdir()
+        (fortunes / 'wisdom').write_bytes(b'first line\n\n  \nsecond line\n')
+        mod.FORTUNE_DIRS = (str(fortunes), str(self.tmp / 'missing'))
+
+        inst = app_cls('Fortune', 0, 0, 40, 10)
+        self.assertEqual(inst._index, [[str(fortunes / 'wisdom'), [[0, 11], [15, 12]]]])
+        self.assertIn(inst.fortune, ('first line', 'second line'))
+        self.assertTrue((self.tmp / '.cache' / 'retrotui' / 'fortunes.json').exists())
+
+        def _fail(path):
+            raise AssertionError('index should come from cache')
+
+        mod._line_spans = _fail
+        self.assertEqual(mod._build_index(), inst._index)
+
+
+class AsciiAquariumTests(unittest.TestCase):
+    def test_composes_bubbles_and_fish(self):
+        app_cls, mod = _load('ascii-aquarium')
+        inst = app_cls('Aquarium', 0, 0, 60, 12)
+        inst.seed = 0
+        with mock.patch.object(mod.time, 'time', lambda: 10.0):
+            scr = _Screen()
+            inst.draw_content(scr, 0, 0, 50, 10)
+            rows = _texts(scr)
+            t = 20
+            expected = [
+                ''.join('o' if (col + row + t) % 23 == 0 else ' ' for col in range(50))
+                for row in range(10)
+            ]
+            for i, (cx, fish) in enumerate([(10, '<><'), (20, '><>'), (30, '<><')]):
+                ry = i * 2 + 1
+                expected[ry] = expected[ry][:cx] + fish + expected[ry][cx + 3:]
+            self.assertEqual(rows, expected)
+
+            # fish are clipped to the body instead of spilling past its edges
+            scr = _Screen()
+            inst.draw_content(scr, 0, 0, 31, 2)
+            rows = _texts(scr)
+        self.assertEqual([len(r) for r in rows], [31, 31])
+        self.assertEqual(rows[1][29:], '<>')
+
+
+class RssReaderTests(unittest.TestCase):
+    def test_parses_atom_and_rss_titles(self):
+        atom = (
+            b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            b'<title>Feed</title><entry><title>One</title><id>1</id></entry>'
+            b'<entry><id>2</id><title>Two</title></entry></feed>'
+        )
+        rss = (
+            b'<rss><channel><title>Chan</title><item><title>A</title></item>'
+            b'<item><title/></item><item><link>x</link></item></channel></rss>'
+        )
+        for use_lxml in (True, False):
+            with self.subTest(use_lxml=use_lxml):
+                _, mod = _load('rss-reader')
+                if use_lxml and mod.lxml_etree is None:
+                    self.skipTest('lxml not installed')
+                if not use_lxml:
+                    mod.lxml_etree = None
+                self.assertEqual(mod._parse_titles(atom), [{'title': 'One'}, {'title': 'Two'}])
+                self.assertEqual(mod._parse_titles(rss), [{'title': 'A'}, {'title': ''}])
+
+    def test_refresh_runs_in_background(self):
+        app_cls, mod = _load('rss-reader')
+        mod._fetch_titles = lambda url: [{'title': 'Fresh'}]
+        inst = app_cls('RSS', 0, 0, 40, 5)
+        inst.selected = 0
+        inst.handle_key(ord('r'))
+        inst._pending.result(timeout=5)
+
+        scr = _Screen()
+        inst.draw_content(scr, 0, 0, 30, 3)
+        # the block is written once, then the selected row again highlighted
+        self.assertEqual([(y, text) for (y, _, text, _) in scr.calls], [(0, 'Fresh'), (0, 'Fresh')])
+
+
+class WeatherWidgetTests(unittest.TestCase):
+    def test_fetches_in_background(self):
+        app_cls, mod = _load('weather-widget')
+        calls = []
+
+        def fetch(location):
+            calls.append(location)
+            return 'Sunny +20C'
+
+        mod._fetch_summary = fetch
+        inst = app_cls('Weather', 0, 0, 40, 5)
+        scr = _Screen()
+        inst.draw_content(scr, 0, 0, 30, 3)
+        self.assertEqual(scr.calls[0][2], 'Weather: N/A')
+        inst._pending.result(timeout=5)
+
+        scr = _Screen()
+        inst.draw_content(scr, 0, 0, 30, 3)
+        self.assertEqual(scr.calls[0][2], 'Sunny +20C')
+        self.assertIsNone(inst._pending)
+        self.assertEqual(calls, ['auto'])
+
+    def test_backs_off_after_failure(self):
+        app_cls, mod = _load('weather-widget')
+        calls = []
+
+        def fetch(location):
+            calls.append(location)
+            raise OSError('offline')
+
+        mod._fetch_summary = fetch
+        inst = app_cls('Weather', 0, 0, 40, 5)
+        inst.draw_content(_Screen(), 0, 0, 30, 3)
+        inst._pending.exception(timeout=5)
+
+        inst.draw_content(_Screen(), 0, 0, 30, 3)
+        inst.draw_content(_Screen(), 0, 0, 30, 3)
+        self.assertIsNone(inst._pending)
+        self.assertEqual(inst.summary, 'Weather: N/A')
+        self.assertEqual(calls, ['auto'])
+
+    def test_schedules_next_fetch_on_monotonic_clock(self):
+        app_cls, mod = _load('weather-widget')
+        clock = [10**12]
+        calls = []
+        mod._fetch_summary = lambda loc: calls.append(loc) or 'Rain'
+        with mock.patch.object(mod.time, 'monotonic_ns', lambda: clock[0]):
+            inst = app_cls('Weather', 0, 0, 40, 5)
+
+            inst.draw_content(_Screen(), 0, 0, 30, 3)
+            inst._pending.result(timeout=5)
+            inst.draw_content(_Screen(), 0, 0, 30, 3)
+            self.assertEqual(inst._next_fetch_ns, clock[0] + mod.REFRESH_INTERVAL_NS)
+
+            clock[0] += mod.REFRESH_INTERVAL_NS - 1
+            inst.draw_content(_Screen(), 0, 0, 30, 3)
+            self.assertEqual(len(calls), 1)
+            self.assertIsNone(inst._pending)
+            clock[0] += 1
+            inst.draw_content(_Screen(), 0, 0, 30, 3)
+            inst._pending.result(timeout=5)
+        self.assertEqual(len(calls), 2)
+
+
+class SystemMonitorTests(_TempHomeMixin, unittest.TestCase):
+    def test_parses_meminfo_head(self):
+        _, mod = _load('system-monitor')
+        raw = b'MemTotal:        2048 kB\nMemFree:          512 kB\nMemAvailable:    1024 kB\nBuffers: 1 kB\n'
+        self.assertEqual(mod._parse_meminfo(raw), (2048 * 1024, 1024 * 1024, 1024 * 1024))
+        no_avail = b'MemTotal: 100 kB\nMemFree: 40 kB\n'
+        self.assertEqual(mod._parse_meminfo(no_avail), (100 * 1024, 60 * 1024, 40 * 1024))
+
+    def test_samples_once_per_interval(self):
+        app_cls, mod = _load('system-monitor')
+        inst = app_cls('Sys', 0, 0, 60, 10)
+        self.addCleanup(inst.close)
+        calls = []
+        inst._sample = lambda: calls.append(1) or ['Load avg: 0.00 0.00 0.00']
+        clock = [100.0]
+        with mock.patch.object(mod.time, 'monotonic', lambda: clock[0]):
+            inst.draw_content(_Screen(), 0, 0, 40, 5)
+            inst.draw_content(_Screen(), 0, 0, 40, 5)
+            self.assertEqual(len(calls), 1)
+            clock[0] += mod.SAMPLE_INTERVAL
+            inst.draw_content(_Screen(), 0, 0, 40, 5)
+            self.assertEqual(len(calls), 2)
+            inst.handle_key(ord('r'))
+            inst.draw_content(_Screen(), 0, 0, 40, 5)
+        self.assertEqual(len(calls), 3)
+
+    def test_keeps_proc_fds_until_close(self):
+        app_cls, mod = _load('system-monitor')
+        meminfo = self.tmp / 'meminfo'
+        uptime = self.tmp / 'uptime'
+        meminfo.write_bytes(b'MemTotal: 4096 kB\nMemFree: 1024 kB\nMemAvailable: 2048 kB\n')
+        uptime.write_bytes(b'123.45 678.90\n')
+        mod._MEMINFO = str(meminfo)
+        mod._UPTIME = str(uptime)
+        inst = app_cls('Sys', 0, 0, 60, 10)
+        self.addCleanup(inst.close)
+        self.assertEqual(inst._read_mem(), (4096 * 1024, 2048 * 1024, 2048 * 1024))
+
+        uptime.write_bytes(b'200.00 678.90\n')
+        self.assertEqual(inst._read_uptime(), 200)
+
+        inst.close()
+        self.assertIsNone(inst._fd_meminfo)
+        self.assertIsNone(inst._fd_uptime)
+        self.assertIsNone(inst._read_mem())
+        self.assertIsNone(inst._read_uptime())
+
+
+class ServiceManagerTests(unittest.TestCase):
+    def test_parses_units(self):
+        _, mod = _load('service-manager')
+        out = (
+            b'  cron.service  loaded active running Regular background program\n'
+            b'\xe2\x97\x8f foo.service not-found inactive dead foo.service\n'
+            b'short line\n'
+            b'ssh.service loaded inactive dead\n'
+        )
+        self.assertEqual(mod._parse_units(out), [
+            ('cron.service', 'loaded', 'active', 'running'),
+            ('foo.service', 'not-found', 'inactive', 'dead'),
+            ('ssh.service', 'loaded', 'inactive', 'dead'),
+        ])
+
+    def test_prefers_json_listing(self):
+        _, mod = _load('service-manager')
+        calls = []
+
+        def check_output(cmd, stderr=None):
+            calls.append(cmd)
+            return b'[{"unit": "cron.service", "load": "loaded", "active": "active", "sub": "running"}]'
+
+        with mock.patch.object(mod.subprocess, 'check_output', check_output):
+            self.assertEqual(mod._list_units(), [('cron.service', 'loaded', 'active', 'running')])
+        self.assertEqual(calls[-1][-1], '--output=json')
+        self.assertIs(mod._json_supported, True)
+
+    def test_falls_back_to_text_listing(self):
+        _, mod = _load('service-manager')
+        calls = []
+
+        def check_output(cmd, stderr=None):
+            calls.append(cmd)
+            if '--output=json' in cmd:
+                raise mod.subprocess.CalledProcessError(1, cmd)
+            return b'ssh.service loaded inactive dead OpenSSH\n'
+
+        with mock.patch.object(mod.subprocess, 'check_output', check_output):
+            self.assertEqual(mod._list_units(), [('ssh.service', 'loaded', 'inactive', 'dead')])
+            self.assertEqual(mod._list_units(), [('ssh.service', 'loaded', 'inactive', 'dead')])
+        # JSON is only attempted once
+        self.assertEqual(sum('--output=json' in c for c in calls), 1)
+
+
+class NotePluginsTests(_TempHomeMixin, unittest.TestCase):
+    def test_coalesce_saves_and_flush_on_close(self):
+        for plugin_id, filename, count in (
+            ('sticky-notes', 'sticky-notes.json', 4),
+            ('todo-list', 'todo-list.json', 3),
+        ):
+            with self.subTest(plugin=plugin_id):
+                app_cls, mod = _load(plugin_id)
+                writes = []
+                utils = _utils_of(mod)
+                real_write = utils.write_json_atomic
+                with mock.patch.object(utils, 'write_json_atomic', lambda p, d: writes.append(1) or real_write(p, d)):
+                    inst = app_cls('Notes', 0, 0, 40, 10)
+
+                    for _ in range(3):
+                        inst.handle_key(ord('a'))
+                    self.assertEqual(len(writes), 1)
+
+                    inst.close()
+                self.assertEqual(len(writes), 2)
+                config = self.tmp / '.config' / 'retrotui'
+                data = json.loads((config / filename).read_text(encoding='utf-8'))
+                items = data['lines'] if plugin_id == 'sticky-notes' else data
+                self.assertEqual(len(items), count)
+                self.assertEqual(list(config.glob('*.tmp')), [])
+
+
+class TodoListTests(_TempHomeMixin, unittest.TestCase):
+    def test_draws_block_then_selected_row(self):
+        app_cls, _ = _load('todo-list')
+        inst = app_cls('Todo', 0, 0, 40, 10)
+        inst.todos = [
+            {'text': 'one', 'done': False, 'priority': 'H'},
+            {'text': 'two', 'done': True, 'priority': 'L'},
+        ]
+        inst.selected = 1
+        scr = _Screen()
+        inst.draw_content(scr, 2, 3, 30, 5)
+        self.assertEqual([(y, x, text) for (y, x, text, _) in scr.calls], [
+            (3, 2, 'H [ ] one'),
+            (4, 2, 'L [x] two'),
+            (4, 2, 'L [x] two'),
+        ])
+
+    def test_navigation_tracks_last_index(self):
+        app_cls, _ = _load('todo-list')
+        inst = app_cls('Todo', 0, 0, 40, 10)
+        inst.handle_key(ord('j'))
+        self.assertEqual(inst.selected, 0)
+        for _ in range(3):
+            inst.handle_key(ord('a'))
+        for key in (ord('j'), 258, 258, 258):
+            inst.handle_key(key)
+        self.assertEqual(inst.selected, 2)
+        inst.handle_key(ord('d'))
+        self.assertEqual(inst.selected, 1)
+        self.assertEqual(inst._last_idx, 1)
+        for key in (259, ord('k'), 259):
+            inst.handle_key(key)
+        self.assertEqual(inst.selected, 0)
+
+    def test_rows_rebuilt_only_after_changes(self):
+        app_cls, _ = _load('todo-list')
+        inst = app_cls('Todo', 0, 0, 40, 10)
+        inst.handle_key(ord('a'))
+        inst.draw_content(_Screen(), 0, 0, 30, 5)
+        rows = inst._rendered
+        inst.draw_content(_Screen(), 0, 0, 30, 5)
+        self.assertIs(inst._rendered, rows)
+
+        inst.handle_key(ord(' '))
+        scr = _Screen()
+        inst.draw_content(scr, 0, 0, 30, 5)
+        self.assertIsNot(inst._rendered, rows)
+        self.assertEqual(scr.calls[0][2], 'M [x] New task 1')
+
+        inst.draw_content(_Screen(), 0, 0, 8, 5)
+        self.assertEqual(inst._rendered, ['M [x] Ne'])
+
+    def test_cycles_priority_and_ignores_malformed_file(self):
+        data = self.tmp / '.config' / 'retrotui' / 'todo-list.json'
+        data.parent.mkdir(parents=True)
+        data.write_text('[{"text": "x", "priority": "?"}, "junk", 3]', encoding='utf-8')
+        app_cls, _ = _load('todo-list')
+        inst = app_cls('Todo', 0, 0, 40, 10)
+        self.assertEqual(inst.todos, [{'text': 'x', 'priority': 'M'}])
+        self.assertEqual(inst._last_idx, 0)
+
+        seen = []
+        for _ in range(4):
+            inst.handle_key(ord('p'))
+            seen.append(inst.todos[0]['priority'])
+        self.assertEqual(seen, ['L', 'H', 'M', 'L'])
+
+        data.write_text('{"not": "a list"}', encoding='utf-8')
+        inst = app_cls('Todo', 0, 0, 40, 10)
+        self.assertEqual(inst.todos, [])
+        for key in (ord(' '), ord('d'), ord('p'), ord('e'), ord('j')):
+            inst.handle_key(key)
+
+    def test_normalizes_malformed_rows_on_load(self):
+        data = self.tmp / '.config' / 'retrotui' / 'todo-list.json'
+        data.parent.mkdir(parents=True)
+        data.write_text(
+            '[{"text": null, "priority": ["H"], "done": true},'
+            ' {"text": 7, "priority": {"p": 1}}, {}]',
+            encoding='utf-8',
+        )
+        app_cls, _ = _load('todo-list')
+        inst = app_cls('Todo', 0, 0, 40, 10)
+        self.assertEqual(inst.todos, [
+            {'text': '', 'priority': 'M', 'done': True},
+            {'text': '7', 'priority': 'M'},
+            {'text': '', 'priority': 'M'},
+        ])
+
+        for key in (ord('e'), ord('p'), ord('j'), ord('e'), ord('p'), ord(' ')):
+            inst.handle_key(key)
+        self.assertEqual(inst.todos[0], {'text': ' (edited)', 'priority': 'L', 'done': True})
+        self.assertEqual(inst.todos[1], {'text': '7 (edited)', 'priority': 'L', 'done': True})
+        scr = _Screen()
+        inst.draw_content(scr, 0, 0, 30, 5)
+        self.assertEqual(_texts(scr)[:3], ['L [x]  (edited)', 'L [x] 7 (edited)', 'M [ ] '])
+
+
+class StickyNotesTests(_TempHomeMixin, unittest.TestCase):
+    def test_rows_rebuilt_only_after_changes(self):
+        app_cls, _ = _load('sticky-notes')
+        inst = app_cls('Notes', 0, 0, 40, 10)
+        inst.draw_content(_Screen(), 0, 0, 20, 5)
+        rows = inst._rows
+        inst.draw_content(_Screen(), 0, 0, 20, 5)
+        self.assertIs(inst._rows, rows)
+
+        inst.handle_key(ord('e'))
+        scr = _Screen()
+        inst.draw_content(scr, 0, 0, 20, 5)
+        self.assertEqual(_texts(scr), ['[edited]'])
+        inst.draw_content(_Screen(), 0, 0, 4, 5)
+        self.assertEqual(inst._rows, ['[edi'])
+
+
+if __name__ == '__main__':
+    unittest.main()
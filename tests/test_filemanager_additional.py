@@ -72,6 +72,35 @@ class FileManagerAdditionalTests(unittest.TestCase):
         self.win._draw_pane_contents(std, 0, 0, 0, 10, 5, content, 0, 1, 0, True)
         self.assertTrue(any(call[0] == 1 for call in std.calls))
 
+    def test_draw_pane_contents_writes_only_visible_rows(self):
+        std = FakeStdScr()
+        content = ['path', 'sep'] + [f'row{i}' for i in range(500)]
+        self.win._draw_pane_contents(std, 0, 0, 0, 10, 6, content, 100, 101, None, True)
+        rows = [(y, text.rstrip()) for y, _, text, _ in std.calls]
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[2:], [(2, 'row100'), (3, 'row101'), (4, 'row102'), (5, 'row103')])
+
+        std = FakeStdScr()
+        self.win._draw_pane_contents(std, 0, 0, 0, 10, 6, content[:4], 1, 0, None, True)
+        self.assertEqual([text for _, _, text, _ in std.calls][2:], ['row1      ', ' ' * 10, ' ' * 10, ' ' * 10])
+
+    def test_header_separator_is_shared_across_rebuilds(self):
+        sep = self.win.content[1]
+        self.assertEqual(sep, ' ' + '-' * (80 - self.win.HEADER_SEP_MARGIN))
+        self.win._rebuild_content()
+        self.assertIs(self.win.content[1], sep)
+
+    def test_handle_scroll_primary_pane_clamps_in_one_step(self):
+        self.win.content = [f'row{i}' for i in range(40)]
+        _, _, _, bh = self.win.body_rect()
+        self.win.scroll_offset = 0
+        self.win.handle_scroll('down', 100)
+        self.assertEqual(self.win.scroll_offset, 40 - bh)
+        self.win.handle_scroll('up', 3)
+        self.assertEqual(self.win.scroll_offset, 37 - bh)
+        self.win.handle_scroll('up', 100)
+        self.assertEqual(self.win.scroll_offset, 0)
+
     def test_set_and_navigate_bookmark(self):
         # invalid slot
         res = self.win.set_bookmark(9)
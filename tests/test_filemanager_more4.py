@@ -26,13 +26,66 @@ class FileManagerMore4Tests(unittest.TestCase):
         shutil.rmtree(self.td, ignore_errors=True)
 
     def test_build_listing_permission_error(self):
-        with mock.patch('os.listdir', side_effect=PermissionError('denied')):
+        with mock.patch('os.scandir', side_effect=PermissionError('denied')):
             self.win.current_path = '/noaccess'
             self.win._rebuild_content()
             self.assertIsNotNone(self.win.error_message)
             # content header + separator + error line -> index 2 or 3 may vary
             self.assertTrue(any('Permission denied' in s for s in self.win.content))
 
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'needs symlinks')
+    def test_build_listing_follows_symlinks_and_sorts_dirs_first(self):
+        os.mkdir(os.path.join(self.td, 'Zdir'))
+        with open(os.path.join(self.td, 'b.txt'), 'w') as fh:
+            fh.write('12345')
+        open(os.path.join(self.td, 'A.txt'), 'w').close()
+        try:
+            os.symlink(os.path.join(self.td, 'Zdir'), os.path.join(self.td, 'link'))
+            os.symlink(os.path.join(self.td, 'missing'), os.path.join(self.td, 'broken'))
+        except OSError:
+            self.skipTest('symlinks not permitted')
+        entries, _, error = self.win._build_listing(self.td)
+        self.assertIsNone(error)
+        listed = [(e.name, e.is_dir) for e in entries if e.name != '..']
+        self.assertEqual(listed, [('link', True), ('Zdir', True), ('A.txt', False), ('b.txt', False)])
+        self.assertEqual(entries[-1].size, 5)
+        self.assertEqual(entries[-1].full_path, os.path.join(self.td, 'b.txt'))
+
+    def test_listing_cache_reuses_scan_until_directory_changes(self):
+        open(os.path.join(self.td, 'a.txt'), 'w').close()
+        os.utime(self.td, ns=(10**18, 10**18))  # long past the racy window
+        self.win._listing_cache.clear()
+        with mock.patch.object(self.win, '_scan_listing', wraps=self.win._scan_listing) as scan:
+            self.win._rebuild_content()
+            self.win._rebuild_content()
+            self.assertEqual(scan.call_count, 1)
+
+            open(os.path.join(self.td, 'b.txt'), 'w').close()
+            os.utime(self.td, ns=(10**18 + 1, 10**18 + 1))
+            self.win._rebuild_content()
+            self.assertEqual(scan.call_count, 2)
+            self.assertIn('b.txt', [e.name for e in self.win.entries])
+
+            self.win._action_refresh()
+            self.assertEqual(scan.call_count, 3)
+
+    def test_listing_cache_skips_recent_directories_and_is_bounded(self):
+        self.win._listing_cache.clear()
+        os.utime(self.td, None)  # modified just now
+        self.win._rebuild_content()
+        self.assertNotIn((self.td, self.win.show_hidden), self.win._listing_cache)
+
+        with mock.patch.object(fm.FileManagerWindow, 'LISTING_CACHE_SIZE', 2):
+            for name in ('d1', 'd2', 'd3'):
+                path = os.path.join(self.td, name)
+                os.mkdir(path)
+                os.utime(path, ns=(10**18, 10**18))
+                self.win._listing(path)
+        self.assertEqual(
+            [key[0] for key in self.win._listing_cache],
+            [os.path.join(self.td, 'd2'), os.path.join(self.td, 'd3')],
+        )
+
     def test_toggle_hidden_rebuilds(self):
         # create hidden file
         open(os.path.join(self.td, '.hidden'), 'w').close()
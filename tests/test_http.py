@@ -0,0 +1,59 @@
+import importlib
+import sys
+import types
+import unittest
+from unittest import mock
+
+
+class HttpGetTests(unittest.TestCase):
+    def setUp(self):
+        sys.modules.pop("retrotui._http", None)
+        self.http = importlib.import_module("retrotui._http")
+
+    def tearDown(self):
+        sys.modules.pop("retrotui._http", None)
+
+    def test_import_does_not_load_urllib3(self):
+        with mock.patch.dict(sys.modules):
+            for name in [n for n in sys.modules if n == "urllib3" or n.startswith("urllib3.")]:
+                del sys.modules[name]
+            sys.modules.pop("retrotui._http", None)
+            mod = importlib.import_module("retrotui._http")
+            self.assertNotIn("urllib3", sys.modules)
+        self.assertIsNone(mod._http_pool)
+
+    def test_falls_back_to_urllib_without_urllib3(self):
+        resp = mock.MagicMock()
+        resp.__enter__.return_value.read.return_value = b"sunny"
+        with mock.patch.dict(sys.modules, {"urllib3": None}), \
+                mock.patch.object(self.http.urllib.request, "urlopen", return_value=resp) as urlopen:
+            self.assertEqual(self.http.http_get("https://example.test/x", timeout=3), b"sunny")
+        urlopen.assert_called_once_with("https://example.test/x", timeout=3)
+        self.assertIs(self.http._http_pool, False)
+
+    def test_reuses_urllib3_pool(self):
+        class _HTTPError(Exception):
+            pass
+
+        pool = mock.Mock()
+        pool.request.return_value = types.SimpleNamespace(status=200, data=b"feed")
+        fake_urllib3 = types.SimpleNamespace(
+            PoolManager=mock.Mock(return_value=pool),
+            Retry=mock.Mock(),
+            exceptions=types.SimpleNamespace(HTTPError=_HTTPError),
+        )
+        with mock.patch.dict(sys.modules, {"urllib3": fake_urllib3}):
+            self.assertEqual(self.http.http_get("https://example.test/a"), b"feed")
+            self.assertEqual(self.http.http_get("https://example.test/b"), b"feed")
+            fake_urllib3.PoolManager.assert_called_once()
+
+            pool.request.return_value = types.SimpleNamespace(status=503, data=b"")
+            with self.assertRaises(OSError):
+                self.http.http_get("https://example.test/a")
+            pool.request.side_effect = _HTTPError("boom")
+            with self.assertRaises(OSError):
+                self.http.http_get("https://example.test/a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,17 @@ class MenuBarTests(unittest.TestCase):
         else:
             sys.modules.pop('curses', None)
 
+    def test_filter_global_items_hides_labels_and_empty_categories(self):
+        hidden = {'exit', 'minesweeper', 'solitaire', 'snake', 'tetris'}
+        filtered = self.menu_mod.filter_global_items(hidden)
+
+        self.assertNotIn('Games', filtered)
+        file_labels = [label for label, _ in filtered['File']]
+        self.assertNotIn('Exit  Ctrl+Q', file_labels)
+        self.assertIn('Notepad', file_labels)
+        self.assertEqual(filtered['Apps'], self.menu_mod.DEFAULT_GLOBAL_ITEMS['Apps'])
+        self.assertEqual(self.menu_mod.filter_global_items(set()), self.menu_mod.DEFAULT_GLOBAL_ITEMS)
+
     def test_down_skips_separator(self):
         menu = self.menu_mod.MenuBar(
             {'File': [('Open', 'open'), ('---', None), ('Save', 'save')]}
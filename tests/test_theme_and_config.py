@@ -130,6 +130,12 @@ class ThemeAndConfigTests(unittest.TestCase):
         self.assertTrue(loaded.show_hidden)
         self.assertFalse(loaded.word_wrap_default)
 
+    def test_hidden_icon_labels_parses_once_per_value(self):
+        labels = self.config.hidden_icon_labels(" Snake, MINES ,")
+        self.assertEqual(labels, frozenset({"snake", "mines", ""}))
+        self.assertIs(self.config.hidden_icon_labels(" Snake, MINES ,"), labels)
+        self.assertEqual(self.config.hidden_icon_labels(""), frozenset())
+
     def test_serialize_and_save_config(self):
         config = self.config.AppConfig(theme="amiga", show_hidden=True, word_wrap_default=False)
         text = self.config.serialize_config(config)
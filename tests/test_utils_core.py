@@ -2,6 +2,7 @@
 import io
 import os
 import sys
+import tempfile
 import types
 import unittest
 from unittest import mock
@@ -105,6 +106,31 @@ class UtilsCoreTests(unittest.TestCase):
         # Should not raise.
         self.utils.safe_addstr(win_error, 1, 1, "hello", 0)
 
+    def test_safe_addlines_clips_rows_and_handles_errors(self):
+        win = types.SimpleNamespace(
+            getmaxyx=mock.Mock(return_value=(5, 10)),
+            addnstr=mock.Mock(),
+        )
+        self.utils.safe_addlines(win, 3, 1, ["aa", "bb", "cc"], 7)
+        self.assertEqual(
+            win.addnstr.call_args_list,
+            [mock.call(3, 1, "aa", 8, 7), mock.call(4, 1, "bb", 8, 7)],
+        )
+        win.getmaxyx.assert_called_once_with()
+
+        win.addnstr.reset_mock()
+        self.utils.safe_addlines(win, -1, 1, ["x"])
+        self.utils.safe_addlines(win, 5, 1, ["x"])
+        self.utils.safe_addlines(win, 1, 9, ["x"])
+        self.assertFalse(win.addnstr.called)
+
+        win_error = types.SimpleNamespace(
+            getmaxyx=mock.Mock(return_value=(5, 10)),
+            addnstr=mock.Mock(side_effect=self.utils.curses.error("boom")),
+        )
+        self.utils.safe_addlines(win_error, 0, 0, ["a", "b"])
+        self.assertEqual(win_error.addnstr.call_count, 2)
+
     def test_normalize_key_code_variants(self):
         self.assertEqual(self.utils.normalize_key_code(123), 123)
         self.assertEqual(self.utils.normalize_key_code("\n"), 10)
@@ -130,11 +156,24 @@ class UtilsCoreTests(unittest.TestCase):
         self.assertEqual(safe_addstr.call_count, 4)
 
     def test_check_unicode_support_handles_encoding_failures(self):
+        check = self.utils.check_unicode_support
+        check.cache_clear()
+        self.addCleanup(check.cache_clear)
         with mock.patch("retrotui.utils.locale.getpreferredencoding", return_value="utf-8"):
-            self.assertTrue(self.utils.check_unicode_support())
+            self.assertTrue(check())
 
+        check.cache_clear()
         with mock.patch("retrotui.utils.locale.getpreferredencoding", return_value="ascii"):
-            self.assertFalse(self.utils.check_unicode_support())
+            self.assertFalse(check())
+
+    def test_check_unicode_support_is_memoized(self):
+        check = self.utils.check_unicode_support
+        check.cache_clear()
+        self.addCleanup(check.cache_clear)
+        with mock.patch("retrotui.utils.locale.getpreferredencoding", return_value="utf-8") as encoding:
+            self.assertTrue(check())
+            self.assertTrue(check())
+        encoding.assert_called_once_with()
 
     def test_get_system_info_with_uname_and_meminfo(self):
         fake_uname = types.SimpleNamespace(
@@ -173,6 +212,92 @@ class UtilsCoreTests(unittest.TestCase):
         self.assertIn("Terminal: unknown", joined)
         self.assertIn("Shell: unknown", joined)
 
+    def test_write_json_atomic_replaces_target(self):
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(self.utils, "orjson", None):
+            path = os.path.join(tmp, "nested", "data.json")
+            self.utils.write_json_atomic(path, {"a": 1})
+            self.utils.write_json_atomic(path, [1, 2])
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "[1, 2]")
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["data.json"])
+            self.assertEqual(self.utils.read_json(path), [1, 2])
+
+    def test_json_helpers_prefer_orjson(self):
+        fake_orjson = types.SimpleNamespace(
+            OPT_NON_STR_KEYS=1,
+            dumps=mock.Mock(return_value=b'{"k":"v"}'),
+            loads=mock.Mock(return_value={"k": "v"}),
+        )
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(self.utils, "orjson", fake_orjson):
+            path = os.path.join(tmp, "data.json")
+            self.utils.write_json_atomic(path, {"k": "v"})
+            fake_orjson.dumps.assert_called_once_with({"k": "v"}, option=1)
+            self.assertEqual(self.utils.read_json(path), {"k": "v"})
+            fake_orjson.loads.assert_called_once_with(b'{"k":"v"}')
+
+    def test_read_json_maps_large_files_for_orjson(self):
+        seen = []
+        fake_orjson = types.SimpleNamespace(loads=lambda raw: seen.append(type(raw)) or bytes(raw))
+        payload = b'"' + b"x" * self.utils._JSON_MMAP_MIN + b'"'
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(self.utils, "orjson", fake_orjson):
+            path = os.path.join(tmp, "big.json")
+            with open(path, "wb") as f:
+                f.write(payload)
+            self.assertEqual(self.utils.read_json(path), payload)
+        self.assertEqual(seen, [memoryview])
+
+    def test_throttled_json_writer_coalesces_until_forced(self):
+        state = {"n": 0}
+        clock = [100.0]
+        writes = []
+        with mock.patch.object(self.utils, "write_json_atomic", lambda path, data: writes.append((path, data))), \
+                mock.patch.object(self.utils.time, "monotonic", lambda: clock[0]):
+            writer = self.utils.ThrottledJsonWriter("data.json", lambda: dict(state), delay=1.0)
+            self.assertFalse(writer.flush())
+
+            writer.mark_dirty()
+            self.assertTrue(writer.flush())
+            state["n"] = 1
+            writer.mark_dirty()
+            clock[0] += 0.5
+            self.assertFalse(writer.flush())
+            self.assertEqual(writes, [("data.json", {"n": 0})])
+
+            clock[0] += 0.5
+            self.assertTrue(writer.flush())
+            state["n"] = 2
+            writer.mark_dirty()
+            self.assertTrue(writer.flush(force=True))
+            self.assertFalse(writer.dirty)
+        self.assertEqual([data for _, data in writes], [{"n": 0}, {"n": 1}, {"n": 2}])
+
+    def test_throttled_json_writer_stays_dirty_after_oserror(self):
+        writer = self.utils.ThrottledJsonWriter("/unused", lambda: {}, delay=0)
+        writer.mark_dirty()
+        with mock.patch.object(self.utils, "write_json_atomic", side_effect=OSError("disk full")):
+            self.assertFalse(writer.flush(force=True))
+        self.assertTrue(writer.dirty)
+
+    def test_which_cached_memoizes_per_path(self):
+        self.utils.which_cached.cache_clear()
+        with mock.patch.object(self.utils.shutil, "which", return_value="/bin/git") as which, \
+                mock.patch.dict(self.utils.os.environ, {"PATH": "/bin"}):
+            self.assertEqual(self.utils.which_cached("git"), "/bin/git")
+            self.assertEqual(self.utils.which_cached("git"), "/bin/git")
+            self.assertEqual(which.call_count, 1)
+
+            self.utils.os.environ["PATH"] = "/usr/bin"
+            self.utils.which_cached("git")
+            self.assertEqual(which.call_count, 2)
+            which.assert_called_with("git", path="/usr/bin")
+        self.utils.which_cached.cache_clear()
+
+    def test_http_get_imports_http_module_on_first_call(self):
+        http = importlib.import_module("retrotui._http")
+        with mock.patch.object(http, "http_get", return_value=b"feed") as get:
+            self.assertEqual(self.utils.http_get("https://example.test/a", timeout=3), b"feed")
+        get.assert_called_once_with("https://example.test/a", 3)
+
     def test_is_video_file_detects_extensions_case_insensitive(self):
         self.assertTrue(self.utils.is_video_file("demo.MP4"))
         self.assertTrue(self.utils.is_video_file("movie.mkv"))
@@ -58,6 +58,39 @@ class WindowComponentTests(unittest.TestCase):
         self.assertEqual(win.body_rect(), (6, 7, 28, 8))
         self.assertEqual(win.close_button_pos(), (31, 4))
 
+    def test_cached_ops_rebuild_only_when_key_changes(self):
+        win = self.window_mod.Window("Test", 0, 0, 30, 12)
+        build = mock.Mock(side_effect=lambda: [(0, 0, "x", 0)])
+        first = win._cached_ops(("a",), build)
+        self.assertIs(win._cached_ops(("a",), build), first)
+        self.assertEqual(build.call_count, 1)
+        win._cached_ops(("b",), build)
+        self.assertEqual(build.call_count, 2)
+        win.mark_dirty()
+        win._cached_ops(("b",), build)
+        self.assertEqual(build.call_count, 3)
+
+    def test_blit_ops_repaints_pad_only_for_new_ops(self):
+        win = self.window_mod.Window("Test", 0, 0, 30, 12)
+        stdscr = mock.Mock()
+        stdscr.getmaxyx.return_value = (24, 80)
+        self.assertFalse(win._blit_ops(stdscr, 1, 1, 10, 28, [], 0))
+
+        pad = mock.Mock()
+        pad.getmaxyx.return_value = (10, 29)
+        ops = [(0, 0, "hi", 5)]
+        with mock.patch.object(self.curses, "newpad", create=True, return_value=pad) as newpad:
+            win._blit_ops(stdscr, 1, 1, 10, 28, [], 0)  # same sig: no retry
+            newpad.assert_not_called()
+            self.assertTrue(win._blit_ops(stdscr, 2, 1, 10, 28, ops, 7))
+            self.assertTrue(win._blit_ops(stdscr, 2, 1, 10, 28, ops, 7))
+
+        newpad.assert_called_once_with(10, 29)
+        pad.bkgd.assert_called_once_with(' ', 7)
+        pad.addnstr.assert_called_once_with(0, 0, "hi", 28, 5)
+        self.assertEqual(pad.overwrite.call_count, 2)
+        pad.overwrite.assert_called_with(stdscr, 0, 0, 2, 1, 11, 28)
+
     def test_contains_and_hit_regions(self):
         win = self.window_mod.Window("Test", 10, 3, 20, 10)
 
@@ -123,7 +123,7 @@ class WindowLogicTests(unittest.TestCase):
         self.assertEqual(win.cursor_col, 0)
 
     def test_filemanager_rebuild_content_permission_error_sets_message(self):
-        with mock.patch('retrotui.apps.filemanager.os.listdir', side_effect=PermissionError):
+        with mock.patch('retrotui.apps.filemanager.os.scandir', side_effect=PermissionError):
             win = self.filemanager_mod.FileManagerWindow(0, 0, 40, 12, start_path='.')
 
         self.assertEqual(win.error_message, 'Permission denied')
@@ -281,30 +281,28 @@ class WindowLogicTests(unittest.TestCase):
         self.assertLessEqual(win.view_top, max_top)
 
     def test_filemanager_rebuild_content_oserror_sets_message(self):
-        with mock.patch('retrotui.apps.filemanager.os.listdir', side_effect=OSError('io failure')):
+        with mock.patch('retrotui.apps.filemanager.os.scandir', side_effect=OSError('io failure')):
             win = self.filemanager_mod.FileManagerWindow(0, 0, 40, 12, start_path='.')
 
         self.assertEqual(win.error_message, 'io failure')
         self.assertTrue(any('io failure' in row for row in win.content))
 
     def test_filemanager_rebuild_skips_entries_with_stat_errors(self):
-        def fake_is_dir(path):
-            return path.endswith('adir')
-
-        def fake_is_file(path):
-            return path.endswith('.txt')
-
-        def fake_get_size(path):
-            if path.endswith('bad.txt'):
-                raise OSError('no stat')
-            return 7
-
-        with (
-            mock.patch('retrotui.apps.filemanager.os.listdir', return_value=['good.txt', 'bad.txt', 'adir']),
-            mock.patch('retrotui.apps.filemanager.os.path.isdir', side_effect=fake_is_dir),
-            mock.patch('retrotui.apps.filemanager.os.path.isfile', side_effect=fake_is_file),
-            mock.patch('retrotui.apps.filemanager.os.path.getsize', side_effect=fake_get_size),
-        ):
+        def fake_entry(name):
+            entry = mock.Mock()
+            entry.name = name
+            entry.path = f'./{name}'
+            entry.is_dir.return_value = name == 'adir'
+            entry.is_file.return_value = name.endswith('.txt')
+            if name == 'bad.txt':
+                entry.stat.side_effect = OSError('no stat')
+            else:
+                entry.stat.return_value = types.SimpleNamespace(st_size=7)
+            return entry
+
+        scan = mock.MagicMock()
+        scan.__enter__.return_value = iter([fake_entry(n) for n in ('good.txt', 'bad.txt', 'adir')])
+        with mock.patch('retrotui.apps.filemanager.os.scandir', return_value=scan):
             win = self.filemanager_mod.FileManagerWindow(0, 0, 40, 12, start_path='.')
 
         names = [entry.name for entry in win.entries]